@@ -62,6 +62,8 @@ def get_type_for_param(param: dict, swagger: dict | None = None) -> str:
 
     if _in == "path":
         return str.__name__
+    elif _in == "formData" and (param.get("type") == "file" or param.get("format") == "binary"):
+        return bytes.__name__
     elif _in == "query":
         _type = get_path(
             param,
@@ -186,9 +188,7 @@ def param_to_function_argument(param: dict, swagger: dict | None = None) -> str:
 
 def create_headers_block(required_header_params_without_special, optional_header_params_without_special) -> str:
     lines = [
-        "headers = self.auth.get_headers()",
-        "if data_partition_id:",
-        f"{INDENT}headers['data-partition-id'] = data_partition_id",
+        "headers = self._headers(data_partition_id)",
         # "if tenant:",
         # f"{INDENT}headers['tenant'] = tenant"
     ]
@@ -218,14 +218,14 @@ def create_headers_block(required_header_params_without_special, optional_header
 
 
 def create_request_block(
-        path: str, method: str, has_params: bool, name: str, has_body: bool
+        path: str, method: str, has_params: bool, name: str, has_body: bool, has_files: bool = False
 ) -> str:
     requests_lines = [
-        "url = urljoin(self.base_url, self.service_path, %s)" % path,
-        "response = requests.%s(url, headers=headers)" % method,
+        "url = self._url(%s)" % path,
+        'response = self._request("%s", url, headers=headers)' % method,
         "if not response.ok:",
         "%sraise %sAPIError(response.text, response.status_code)" % (INDENT, name),
-        "return response.json()"
+        "return self._parse_response(response)"
     ]
     if has_params:
         requests_lines[1] = requests_lines[1][:-1] + ", params=params)"
@@ -233,6 +233,9 @@ def create_request_block(
     if has_body:
         requests_lines[1] = requests_lines[1][:-1] + ", json=request_data)"
 
+    if has_files:
+        requests_lines[1] = requests_lines[1][:-1] + ", files=files)"
+
     return "\n".join(requests_lines)
 
 
@@ -414,6 +417,8 @@ def get_body_params(swagger, params: list[dict], request_body: dict | None = Non
             required.append(p)
         elif p["in"] == "body":
             not_required.append(p)
+        elif p["in"] == "formData":
+            (required if p.get("required", False) else not_required).append(p)
 
     schema_path = get_path(
         request_body,
@@ -425,7 +430,30 @@ def get_body_params(swagger, params: list[dict], request_body: dict | None = Non
         )
     )
 
+    form_schema = get_path(request_body, "content.multipart/form-data.schema", None)
+    if schema_path is None and form_schema is not None:
+        # OpenAPI 3 form fields, sent like Swagger 2.0 formData params
+        if "$ref" in form_schema:
+            form_schema = get_path(swagger, form_schema["$ref"][2:], separator="/")
+        for k, v in form_schema.get("properties", {}).items():
+            is_required = k in form_schema.get("required", [])
+            (required if is_required else not_required).append(
+                dict(**v, name=k, required=is_required, **{"in": "formData"})
+            )
+        return required, not_required
+
     if schema_path is None:
+        inline_schema = get_path(request_body, "content.application/json.schema", None)
+        if inline_schema is not None and inline_schema.get("type") == "array":
+            # OpenAPI 3 array body (e.g. a list of record ids) is the whole request body, like Swagger 2.0 body params
+            body_param = {
+                "name": request_body.get("x-codegen-request-body-name", "body"),
+                "in": "body",
+                "required": request_body.get("required", False),
+                "description": inline_schema.get("description", request_body.get("description", "")),
+                "schema": inline_schema,
+            }
+            (required if body_param["required"] else not_required).append(body_param)
         return required, not_required
 
     schema = get_path(swagger, schema_path[2:], separator="/")
@@ -467,12 +495,51 @@ def create_validation_block(path: str, method: str, swagger: dict, name: str) ->
     return ""
 
 
+def create_files_block(required: list[dict], not_required: list[dict]) -> str:
+    lines = []
+
+    if not required and not not_required:
+        return ""
+
+    if not required:
+        lines.append("files = {}")
+    else:
+        lines.append(
+            "files = {"
+        )
+        for p in required:
+            converted_name = convert_to_snake_case(p['name'])
+            lines.append(
+                "%s'%s': %s," % (INDENT, p['name'], converted_name)
+            )
+
+        lines.append("}")
+
+    for p in not_required:
+        converted_name = convert_to_snake_case(p['name'])
+
+        lines.append(
+            "if %s is not None:" % converted_name
+        )
+
+        lines.append(
+            "%sfiles['%s'] = %s" % (INDENT, p['name'], converted_name)
+        )
+
+    return "\n".join(lines)
+
+
 def create_body_block(required: list[dict], not_required: list[dict]) -> str:
     lines = []
 
     if not required and not not_required:
         return ""
 
+    body_params = [p for p in required + not_required if p.get("in") == "body"]
+    if body_params:
+        # Swagger 2.0 body parameter is the whole request body
+        return "request_data = %s" % convert_to_snake_case(body_params[0]['name'])
+
     if not required:
         lines.append("request_data = {}")
     else:
@@ -571,7 +638,7 @@ def generate_doc_string(name, path_params, body_required, body_not_required, swa
 
 def create_method_sig(swagger: dict, name: str, params: list[str], body_required: list[str], body_not_required: list[str], method: str, path: str) -> str:
     path_params = [
-        p for p in params if p['name'] not in SPECIAL_HEADERS and p["in"] != "body"
+        p for p in params if p['name'] not in SPECIAL_HEADERS and p["in"] not in ("body", "formData")
     ]
 
     elements = [name, ]
@@ -626,14 +693,22 @@ def create_method_body(path: str, method: str, params: dict,  body_required: lis
     optional_header_params_without_special = [p for p in params if p['in'] ==
                                               'header' and p['name'] not in SPECIAL_HEADERS and not p.get('required', False)]
 
+    # formData params are sent as multipart/form-data files, the others as the JSON body
+    files_required = [p for p in body_required if p.get("in") == "formData"]
+    files_not_required = [p for p in body_not_required if p.get("in") == "formData"]
+    body_required = [p for p in body_required if p.get("in") != "formData"]
+    body_not_required = [p for p in body_not_required if p.get("in") != "formData"]
+
     has_body = body_required or body_not_required
+    has_files = files_required or files_not_required
     has_params = required_query_params or optional_query_params
     lines = filter(lambda x: x != "", [
         create_headers_block(required_header_params_without_special, optional_header_params_without_special),
         create_params_block(required_query_params, optional_query_params),
         create_body_block(body_required, body_not_required),
+        create_files_block(files_required, files_not_required),
         create_validation_block(path, method, swagger, name),
-        create_request_block(path_template, method, has_params, name, has_body)
+        create_request_block(path_template, method, has_params, name, has_body, has_files)
     ])
 
     return "\n\n".join(lines)
@@ -669,14 +744,12 @@ def create_imports(swagger: SwaggerDoc, name: str, version: str, num_of_versions
 
     lines = [
         "from __future__ import annotations\n",
-        "import requests\n",
-        "from osdu_client.utils import urljoin",
         "from osdu_client.services.base import OSDUAPIClient",
         "from osdu_client.exceptions import OSDUAPIError",
     ]
 
     if version != "common" and num_of_versions > 1:
-        lines.pop(3)
+        lines.pop(1)
         lines.append(
             f"from osdu_client.services.{name.lower()}.common import {name}CommonClient",
         )
@@ -19,7 +19,8 @@ TYPE_DEFAULTS = {
     'list[dict]': '[{}]',
     'list[dict] | None': '[{}]',
     'dict | None': '{}',
-    'list[str] | None': '["text"]'
+    'list[str] | None': '["text"]',
+    'bytes': 'b"text"'
 }
 
 
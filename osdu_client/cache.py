@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Any, Callable, Hashable, Iterable
+
+DEFAULT_MAX_ENTRIES = 1024
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Thread-safe cache of values kept for ttl seconds. Above max_entries the least recently used entry is evicted.
+    Concurrent get_or_load calls for the same missing key share a single load.
+    """
+
+    def __init__(self, ttl: float, max_entries: int | None = DEFAULT_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._loading = {}
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._get(key, time.monotonic())
+        return default if value is _MISSING else value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+
+    def get_or_load(self, key: Hashable, loader: Callable[[], Any], ttl: float | None = None) -> Any:
+        """Returns the cached value or stores and returns the result of loader. Errors of loader are not cached."""
+        with self._lock:
+            value = self._get(key, time.monotonic())
+            if value is not _MISSING:
+                return value
+            future = self._loading.get(key)
+            owner = future is None
+            if owner:
+                future = self._loading[key] = Future()
+        if not owner:
+            return future.result()
+
+        try:
+            value = loader()
+        except BaseException as e:
+            with self._lock:
+                del self._loading[key]
+            future.set_exception(e)
+            raise
+        self.set(key, value, ttl)
+        with self._lock:
+            del self._loading[key]
+        future.set_result(value)
+        return value
+
+    def get_or_load_many(
+        self, keys: Iterable[Hashable], loader: Callable[[list], dict], ttl: float | None = None
+    ) -> dict:
+        """Returns key -> value for keys. Missing keys are loaded with one loader call, which gets the list of missing
+        keys and returns a value for each of them, a missing one fails the call with KeyError. Keys loaded by a
+        concurrent call are waited for, not loaded again. Errors of loader are not cached.
+        """
+        keys = list(dict.fromkeys(keys))
+        values, waiting, owned = {}, {}, {}
+        with self._lock:
+            now = time.monotonic()
+            for key in keys:
+                value = self._get(key, now)
+                if value is not _MISSING:
+                    values[key] = value
+                elif key in self._loading:
+                    waiting[key] = self._loading[key]
+                else:
+                    owned[key] = self._loading[key] = Future()
+
+        if owned:
+            try:
+                loaded = loader(list(owned))
+                missing = [key for key in owned if key not in loaded]
+                if missing:
+                    raise KeyError(f"Loader returned no value for {missing!r}.")
+            except BaseException as e:
+                with self._lock:
+                    for key in owned:
+                        del self._loading[key]
+                for future in owned.values():
+                    future.set_exception(e)
+                raise
+            for key in owned:
+                self.set(key, loaded[key], ttl)
+            with self._lock:
+                for key in owned:
+                    del self._loading[key]
+            for key, future in owned.items():
+                future.set_result(loaded[key])
+                values[key] = loaded[key]
+
+        for key, future in waiting.items():
+            values[key] = future.result()
+        return {key: values[key] for key in keys}
+
+    def invalidate(self, key: Hashable):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def _get(self, key: Hashable, now: float) -> Any:
+        entry = self._entries.get(key)
+        if entry is None:
+            return _MISSING
+        if entry[1] <= now:
+            del self._entries[key]
+            return _MISSING
+        self._entries.move_to_end(key)
+        return entry[0]
@@ -0,0 +1,116 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+
+from osdu_client.exceptions import OSDUCircuitOpenError
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Tracks outcomes of the latest calls to one service and fails fast while the service is unhealthy.
+
+    The breaker opens when, within the last window_size calls (and at least minimum_calls), the share of failed calls
+    reaches failure_rate_threshold or the share of calls slower than slow_call_duration reaches
+    slow_call_rate_threshold. After open_duration seconds it lets half_open_calls probe calls through, closing again
+    when all of them succeed and reopening on the first failure.
+    """
+
+    def __init__(
+        self,
+        name: str = "",
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: float | None = None,
+        slow_call_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_duration: float = 30.0,
+        half_open_calls: int = 1,
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        self.half_open_calls = half_open_calls
+
+        self.state = CLOSED
+        self._outcomes = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probes_started = 0
+        self._probes_succeeded = 0
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        """Raises OSDUCircuitOpenError if the call is not allowed."""
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self._opened_at < self.open_duration:
+                    raise OSDUCircuitOpenError(f"Circuit for {self.name} is open.")
+                self.state = HALF_OPEN
+                self._probes_started = 0
+                self._probes_succeeded = 0
+            if self.state == HALF_OPEN:
+                if self._probes_started >= self.half_open_calls:
+                    raise OSDUCircuitOpenError(f"Circuit for {self.name} is half-open, waiting for probe calls.")
+                self._probes_started += 1
+
+    def record(self, success: bool, duration: float = 0.0):
+        slow = self.slow_call_duration is not None and duration >= self.slow_call_duration
+        with self._lock:
+            if self.state == HALF_OPEN:
+                if success and not slow:
+                    self._probes_succeeded += 1
+                    if self._probes_succeeded >= self.half_open_calls:
+                        self.state = CLOSED
+                        self._outcomes.clear()
+                else:
+                    self._open()
+                return
+
+            self._outcomes.append((success, slow))
+            if self.state == CLOSED and self._should_open():
+                self._open()
+
+    def _should_open(self) -> bool:
+        calls = len(self._outcomes)
+        if calls < self.minimum_calls:
+            return False
+        failures = sum(1 for success, _ in self._outcomes if not success)
+        slow_calls = sum(1 for _, slow in self._outcomes if slow)
+        return (
+            failures / calls >= self.failure_rate_threshold
+            or (self.slow_call_duration is not None and slow_calls / calls >= self.slow_call_rate_threshold)
+        )
+
+    def _open(self):
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._outcomes.clear()
+
+
+class CircuitBreakers:
+    """Registry creating one CircuitBreaker per service base path. Share it between clients of one deployment.
+        Args:
+            **breaker_kwargs: CircuitBreaker settings applied to every breaker.
+    """
+
+    def __init__(self, **breaker_kwargs):
+        self.breaker_kwargs = breaker_kwargs
+        self._breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> CircuitBreaker:
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            with self._lock:
+                breaker = self._breakers.setdefault(key, CircuitBreaker(name=key, **self.breaker_kwargs))
+        return breaker
+
+    def states(self) -> dict[str, str]:
+        return {key: breaker.state for key, breaker in self._breakers.items()}
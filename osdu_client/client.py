@@ -2,9 +2,17 @@ from __future__ import annotations
 
 from importlib import import_module
 
+import requests
+
 from osdu_client.auth import AuthBackendInterface
+from osdu_client.circuit_breaker import CircuitBreakers
+from osdu_client.codecs import JSONCodec
+from osdu_client.compression import DEFAULT_COMPRESSION_THRESHOLD
+from osdu_client.deadline import Timeout
 from osdu_client.exceptions import OSDUClientError
+from osdu_client.hedging import HedgingPolicy
 from osdu_client.services.base import OSDUAPIClient
+from osdu_client.transport import DEFAULT_TIMEOUT, warm_up
 
 DMS_NAMES = {
     "sdms": "SDMS",
@@ -38,13 +46,38 @@ def get_service_client(name: str, version: str | None = None) -> type[OSDUAPICli
 
 class OSDUAPI:
     @staticmethod
-    def client(service_name, auth_backend: AuthBackendInterface, version: str | None = None, validation: bool = True) -> OSDUAPIClient:
+    def client(
+        service_name,
+        auth_backend: AuthBackendInterface,
+        version: str | None = None,
+        validation: bool = True,
+        json_codec: JSONCodec | str | None = None,
+        raw_response: bool = False,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        session: requests.Session | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        circuit_breakers: CircuitBreakers | None = None,
+        hedging: HedgingPolicy | None = None,
+    ) -> OSDUAPIClient:
         """Creates client instance for given service.
             Args:
                 service_name (str): The OSDU API service name, to check available services call list_available_services method.
                 auth_backend (AuthBackendInterface): class object that implements AuthBackendInterface and stores all auth headers.
                 version (str): Version of the service API client. If None method will produce the latest client.
                 validation (bool): Disable to turn-off request body validation done before client makes a request. By default True
+                json_codec (JSONCodec | str): JSON backend used to encode request bodies and decode responses:
+                    "json", "orjson", "msgspec" or "auto". By default stdlib json module.
+                raw_response (bool): Enable to return raw response bytes instead of decoded JSON. By default False
+                compression (str): "gzip" or "deflate" to compress request bodies. By default bodies are not compressed.
+                compression_threshold (int): Minimal encoded body size in bytes that gets compressed.
+                session (requests.Session): Session to share connection pools between clients,
+                    see osdu_client.transport.create_session. If None client creates its own session.
+                timeout (float | tuple[float, float]): (connect, read) timeout in seconds of every request.
+                    By default (10, 300). Use osdu_client.deadline.deadline to limit the total time of calls.
+                circuit_breakers (CircuitBreakers): registry of per service circuit breakers, share it between clients.
+                    By default calls are not guarded by circuit breakers.
+                hedging (HedgingPolicy): enables hedged requests for idempotent reads. By default disabled.
             Returns:
                 Instance of OSDUAPIClient for given service_name
             Raises:
@@ -55,8 +88,30 @@ class OSDUAPI:
         return client_class(
             auth_backend=auth_backend,
             validation=validation,
+            json_codec=json_codec,
+            raw_response=raw_response,
+            compression=compression,
+            compression_threshold=compression_threshold,
+            session=session,
+            timeout=timeout,
+            circuit_breakers=circuit_breakers,
+            hedging=hedging,
         )
 
+    @staticmethod
+    def warm_up(*clients: OSDUAPIClient, connections: int = 1):
+        """Opens pooled connections to the hosts used by given clients, so first calls skip DNS, TCP and TLS setup.
+            Args:
+                clients (OSDUAPIClient): clients to warm up. Clients sharing a session share its connections.
+                connections (int): number of connections opened per host.
+        """
+        urls_by_session = {}
+        for client in clients:
+            session_urls = urls_by_session.setdefault(id(client.session), (client.session, []))
+            session_urls[1].append(client.base_url)
+        for session, urls in urls_by_session.values():
+            warm_up(session, urls, connections=connections)
+
     @classmethod
     def print_available_services(cls):
         """
@@ -0,0 +1,124 @@
+from __future__ import annotations
+
+import json
+from abc import ABCMeta, abstractmethod
+from importlib import import_module
+from typing import Any
+
+from pydantic import BaseModel
+
+from osdu_client.exceptions import OSDUClientError
+
+
+class JSONCodec(metaclass=ABCMeta):
+    name: str = ""
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        pass
+
+
+class StdlibJSONCodec(JSONCodec):
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+class OrjsonCodec(JSONCodec):
+    name = "orjson"
+
+    def __init__(self):
+        self._orjson = import_module("orjson")
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+
+class MsgspecCodec(JSONCodec):
+    name = "msgspec"
+
+    def __init__(self):
+        msgspec_json = import_module("msgspec.json")
+        self._encoder = msgspec_json.Encoder()
+        self._decoder = msgspec_json.Decoder()
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self._decoder.decode(data)
+
+
+JSON_CODECS = {
+    "json": StdlibJSONCodec,
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+}
+
+AUTO_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+def get_json_codec(codec: JSONCodec | str | None = None) -> JSONCodec:
+    """Returns JSON codec instance used for request encoding and response decoding.
+        Args:
+            codec (JSONCodec | str): codec instance or one of the names: "json", "orjson", "msgspec" or "auto".
+                "auto" picks the fastest installed backend. If None the stdlib json module is used.
+        Returns:
+            Instance of JSONCodec
+        Raises:
+            OSDUClientError: if codec name is unknown or its backend is not installed
+    """
+    if isinstance(codec, JSONCodec):
+        return codec
+    if codec is None:
+        return StdlibJSONCodec()
+    if codec == "auto":
+        for name in AUTO_PREFERENCE:
+            try:
+                return JSON_CODECS[name]()
+            except ImportError:
+                continue
+    if codec not in JSON_CODECS:
+        raise OSDUClientError(f"JSON codec {codec} does not exist. Available: {list(JSON_CODECS)}")
+    try:
+        return JSON_CODECS[codec]()
+    except ImportError as e:
+        raise OSDUClientError(f"JSON codec {codec} requires package {codec} to be installed.") from e
+
+
+_typed_decoders = {}
+
+
+def decode_typed(data: bytes, response_type: type) -> Any:
+    """Decodes JSON bytes straight into an instance of response_type, without building an intermediate dict tree.
+        Args:
+            data (bytes): JSON document.
+            response_type (type): pydantic model, or any type supported by msgspec
+                (msgspec.Struct, dataclass, TypedDict, list[...]). msgspec.Struct types with slots are the most compact.
+        Returns:
+            Instance of response_type
+        Raises:
+            OSDUClientError: if response_type requires msgspec and it is not installed
+    """
+    if isinstance(response_type, type) and issubclass(response_type, BaseModel):
+        return response_type.model_validate_json(data)
+
+    decoder = _typed_decoders.get(response_type)
+    if decoder is None:
+        try:
+            msgspec_json = import_module("msgspec.json")
+        except ImportError as e:
+            raise OSDUClientError(f"Decoding into {response_type} requires package msgspec to be installed.") from e
+        decoder = _typed_decoders.setdefault(response_type, msgspec_json.Decoder(response_type))
+    return decoder.decode(data)
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import gzip
+import zlib
+
+from osdu_client.exceptions import OSDUClientError
+
+COMPRESSION_LEVEL = 6
+DEFAULT_COMPRESSION_THRESHOLD = 16 * 1024
+ACCEPT_ENCODING = "gzip, deflate"
+
+
+def _gzip(data: bytes) -> bytes:
+    return gzip.compress(data, compresslevel=COMPRESSION_LEVEL, mtime=0)
+
+
+def _deflate(data: bytes) -> bytes:
+    return zlib.compress(data, COMPRESSION_LEVEL)
+
+
+COMPRESSORS = {
+    "gzip": _gzip,
+    "deflate": _deflate,
+}
+
+
+def validate_compression(compression: str | None) -> str | None:
+    if compression is not None and compression not in COMPRESSORS:
+        raise OSDUClientError(f"Compression {compression} is not supported. Available: {list(COMPRESSORS)}")
+    return compression
+
+
+def compress_body(data: bytes, compression: str) -> bytes:
+    return COMPRESSORS[compression](data)
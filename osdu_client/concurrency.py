@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Callable, Iterable, Iterator, TypeVar
+
+from osdu_client.deadline import run_in_context
+
+DEFAULT_MAX_WORKERS = 8
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS) -> list[R]:
+    """Calls func for every item using at most max_workers threads and returns results in the order of items.
+    The active deadline is propagated to the workers. The first exception raised by func is re-raised.
+    """
+    items = list(items)
+    if len(items) <= 1 or max_workers <= 1:
+        return [func(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(run_in_context(func), items))
+
+
+def iter_concurrently(
+    func: Callable[[T], R], items: Iterable[T], max_workers: int = DEFAULT_MAX_WORKERS
+) -> Iterator[tuple[T, R | None, BaseException | None]]:
+    """Calls func for every item using at most max_workers threads.
+    Items are consumed lazily, so items may be a long stream. Yields (item, result, error) tuples in completion
+    order, items finishing together in submission order. An exception raised for one item does not stop the others.
+    The active deadline is propagated.
+    """
+    items = iter(items)
+    wrapped = run_in_context(func)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(wrapped, item): item for item in islice(items, max_workers * 2)}
+        try:
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                # Futures finished together are yielded in submission order.
+                for future in [future for future in pending if future in done]:
+                    item = pending.pop(future)
+                    error = future.exception()
+                    yield item, None if error else future.result(), error
+                for item in islice(items, len(done)):
+                    pending[executor.submit(wrapped, item)] = item
+        finally:
+            for future in pending:
+                future.cancel()
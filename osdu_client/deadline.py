@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar, copy_context
+from typing import Any, Callable, Optional, Tuple, Union
+
+from osdu_client.exceptions import OSDUCancelledError, OSDUTimeoutError
+
+Timeout = Union[float, Tuple[Optional[float], Optional[float]], None]
+
+_current_deadline: ContextVar[Deadline | None] = ContextVar("osdu_deadline", default=None)
+
+
+class Deadline:
+    """Time budget shared by every request made while it is active.
+
+    Use as a context manager. All client calls made in the block, including calls made by helpers that fan out
+    through run_in_context, get their timeouts clipped to the remaining time and fail with OSDUTimeoutError once it
+    runs out. cancel() may be called from any thread or task, calls check it before each request.
+    """
+
+    def __init__(self, seconds: float | None = None):
+        self.expires_at = time.monotonic() + seconds if seconds is not None else None
+        self._cancelled = threading.Event()
+        self._tokens = []
+
+    def remaining(self) -> float | None:
+        if self.expires_at is None:
+            return None
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    @property
+    def expired(self) -> bool:
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def cancel(self):
+        self._cancelled.set()
+
+    def check(self):
+        if self.cancelled:
+            raise OSDUCancelledError("Operation was cancelled.")
+        if self.expired:
+            raise OSDUTimeoutError("Deadline exceeded.")
+
+    def clip(self, timeout: Timeout) -> Timeout:
+        """Returns requests timeout limited to the remaining time."""
+        remaining = self.remaining()
+        if remaining is None:
+            return timeout
+        if remaining <= 0:
+            raise OSDUTimeoutError("Deadline exceeded.")
+        if isinstance(timeout, tuple):
+            return tuple(remaining if t is None else min(t, remaining) for t in timeout)
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+    def sleep(self, seconds: float):
+        """Sleeps for seconds or until the deadline is cancelled or exceeded, whichever comes first."""
+        remaining = self.remaining()
+        if remaining is not None:
+            seconds = min(seconds, remaining)
+        self._cancelled.wait(seconds)
+        self.check()
+
+    def __enter__(self) -> Deadline:
+        self._tokens.append(_current_deadline.set(self))
+        return self
+
+    def __exit__(self, *exc):
+        _current_deadline.reset(self._tokens.pop())
+
+
+def deadline(seconds: float | None = None) -> Deadline:
+    """Creates a Deadline expiring after given seconds. None creates a deadline which can only be cancelled."""
+    return Deadline(seconds)
+
+
+def current_deadline() -> Deadline | None:
+    return _current_deadline.get()
+
+
+def sleep(seconds: float):
+    """Sleeps for seconds, waking up early with an error if the active deadline is exceeded or cancelled."""
+    active = _current_deadline.get()
+    if active is not None:
+        active.sleep(seconds)
+    else:
+        time.sleep(seconds)
+
+
+def run_in_context(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Binds func to the current context, so it keeps the active deadline when run in a worker thread."""
+    context = copy_context()
+
+    def wrapper(*args, **kwargs):
+        return context.copy().run(func, *args, **kwargs)
+
+    return wrapper
@@ -8,4 +8,32 @@ class OSDUAPIError(OSDUClientError):
 
 
 class OSDUValidation(OSDUClientError):
-    pass
\ No newline at end of file
+    pass
+
+
+class OSDUTimeoutError(OSDUClientError):
+    pass
+
+
+class OSDUCancelledError(OSDUClientError):
+    pass
+
+
+class OSDUCircuitOpenError(OSDUClientError):
+    pass
+
+
+class OSDUFanOutError(OSDUClientError):
+    """Raised for failed partitions of a fan-out call. Second argument maps partition id to its exception."""
+
+    @property
+    def errors(self) -> dict:
+        return self.args[1]
+
+
+class OSDUReplayFailedError(OSDUClientError):
+    """Raised for a replay which ended in the FAILED state. Second argument is the last replay status."""
+
+    @property
+    def status(self) -> dict:
+        return self.args[1]
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently
+from osdu_client.exceptions import OSDUFanOutError
+from osdu_client.services.partition.client import PartitionClient
+
+
+@dataclass
+class PartitionResult:
+    partition: str
+    result: Any = None
+    error: BaseException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class FanOutResult(dict):
+    """Maps partition id to its PartitionResult, in the order partitions were given."""
+
+    @property
+    def results(self) -> dict[str, Any]:
+        return {partition: outcome.result for partition, outcome in self.items() if outcome.ok}
+
+    @property
+    def errors(self) -> dict[str, BaseException]:
+        return {partition: outcome.error for partition, outcome in self.items() if not outcome.ok}
+
+    def raise_for_errors(self):
+        """Raises OSDUFanOutError listing failed partitions, if any."""
+        errors = self.errors
+        if errors:
+            raise OSDUFanOutError(f"Call failed for partitions: {', '.join(errors)}.", errors)
+
+    def merged(self, key: str | None = None) -> list:
+        """Concatenates successful results, or the lists under key of dict results, in partition order."""
+        merged = []
+        for result in self.results.values():
+            items = result.get(key) if key is not None else result
+            merged += items or []
+        return merged
+
+
+def fan_out(
+    call: Callable[[str], Any], partitions: Iterable[str], max_workers: int = DEFAULT_MAX_WORKERS
+) -> FanOutResult:
+    """Calls call(partition) for every partition using at most max_workers threads.
+        An exception raised for one partition is stored in its PartitionResult and does not stop the others.
+        Args:
+            call (Callable): function taking a data partition id.
+            partitions (Iterable[str]): data partition ids.
+            max_workers (int): maximum number of concurrent calls.
+        Returns:
+            FanOutResult
+    """
+    partitions = list(dict.fromkeys(partitions))
+    outcomes = {}
+    for partition, result, error in iter_concurrently(call, partitions, max_workers=max_workers):
+        outcomes[partition] = PartitionResult(partition, result, error)
+    return FanOutResult((partition, outcomes[partition]) for partition in partitions)
+
+
+class PartitionFanOut:
+    """Runs the same client call over many data partitions concurrently.
+
+        Partitions are discovered once with PartitionClient.list_partitions unless given explicitly.
+    """
+
+    def __init__(
+        self,
+        partition_client: PartitionClient | None = None,
+        partitions: Iterable[str] | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        if partition_client is None and partitions is None:
+            raise ValueError("Either partition_client or partitions is required.")
+        self.partition_client = partition_client
+        self.max_workers = max_workers
+        self._partitions = list(partitions) if partitions is not None else None
+        self._lock = threading.Lock()
+
+    @property
+    def partitions(self) -> list[str]:
+        if self._partitions is None:
+            with self._lock:
+                if self._partitions is None:
+                    self._partitions = list(self.partition_client.list_partitions())
+        return self._partitions
+
+    def refresh(self):
+        """Forgets discovered partitions, they are listed again on next use."""
+        if self.partition_client is not None:
+            with self._lock:
+                self._partitions = None
+
+    def run(self, method: Callable, *args, partitions: Iterable[str] | None = None, **kwargs) -> FanOutResult:
+        """Calls method(*args, data_partition_id=partition, **kwargs) for every partition.
+            Args:
+                method (Callable): bound client method accepting data_partition_id, e.g. search_client.query.
+                partitions (Iterable[str]): subset of partitions, all partitions by default.
+            Returns:
+                FanOutResult
+        """
+        return fan_out(
+            lambda partition: method(*args, data_partition_id=partition, **kwargs),
+            self.partitions if partitions is None else partitions,
+            max_workers=self.max_workers,
+        )
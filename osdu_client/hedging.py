@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import math
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable
+
+import requests
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+# POST endpoints which only read data and are safe to send twice.
+IDEMPOTENT_POST_PATHS = ("/api/search/v2/query",)
+
+
+class HedgingPolicy:
+    """Sends a second attempt of an idempotent read when the first one is slower than the usual latency.
+
+    The hedge is sent after a fixed delay or, when delay is None, after the given percentile of recently observed
+    latencies. The first response below 500 to arrive wins, the other one is closed as soon as it completes. When
+    both attempts fail, the server error response is returned, or the first exception raised. Each eligible call adds
+    budget_ratio to a token bucket and each hedge takes one token, so hedges never exceed that share of calls.
+    Share one policy between clients to share its budget, and close it (or use it as a context manager) when done.
+    """
+
+    def __init__(
+        self,
+        delay: float | None = None,
+        percentile: float = 95.0,
+        min_delay: float = 0.05,
+        budget_ratio: float = 0.1,
+        max_tokens: float = 10.0,
+        window_size: int = 200,
+        min_samples: int = 20,
+        idempotent_post_paths: tuple[str, ...] = IDEMPOTENT_POST_PATHS,
+        max_workers: int = 32,
+    ):
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.budget_ratio = budget_ratio
+        self.max_tokens = max_tokens
+        self.min_samples = min_samples
+        self.idempotent_post_paths = idempotent_post_paths
+        self.hedges_sent = 0
+
+        self._latencies = deque(maxlen=window_size)
+        self._tokens = 0.0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="osdu-hedge")
+
+    def applies(self, method: str, url: str) -> bool:
+        method = method.upper()
+        if method in IDEMPOTENT_METHODS:
+            return True
+        return method == "POST" and url.rstrip("/").endswith(self.idempotent_post_paths)
+
+    def hedge_delay(self) -> float | None:
+        """Returns seconds to wait before hedging, None while there are too few latency samples."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        # Nearest-rank percentile.
+        index = max(math.ceil(len(latencies) * self.percentile / 100) - 1, 0)
+        return max(latencies[index], self.min_delay)
+
+    def record_latency(self, duration: float):
+        with self._lock:
+            self._latencies.append(duration)
+
+    def _acquire_hedge(self) -> bool:
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self.hedges_sent += 1
+            return True
+
+    def run(self, send: Callable[[], requests.Response]) -> requests.Response:
+        with self._lock:
+            self._tokens = min(self._tokens + self.budget_ratio, self.max_tokens)
+
+        started = time.monotonic()
+        primary = self._executor.submit(send)
+        delay = self.hedge_delay()
+        if delay is None or wait([primary], timeout=delay).done or not self._acquire_hedge():
+            response = primary.result()
+            self.record_latency(time.monotonic() - started)
+            return response
+
+        pending = {primary, self._executor.submit(send)}
+        failed = []
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            succeeded = [future for future in done if _is_success(future)]
+            if succeeded:
+                self.record_latency(time.monotonic() - started)
+                for loser in succeeded[1:] + failed + list(pending):
+                    loser.add_done_callback(_close_response)
+                return succeeded[0].result()
+            failed += done
+        # Both attempts failed, a server error response is more informative than an exception.
+        failed.sort(key=lambda future: future.exception() is not None)
+        for loser in failed[1:]:
+            _close_response(loser)
+        return failed[0].result()
+
+    def close(self):
+        """Stops the threads sending attempts, attempts in flight are completed."""
+        self._executor.shutdown(wait=False)
+
+    def __enter__(self) -> HedgingPolicy:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _is_success(future) -> bool:
+    return future.exception() is None and future.result().status_code < 500
+
+
+def _close_response(future):
+    if future.exception() is None:
+        future.result().close()
@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import threading
+import time
+
+from osdu_client.deadline import sleep
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing rate calls per second on average and bursts of up to burst calls.
+    acquire blocks until a call is allowed, waiting at most until the active deadline.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1.0)
+        self._tokens = self.burst
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self._tokens + (now - self._updated_at) * self.rate, self.burst)
+                self._updated_at = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+
+            sleep(wait)
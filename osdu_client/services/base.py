@@ -1,12 +1,158 @@
 from __future__ import annotations
 
+import time
 from abc import ABCMeta
+from copy import copy
+from types import MappingProxyType
+from typing import Any
+
+import requests
 
 from osdu_client.auth import AuthBackendInterface
+from osdu_client.circuit_breaker import CircuitBreakers
+from osdu_client.codecs import JSONCodec, decode_typed, get_json_codec
+from osdu_client.compression import ACCEPT_ENCODING, DEFAULT_COMPRESSION_THRESHOLD, compress_body, validate_compression
+from osdu_client.deadline import Timeout, current_deadline
+from osdu_client.exceptions import OSDUTimeoutError
+from osdu_client.hedging import HedgingPolicy
+from osdu_client.transport import DEFAULT_TIMEOUT, create_session
+from osdu_client.utils import urljoin
 
 
 class OSDUAPIClient(metaclass=ABCMeta):
-    def __init__(self, auth_backend: AuthBackendInterface, base_url: str | None = None, validation: bool = True):
+    service_path: str = ""
+    response_type: type | None = None
+
+    def __init__(
+        self,
+        auth_backend: AuthBackendInterface,
+        base_url: str | None = None,
+        validation: bool = True,
+        json_codec: JSONCodec | str | None = None,
+        raw_response: bool = False,
+        compression: str | None = None,
+        compression_threshold: int = DEFAULT_COMPRESSION_THRESHOLD,
+        accept_encoding: str = ACCEPT_ENCODING,
+        session: requests.Session | None = None,
+        timeout: Timeout = DEFAULT_TIMEOUT,
+        circuit_breakers: CircuitBreakers | None = None,
+        hedging: HedgingPolicy | None = None,
+    ):
         self.auth = auth_backend
+        # Backends keeping the default get_headers get their headers assembled in a single dict build per call.
+        self._default_auth_headers = type(auth_backend).get_headers is AuthBackendInterface.get_headers
+        self._base_headers = MappingProxyType({"Accept-Encoding": accept_encoding} if accept_encoding else {})
         self.base_url = base_url or auth_backend.base_url
         self.validation = validation
+        self.json_codec = get_json_codec(json_codec)
+        self.raw_response = raw_response
+        self.compression = validate_compression(compression)
+        self.compression_threshold = compression_threshold
+        self.session = session or create_session()
+        self.timeout = timeout
+        self.circuit_breakers = circuit_breakers
+        self.hedging = hedging
+
+    @property
+    def base_url(self) -> str:
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str):
+        self._base_url = value
+        self.service_url = urljoin(value, self.service_path)
+
+    def with_response_type(self, response_type: type | None) -> OSDUAPIClient:
+        """Returns a copy of the client which decodes responses directly into response_type.
+            Args:
+                response_type (type): pydantic model (e.g. search.models.CursorQueryResponse) or a type supported
+                    by msgspec such as msgspec.Struct. None restores plain dict responses.
+            Returns:
+                Copy of the client sharing its auth backend and settings.
+        """
+        client = copy(self)
+        client.response_type = response_type
+        return client
+
+    def _url(self, path: str) -> str:
+        path = path.strip("/")
+        if not path:
+            return self.service_url
+        return f"{self.service_url}/{path}"
+
+    def _headers(self, data_partition_id: str | None = None) -> dict:
+        if self._default_auth_headers:
+            headers = {**self._base_headers, **self.auth.authorization_header}
+            headers["data-partition-id"] = data_partition_id or self.auth.default_data_partition_id
+            return headers
+        headers = {**self._base_headers, **self.auth.get_headers()}
+        if data_partition_id:
+            headers["data-partition-id"] = data_partition_id
+        return headers
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        headers: dict,
+        params: dict | None = None,
+        json: Any = None,
+        files: dict | None = None,
+    ) -> requests.Response:
+        data = None
+        if json is not None:
+            data = self.json_codec.dumps(json)
+            headers.setdefault("Content-Type", "application/json")
+            if self.compression and len(data) >= self.compression_threshold:
+                data = compress_body(data, self.compression)
+                headers["Content-Encoding"] = self.compression
+
+        timeout = self.timeout
+        deadline = current_deadline()
+        if deadline is not None:
+            deadline.check()
+            timeout = deadline.clip(timeout)
+
+        breaker = None
+        if self.circuit_breakers is not None:
+            breaker = self.circuit_breakers.get(self._service_key(url))
+            breaker.before_call()
+
+        def send() -> requests.Response:
+            return self.session.request(
+                method, url, headers=headers, params=params, data=data, files=files, timeout=timeout
+            )
+
+        started = time.monotonic()
+        success = False
+        try:
+            if self.hedging is not None and self.hedging.applies(method, url):
+                response = self.hedging.run(send)
+            else:
+                response = send()
+            success = response.status_code < 500
+        except requests.Timeout as e:
+            raise OSDUTimeoutError(f"Request {method.upper()} {url} timed out.") from e
+        finally:
+            # Any exception counts as a failure, so a half-open breaker always gets its probe outcome back.
+            if breaker is not None:
+                breaker.record(success, time.monotonic() - started)
+        return response
+
+    def _service_key(self, url: str) -> str:
+        if self.service_path:
+            return self.service_url
+        # DDMS clients have no common service path, their first two path segments (e.g. api/rafs-ddms) are used.
+        base_url = self.base_url.rstrip("/")
+        path = url[len(base_url):].lstrip("/") if url.startswith(base_url) else url
+        return urljoin(base_url, *path.split("/")[:2])
+
+    def _parse_response(self, response: requests.Response) -> Any:
+        if self.raw_response:
+            return response.content
+        if not response.content:
+            # e.g. 204 No Content of purge and delete endpoints
+            return None
+        if self.response_type is not None:
+            return decode_typed(response.content, self.response_type)
+        return self.json_codec.loads(response.content)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CreateDatasetRegistryRequest, GetDatasetRegistryRequest
@@ -32,9 +29,7 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "datasetRegistries": dataset_registries,
@@ -43,11 +38,11 @@ class DatasetClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, CreateDatasetRegistryRequest)
 
-        url = urljoin(self.base_url, self.service_path, "registerDataset")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("registerDataset")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_storage_instructions(
         self,
@@ -69,9 +64,7 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "kindSubType": kind_sub_type,
@@ -79,11 +72,11 @@ class DatasetClient(OSDUAPIClient):
         if expiry_time is not None:
             params["expiryTime"] = expiry_time
 
-        url = urljoin(self.base_url, self.service_path, "storageInstructions")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("storageInstructions")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_revoke_url(
         self, *, kind_sub_type: str, data_partition_id: str | None = None
@@ -99,19 +92,17 @@ class DatasetClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "kindSubType": kind_sub_type,
         }
 
-        url = urljoin(self.base_url, self.service_path, "revokeURL")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("revokeURL")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_retrieval_instructions(
         self,
@@ -133,9 +124,7 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "id": id,
@@ -143,11 +132,11 @@ class DatasetClient(OSDUAPIClient):
         if expiry_time is not None:
             params["expiryTime"] = expiry_time
 
-        url = urljoin(self.base_url, self.service_path, "retrievalInstructions")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("retrievalInstructions")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_retrieval_instructions_for_multiple_datasets(
         self,
@@ -169,9 +158,7 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if expiry_time is not None:
@@ -184,11 +171,13 @@ class DatasetClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, GetDatasetRegistryRequest)
 
-        url = urljoin(self.base_url, self.service_path, "retrievalInstructions")
-        response = requests.post(url, headers=headers, params=params, json=request_data)
+        url = self._url("retrievalInstructions")
+        response = self._request(
+            "post", url, headers=headers, params=params, json=request_data
+        )
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dataset_registry(
         self, *, id: str, data_partition_id: str | None = None
@@ -205,19 +194,17 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "id": id,
         }
 
-        url = urljoin(self.base_url, self.service_path, "getDatasetRegistry")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("getDatasetRegistry")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dataset_registries(
         self, *, dataset_registry_ids: list[str], data_partition_id: str | None = None
@@ -234,9 +221,7 @@ class DatasetClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "datasetRegistryIds": dataset_registry_ids,
@@ -245,11 +230,11 @@ class DatasetClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, GetDatasetRegistryRequest)
 
-        url = urljoin(self.base_url, self.service_path, "getDatasetRegistry")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("getDatasetRegistry")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -262,15 +247,13 @@ class DatasetClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -283,12 +266,10 @@ class DatasetClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise DatasetAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 
 
 class EntitlementsAPIError(OSDUAPIError):
@@ -25,15 +22,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_readiness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -46,15 +41,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/readiness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/readiness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_groups(
         self,
@@ -75,9 +68,7 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if on_behalf_of is not None:
             headers["on-behalf-of"] = on_behalf_of
 
@@ -85,11 +76,11 @@ class EntitlementsClient(OSDUAPIClient):
         if role_required is not None:
             params["roleRequired"] = role_required
 
-        url = urljoin(self.base_url, self.service_path, "groups")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("groups")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_group(
         self, *, group_info_dto: dict, data_partition_id: str | None = None
@@ -105,19 +96,15 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        request_data = {
-            "groupInfoDto": group_info_dto,
-        }
+        request_data = group_info_dto
 
-        url = urljoin(self.base_url, self.service_path, "groups")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("groups")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_group(
         self, *, group_email: str | None = None, data_partition_id: str | None = None
@@ -133,19 +120,17 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if group_email is not None:
             params["groupEmail"] = group_email
 
-        url = urljoin(self.base_url, self.service_path, "groups/%s")
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("groups/%s")
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_groups(
         self,
@@ -166,19 +151,15 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        request_data = {
-            "updateGroupRequest": update_group_request,
-        }
+        request_data = update_group_request
 
-        url = urljoin(self.base_url, self.service_path, "groups/%s" % group_email)
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("groups/%s" % group_email)
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_groups_members(
         self,
@@ -201,9 +182,7 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if role is not None:
@@ -211,13 +190,11 @@ class EntitlementsClient(OSDUAPIClient):
         if include_type is not None:
             params["includeType"] = include_type
 
-        url = urljoin(
-            self.base_url, self.service_path, "groups/%s/members" % group_email
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("groups/%s/members" % group_email)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def add_member(
         self,
@@ -238,21 +215,15 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        request_data = {
-            "addMemberDto": add_member_dto,
-        }
+        request_data = add_member_dto
 
-        url = urljoin(
-            self.base_url, self.service_path, "groups/%s/members" % group_email
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("groups/%s/members" % group_email)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_member_from_group(
         self,
@@ -273,19 +244,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "groups/%s/members/%s" % (group_email, member_email),
-        )
-        response = requests.delete(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("groups/%s/members/%s" % (group_email, member_email))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_member(
         self, *, member_email: str, data_partition_id: str | None = None
@@ -301,15 +266,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "members/%s" % member_email)
-        response = requests.delete(url, headers=headers)
+        url = self._url("members/%s" % member_email)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_members_groups(
         self,
@@ -334,9 +297,7 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "type": type,
@@ -346,13 +307,11 @@ class EntitlementsClient(OSDUAPIClient):
         if role_required is not None:
             params["roleRequired"] = role_required
 
-        url = urljoin(
-            self.base_url, self.service_path, "members/%s/groups" % member_email
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("members/%s/groups" % member_email)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def initiate_tenant(self, data_partition_id: str | None = None) -> dict:
         """
@@ -365,15 +324,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "tenant-provisioning")
-        response = requests.post(url, headers=headers)
+        url = self._url("tenant-provisioning")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -386,15 +343,13 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_count_group_members(
         self,
@@ -415,21 +370,17 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if role is not None:
             params["role"] = role
 
-        url = urljoin(
-            self.base_url, self.service_path, "groups/%s/membersCount" % group_email
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("groups/%s/membersCount" % group_email)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_partition_groups(
         self,
@@ -452,9 +403,7 @@ class EntitlementsClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "type": type,
@@ -464,10 +413,8 @@ class EntitlementsClient(OSDUAPIClient):
         if limit is not None:
             params["limit"] = limit
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/entitlements/v2/groups/all"
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("groups/all")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise EntitlementsAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
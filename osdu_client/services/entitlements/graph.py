@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from typing import Iterable
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+from .client import EntitlementsClient
+
+DEFAULT_GRAPH_TTL = 300.0
+DEFAULT_GROUP_LIST_TTL = 3600.0
+DEFAULT_GROUP_TYPES = ("DATA", "USER", "SERVICE")
+DEFAULT_PAGE_SIZE = 1000
+ACL_ROLES = ("viewers", "owners")
+
+
+class EntitlementsGraph:
+    """In-memory graph of entitlement groups and their members, answering transitive membership queries locally.
+
+        load lists all groups of the partition with list_partition_groups and fetches members of every group in
+        parallel. Members of a group are kept for ttl seconds and queries refresh only the groups which expired. The
+        group list is kept for group_list_ttl seconds, after which queries load the whole graph again. refresh can be
+        called with groups known to have changed. Concurrent queries share one load. Group emails are compared
+        case-insensitively.
+    """
+
+    def __init__(
+        self,
+        entitlements_client: EntitlementsClient,
+        ttl: float = DEFAULT_GRAPH_TTL,
+        group_list_ttl: float = DEFAULT_GROUP_LIST_TTL,
+        group_types: Iterable[str] = DEFAULT_GROUP_TYPES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        data_partition_id: str | None = None,
+    ):
+        self.entitlements_client = entitlements_client
+        self.ttl = ttl
+        self.group_list_ttl = group_list_ttl
+        self.group_types = tuple(group_types)
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+
+        self._members = {}
+        self._parents = {}
+        self._loaded_at = {}
+        self._closures = {}
+        self._groups_loaded_at = None
+        self._next_expiry = 0.0
+        self._lock = threading.RLock()
+        self._load_lock = threading.RLock()
+
+    @property
+    def groups(self) -> set[str]:
+        with self._lock:
+            return set(self._members)
+
+    def load(self):
+        """Lists all groups again and refetches members of every group."""
+        with self._load_lock:
+            groups = self._list_groups()
+            with self._lock:
+                for group in set(self._members) - groups:
+                    self._set_members(group, set())
+                    del self._members[group]
+                    del self._loaded_at[group]
+                self._groups_loaded_at = time.monotonic()
+            self.refresh(groups)
+
+    def refresh(self, groups: Iterable[str] | None = None):
+        """Refetches members of given groups, or of groups whose members expired, in parallel."""
+        if groups is None:
+            now = time.monotonic()
+            with self._lock:
+                groups = [group for group, loaded_at in self._loaded_at.items() if now - loaded_at >= self.ttl]
+        groups = [group.lower() for group in groups]
+        members = map_concurrently(self._fetch_members, groups, max_workers=self.max_workers)
+        now = time.monotonic()
+        with self._lock:
+            for group, group_members in zip(groups, members):
+                self._set_members(group, group_members)
+                self._loaded_at[group] = now
+            self._next_expiry = min(self._loaded_at.values(), default=now) + self.ttl
+
+    def members(self, group: str) -> set[str]:
+        """Returns direct members of a group."""
+        self._ensure_fresh()
+        with self._lock:
+            return set(self._members.get(group.lower(), ()))
+
+    def groups_of(self, member: str) -> frozenset[str]:
+        """Returns all groups member belongs to, directly or through nested groups."""
+        self._ensure_fresh()
+        member = member.lower()
+        with self._lock:
+            closure = self._closures.get(member)
+            if closure is None:
+                seen = set()
+                pending = deque([member])
+                while pending:
+                    for group in self._parents.get(pending.popleft(), ()):
+                        if group not in seen:
+                            seen.add(group)
+                            pending.append(group)
+                closure = self._closures[member] = frozenset(seen)
+            return closure
+
+    def is_member(self, member: str, group: str) -> bool:
+        return group.lower() in self.groups_of(member)
+
+    def has_access(self, member: str, acl: dict, owner: bool = False) -> bool:
+        """Checks a record acl ({"viewers": [...], "owners": [...]}), owners also have read access.
+            Args:
+                member (str): user or group email.
+                acl (dict): record acl.
+                owner (bool): check owner access instead of read access.
+            Returns:
+                True if member belongs to one of the acl groups
+        """
+        groups = self.groups_of(member)
+        roles = ("owners",) if owner else ACL_ROLES
+        return any(group.lower() in groups for role in roles for group in acl.get(role) or ())
+
+    def _ensure_fresh(self):
+        if self._is_fresh():
+            return
+        with self._load_lock:
+            # Another query may have loaded the graph while this one was waiting.
+            now = time.monotonic()
+            with self._lock:
+                loaded_at, next_expiry = self._groups_loaded_at, self._next_expiry
+            if loaded_at is None or now - loaded_at >= self.group_list_ttl:
+                self.load()
+            elif now >= next_expiry:
+                self.refresh()
+
+    def _is_fresh(self) -> bool:
+        now = time.monotonic()
+        with self._lock:
+            return (
+                self._groups_loaded_at is not None
+                and now - self._groups_loaded_at < self.group_list_ttl
+                and now < self._next_expiry
+            )
+
+    def _set_members(self, group: str, members: set[str]):
+        previous = self._members.get(group, set())
+        for member in previous - members:
+            self._parents[member].discard(group)
+            if not self._parents[member]:
+                del self._parents[member]
+        for member in members - previous:
+            self._parents.setdefault(member, set()).add(group)
+        self._members[group] = members
+        if previous != members:
+            self._closures.clear()
+
+    def _list_groups(self) -> set[str]:
+        groups = set()
+        for group_type in self.group_types:
+            cursor = None
+            while True:
+                response = self.entitlements_client.list_partition_groups(
+                    type=group_type, cursor=cursor, limit=DEFAULT_PAGE_SIZE, data_partition_id=self.data_partition_id
+                )
+                groups.update(group["email"].lower() for group in response.get("groups") or [])
+                cursor = response.get("cursor")
+                if not cursor or not response.get("groups"):
+                    break
+        return groups
+
+    def _fetch_members(self, group: str) -> set[str]:
+        response = self.entitlements_client.get_groups_members(
+            group_email=group, data_partition_id=self.data_partition_id
+        )
+        return {member["email"].lower() for member in response.get("members") or []}
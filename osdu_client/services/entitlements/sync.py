@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Union
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently, map_concurrently
+from osdu_client.rate_limit import RateLimiter
+
+from .client import EntitlementsClient
+
+MEMBER = "MEMBER"
+OWNER = "OWNER"
+
+ADD = "add"
+REMOVE = "remove"
+CHANGE_ROLE = "change_role"
+
+# group email -> member emails (as MEMBER) or member email -> role
+DesiredMembership = Dict[str, Union[Iterable[str], Dict[str, str]]]
+
+
+@dataclass(frozen=True)
+class SyncAction:
+    op: str
+    group: str
+    member: str
+    role: str | None = None
+    # Role the member had before a role change, added back when the new role cannot be added.
+    previous_role: str | None = None
+
+
+@dataclass
+class SyncResult:
+    applied: list[SyncAction] = field(default_factory=list)
+    failed: dict[SyncAction, BaseException] = field(default_factory=dict)
+    # Failed role changes whose member got the previous role back.
+    restored: list[SyncAction] = field(default_factory=list)
+
+
+class MembershipSync:
+    """Reconciles entitlement group memberships with a desired state using the minimal set of calls.
+
+        plan fetches current members of all desired groups in parallel and returns the actions needed, apply runs
+        them concurrently under an optional rate limit (calls per second). Entitlements has no role update, a role
+        change removes and adds the member again, restoring the previous role if the new one cannot be added. Only
+        with prune, members missing from the desired state are removed, except the emails listed in keep (e.g. service
+        accounts owning the groups), preview the removals with a dry run first. Emails are compared case-insensitively.
+    """
+
+    def __init__(
+        self,
+        entitlements_client: EntitlementsClient,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limit: float | None = None,
+        prune: bool = False,
+        keep: Iterable[str] = (),
+    ):
+        self.entitlements_client = entitlements_client
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+        self.prune = prune
+        self.keep = {email.lower() for email in keep}
+
+    def current(self, groups: Iterable[str], data_partition_id: str | None = None) -> dict[str, dict[str, str]]:
+        """Returns member email -> role of every group, fetched in parallel."""
+        groups = [group.lower() for group in groups]
+        members = map_concurrently(
+            lambda group: self._fetch_members(group, data_partition_id), groups, max_workers=self.max_workers
+        )
+        return dict(zip(groups, members))
+
+    def plan(self, desired: DesiredMembership, data_partition_id: str | None = None) -> list[SyncAction]:
+        """Returns actions turning current memberships of desired groups into the desired ones. Nothing is changed.
+            Args:
+                desired (dict): group email -> member emails, or group email -> {member email: role}.
+                data_partition_id (str): identifier of the data partition. If None sets by auth session.
+            Returns:
+                list of SyncAction
+        """
+        desired = {group.lower(): _normalize_members(members) for group, members in desired.items()}
+        current = self.current(desired, data_partition_id)
+        actions = []
+        for group, members in desired.items():
+            existing = current[group]
+            for member, role in members.items():
+                if member not in existing:
+                    actions.append(SyncAction(ADD, group, member, role))
+                elif existing[member] != role:
+                    actions.append(SyncAction(CHANGE_ROLE, group, member, role, existing[member]))
+            if self.prune:
+                for member in existing.keys() - members.keys() - self.keep:
+                    actions.append(SyncAction(REMOVE, group, member))
+        return sorted(actions, key=lambda action: (action.group, action.op, action.member))
+
+    def apply(self, actions: Iterable[SyncAction], data_partition_id: str | None = None) -> SyncResult:
+        """Runs actions concurrently. A failed action is kept in the result and does not stop the others."""
+        result = SyncResult()
+        for action, _, error in iter_concurrently(
+            lambda action: self._apply(action, data_partition_id, result.restored),
+            actions,
+            max_workers=self.max_workers,
+        ):
+            if error is None:
+                result.applied.append(action)
+            else:
+                result.failed[action] = error
+        return result
+
+    def sync(self, desired: DesiredMembership, dry_run: bool = False, data_partition_id: str | None = None):
+        """Plans and, unless dry_run, applies the changes. Returns the plan for dry runs, otherwise SyncResult."""
+        actions = self.plan(desired, data_partition_id)
+        if dry_run:
+            return actions
+        return self.apply(actions, data_partition_id)
+
+    def _apply(self, action: SyncAction, data_partition_id: str | None, restored: list[SyncAction]):
+        if action.op in (REMOVE, CHANGE_ROLE):
+            self._acquire()
+            self.entitlements_client.delete_member_from_group(
+                group_email=action.group, member_email=action.member, data_partition_id=data_partition_id
+            )
+        if action.op == ADD:
+            self._add_member(action.group, action.member, action.role, data_partition_id)
+        elif action.op == CHANGE_ROLE:
+            try:
+                self._add_member(action.group, action.member, action.role, data_partition_id)
+            except Exception:
+                # The member was already removed, without the previous role it would lose access to the group.
+                if action.previous_role is None:
+                    raise
+                self._add_member(action.group, action.member, action.previous_role, data_partition_id)
+                restored.append(action)
+                raise
+
+    def _add_member(self, group: str, member: str, role: str, data_partition_id: str | None):
+        self._acquire()
+        self.entitlements_client.add_member(
+            group_email=group, add_member_dto={"email": member, "role": role}, data_partition_id=data_partition_id
+        )
+
+    def _fetch_members(self, group: str, data_partition_id: str | None) -> dict[str, str]:
+        self._acquire()
+        response = self.entitlements_client.get_groups_members(group_email=group, data_partition_id=data_partition_id)
+        return {
+            member["email"].lower(): (member.get("role") or MEMBER).upper() for member in response.get("members") or []
+        }
+
+    def _acquire(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+
+def _normalize_members(members: Iterable[str] | dict[str, str]) -> dict[str, str]:
+    if isinstance(members, dict):
+        return {email.lower(): role.upper() for email, role in members.items()}
+    return {email.lower(): MEMBER for email in members}
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import DeliveryGetFileSignedURLRequest, FileListRequest, FileLocationRequest, LocationRequest, Record
@@ -34,9 +31,7 @@ class FileClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if file_id is not None:
@@ -45,11 +40,11 @@ class FileClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, LocationRequest)
 
-        url = urljoin(self.base_url, self.service_path, "v2/getLocation")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("v2/getLocation")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_files_upload_url(self, data_partition_id: str | None = None) -> dict:
         """
@@ -68,15 +63,13 @@ class FileClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "v2/files/uploadURL")
-        response = requests.get(url, headers=headers)
+        url = self._url("v2/files/uploadURL")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_files_metadata(
         self,
@@ -111,9 +104,7 @@ class FileClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "kind": kind,
@@ -129,11 +120,11 @@ class FileClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Record)
 
-        url = urljoin(self.base_url, self.service_path, "v2/files/metadata")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("v2/files/metadata")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_files_metadata(
         self, *, id: str, data_partition_id: str | None = None
@@ -151,15 +142,13 @@ class FileClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "v2/files/%s/metadata" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("v2/files/%s/metadata" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_files_metadata(
         self, *, id: str, data_partition_id: str | None = None
@@ -177,15 +166,13 @@ class FileClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "v2/files/%s/metadata" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("v2/files/%s/metadata" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def gets_url_to_download_file(
         self,
@@ -208,19 +195,17 @@ class FileClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if expiry_time is not None:
             params["expiryTime"] = expiry_time
 
-        url = urljoin(self.base_url, self.service_path, "v2/files/%s/downloadURL" % id)
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("v2/files/%s/downloadURL" % id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_file_location(
         self, *, file_id: str | None = None, data_partition_id: str | None = None
@@ -237,9 +222,7 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if file_id is not None:
@@ -248,11 +231,11 @@ class FileClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, FileLocationRequest)
 
-        url = urljoin(self.base_url, self.service_path, "v2/getFileLocation")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("v2/getFileLocation")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_file_signed_url(
         self, *, srn: list[str] | None = None, data_partition_id: str | None = None
@@ -269,9 +252,7 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if srn is not None:
@@ -280,11 +261,11 @@ class FileClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DeliveryGetFileSignedURLRequest)
 
-        url = urljoin(self.base_url, self.service_path, "v2/delivery/getFileSignedUrl")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("v2/delivery/getFileSignedUrl")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_file_list(
         self,
@@ -312,9 +293,7 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if time_from is not None:
@@ -331,11 +310,11 @@ class FileClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, FileListRequest)
 
-        url = urljoin(self.base_url, self.service_path, "v2/getFileList")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("v2/getFileList")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -348,15 +327,13 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "v2/info")
-        response = requests.get(url, headers=headers)
+        url = self._url("v2/info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_file_collections_storage_instructions(
         self, data_partition_id: str | None = None
@@ -371,17 +348,13 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "v2/file-collections/storageInstructions"
-        )
-        response = requests.post(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("v2/file-collections/storageInstructions")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_file_collections_retrieval_instructions(
         self, data_partition_id: str | None = None
@@ -396,19 +369,13 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "v2/file-collections/retrievalInstructions",
-        )
-        response = requests.post(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("v2/file-collections/retrievalInstructions")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def copy_file_collections(self, data_partition_id: str | None = None) -> dict:
         """
@@ -421,12 +388,10 @@ class FileClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "v2/file-collections/copy")
-        response = requests.post(url, headers=headers)
+        url = self._url("v2/file-collections/copy")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise FileAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
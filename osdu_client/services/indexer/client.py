@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import RecordReindexRequest, ReindexRecordsRequest
@@ -28,15 +25,13 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "partitions/provision")
-        response = requests.put(url, headers=headers)
+        url = self._url("partitions/provision")
+        response = self._request("put", url, headers=headers)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def reindex_kind(
         self,
@@ -59,9 +54,7 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if force_clean is not None:
@@ -76,11 +69,13 @@ class IndexerClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, RecordReindexRequest)
 
-        url = urljoin(self.base_url, self.service_path, "reindex")
-        response = requests.post(url, headers=headers, params=params, json=request_data)
+        url = self._url("reindex")
+        response = self._request(
+            "post", url, headers=headers, params=params, json=request_data
+        )
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def reindex_partition(
         self, *, force_clean: bool | None = None, data_partition_id: str | None = None
@@ -96,19 +91,17 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if force_clean is not None:
             params["force_clean"] = force_clean
 
-        url = urljoin(self.base_url, self.service_path, "reindex")
-        response = requests.patch(url, headers=headers, params=params)
+        url = self._url("reindex")
+        response = self._request("patch", url, headers=headers, params=params)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def reindex_records(
         self, *, record_ids: list[str], data_partition_id: str | None = None
@@ -124,9 +117,7 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "recordIds": record_ids,
@@ -135,11 +126,11 @@ class IndexerClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, ReindexRecordsRequest)
 
-        url = urljoin(self.base_url, self.service_path, "reindex/records")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("reindex/records")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_readiness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -152,15 +143,13 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "readiness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("readiness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -173,15 +162,13 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -194,15 +181,13 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_index(self, *, kind: str, data_partition_id: str | None = None) -> dict:
         """
@@ -216,16 +201,14 @@ class IndexerClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "kind": kind,
         }
 
-        url = urljoin(self.base_url, self.service_path, "index")
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("index")
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise IndexerAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
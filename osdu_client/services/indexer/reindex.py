@@ -0,0 +1,131 @@
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently
+from osdu_client.deadline import sleep
+from osdu_client.services.search.client import SearchClient
+from osdu_client.services.storage.client import StorageClient
+from osdu_client.services.storage.record_ids import iter_record_id_pages
+
+from .client import IndexerClient
+
+# Maximum number of record ids accepted by reindex_records.
+MAX_REINDEX_RECORDS = 1000
+DEFAULT_CHUNK_THRESHOLD = 100_000
+DEFAULT_VERIFY_INTERVAL = 10.0
+
+
+@dataclass
+class KindReindexResult:
+    kind: str
+    storage_count: int = 0
+    search_count: int | None = None
+    chunks: int = 0
+    error: BaseException | None = None
+
+    @property
+    def chunked(self) -> bool:
+        return self.chunks > 0
+
+    @property
+    def complete(self) -> bool:
+        return self.error is None and self.search_count == self.storage_count
+
+
+class ReindexOrchestrator:
+    """Reindexes kinds in parallel and verifies that Search holds as many records as Storage.
+
+        At most max_workers kinds are processed at a time. Record ids of every kind are enumerated from Storage,
+        which also gives the expected count. Kinds with up to chunk_threshold records are reindexed with one
+        reindex_kind call, bigger kinds are reindexed in chunks of chunk_size ids through reindex_records while the
+        ids are still being enumerated, so at most chunk_threshold ids of a kind are held in memory.
+    """
+
+    def __init__(
+        self,
+        indexer_client: IndexerClient,
+        storage_client: StorageClient,
+        search_client: SearchClient,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        chunk_threshold: int = DEFAULT_CHUNK_THRESHOLD,
+        chunk_size: int = MAX_REINDEX_RECORDS,
+    ):
+        if not 0 < chunk_size <= MAX_REINDEX_RECORDS:
+            raise ValueError(f"chunk_size must be between 1 and {MAX_REINDEX_RECORDS}.")
+        self.indexer_client = indexer_client
+        self.storage_client = storage_client
+        self.search_client = search_client
+        self.max_workers = max_workers
+        self.chunk_threshold = chunk_threshold
+        self.chunk_size = chunk_size
+
+    def reindex(
+        self,
+        kinds: Iterable[str],
+        *,
+        force_clean: bool | None = None,
+        verify_timeout: float = 0.0,
+        verify_interval: float = DEFAULT_VERIFY_INTERVAL,
+        data_partition_id: str | None = None,
+    ) -> dict[str, KindReindexResult]:
+        """Reindexes kinds and compares Storage and Search counts of every kind.
+            Indexing is asynchronous, counts are compared again every verify_interval seconds until they match or
+            verify_timeout passes. An error of one kind is kept in its result and does not stop the others.
+            Args:
+                kinds (Iterable[str]): kinds to reindex.
+                force_clean (bool): recreates the index of kinds reindexed with reindex_kind.
+                verify_timeout (float): seconds to wait for Search counts to match after reindexing.
+                verify_interval (float): seconds between count checks.
+                data_partition_id (str): identifier of the data partition. If None sets by auth session.
+            Returns:
+                dict mapping kind to KindReindexResult
+        """
+        kinds = list(dict.fromkeys(kinds))
+        results = {}
+        for kind, result, error in iter_concurrently(
+            lambda kind: self._reindex_kind(kind, force_clean, data_partition_id), kinds, max_workers=self.max_workers
+        ):
+            results[kind] = result if error is None else KindReindexResult(kind, error=error)
+
+        verify_until = time.monotonic() + verify_timeout
+        while True:
+            pending = [result for result in results.values() if result.error is None and not result.complete]
+            for checked, count, error in iter_concurrently(
+                lambda result: self.search_count(result.kind, data_partition_id), pending, max_workers=self.max_workers
+            ):
+                checked.search_count, checked.error = count, error
+            if all(result.complete for result in pending) or time.monotonic() + verify_interval > verify_until:
+                break
+            sleep(verify_interval)
+        return {kind: results[kind] for kind in kinds}
+
+    def search_count(self, kind: str, data_partition_id: str | None = None) -> int:
+        response = self.search_client.query(
+            kind=kind, limit=0, track_total_count=True, data_partition_id=data_partition_id
+        )
+        return response.get("totalCount", 0)
+
+    def _reindex_kind(self, kind: str, force_clean: bool | None, data_partition_id: str | None) -> KindReindexResult:
+        result = KindReindexResult(kind)
+        buffered = []
+        for page in iter_record_id_pages(self.storage_client, kind=kind, data_partition_id=data_partition_id):
+            result.storage_count += len(page)
+            buffered += page
+            if result.chunked or len(buffered) > self.chunk_threshold:
+                while len(buffered) >= self.chunk_size:
+                    self._reindex_chunk(result, buffered[: self.chunk_size], data_partition_id)
+                    del buffered[: self.chunk_size]
+
+        if result.chunked:
+            if buffered:
+                self._reindex_chunk(result, buffered, data_partition_id)
+        elif result.storage_count:
+            self.indexer_client.reindex_kind(kind=kind, force_clean=force_clean, data_partition_id=data_partition_id)
+        return result
+
+    def _reindex_chunk(self, result: KindReindexResult, record_ids: list[str], data_partition_id: str | None):
+        self.indexer_client.reindex_records(record_ids=record_ids, data_partition_id=data_partition_id)
+        result.chunks += 1
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import LegalTagDto, RequestLegalTags, SearchLegalTag, UpdateLegalTag
@@ -31,19 +28,17 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if valid is not None:
             params["valid"] = valid
 
-        url = urljoin(self.base_url, self.service_path, "legaltags")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("legaltags")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_legaltag(
         self,
@@ -70,9 +65,7 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if name is not None:
@@ -89,11 +82,11 @@ class LegalClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, UpdateLegalTag)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("legaltags")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_legaltag(
         self,
@@ -116,9 +109,7 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if name is not None:
@@ -131,11 +122,11 @@ class LegalClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, LegalTagDto)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("legaltags")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def validate_legaltags(
         self, *, names: list[str], data_partition_id: str | None = None
@@ -151,9 +142,7 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "names": names,
@@ -162,11 +151,11 @@ class LegalClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, RequestLegalTags)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags:validate")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("legaltags:validate")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_legaltags(
         self,
@@ -195,9 +184,7 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if valid is not None:
@@ -218,11 +205,13 @@ class LegalClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SearchLegalTag)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags:query")
-        response = requests.post(url, headers=headers, params=params, json=request_data)
+        url = self._url("legaltags:query")
+        response = self._request(
+            "post", url, headers=headers, params=params, json=request_data
+        )
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_batch_legaltags(
         self, *, names: list[str], data_partition_id: str | None = None
@@ -238,9 +227,7 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "names": names,
@@ -249,11 +236,11 @@ class LegalClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, RequestLegalTags)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags:batchRetrieve")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("legaltags:batchRetrieve")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_legaltags_properties(self, data_partition_id: str | None = None) -> dict:
         """
@@ -266,15 +253,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags:properties")
-        response = requests.get(url, headers=headers)
+        url = self._url("legaltags:properties")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_legaltag(self, *, name: str, data_partition_id: str | None = None) -> dict:
         """
@@ -288,15 +273,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags/%s" % name)
-        response = requests.get(url, headers=headers)
+        url = self._url("legaltags/%s" % name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_legaltag(
         self, *, name: str, data_partition_id: str | None = None
@@ -312,15 +295,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "legaltags/%s" % name)
-        response = requests.delete(url, headers=headers)
+        url = self._url("legaltags/%s" % name)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_legaltag_compliance_job_status(
         self, data_partition_id: str | None = None
@@ -335,15 +316,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "jobs/updateLegalTagStatus")
-        response = requests.get(url, headers=headers)
+        url = self._url("jobs/updateLegalTagStatus")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -356,15 +335,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_readiness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -377,15 +354,13 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/readiness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/readiness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -398,12 +373,10 @@ class LegalClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise LegalAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Iterable
+
+from osdu_client.cache import TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+from .client import LegalAPIError, LegalClient
+
+# Maximum number of names accepted by get_batch_legaltags.
+MAX_BATCH_NAMES = 25
+DEFAULT_TAG_TTL = 300.0
+DEFAULT_REFRESH_AHEAD = 0.8
+
+NOT_FOUND_REASON = "LegalTag not found."
+EXPIRED_REASON = "LegalTag expired."
+
+
+@dataclass
+class _Entry:
+    tag: dict | None
+    loaded_at: float
+
+
+def expiration_of(tag: dict) -> datetime | None:
+    """Returns the expiration of a legal tag as an aware datetime. A date-only expiration lasts the whole day."""
+    value = (tag.get("properties") or {}).get("expirationDate")
+    if not value:
+        return None
+    if len(value) == 10:
+        return datetime.combine(date.fromisoformat(value) + timedelta(days=1), datetime.min.time(), timezone.utc)
+    expires_at = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return expires_at if expires_at.tzinfo else expires_at.replace(tzinfo=timezone.utc)
+
+
+class LegalTagCache:
+    """Keeps legal tags in memory so ingest checks do not call the Legal service for every record.
+
+        Tags are fetched in batches of MAX_BATCH_NAMES through get_batch_legaltags, or all at once with prefetch, and
+        kept for ttl seconds. Names which do not exist are cached too, a batch rejected with 404 because of them is
+        split until they are found. Once an entry is older than refresh_ahead * ttl, the next lookup returns it and
+        reloads it in the background, so hot tags never expire on the request path. Concurrent lookups of the same
+        missing names share one fetch. A failed background refresh keeps the current entries, its error is kept in
+        errors until the name loads again. Validity is decided locally, a tag is valid when it exists and its
+        expirationDate has not passed.
+    """
+
+    def __init__(
+        self,
+        legal_client: LegalClient,
+        ttl: float = DEFAULT_TAG_TTL,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        max_entries: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        data_partition_id: str | None = None,
+    ):
+        if not 0 < refresh_ahead <= 1:
+            raise ValueError("refresh_ahead must be between 0 and 1.")
+        self.legal_client = legal_client
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+        self.errors: dict[str, BaseException] = {}
+
+        self._cache = TTLCache(ttl, max_entries)
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def prefetch(self, names: Iterable[str] | None = None):
+        """Loads given tags, or all valid tags of the partition with one list_legaltags call when names is None."""
+        if names is not None:
+            self._load(set(names))
+            return
+        response = self.legal_client.list_legaltags(valid=True, data_partition_id=self.data_partition_id)
+        now = time.monotonic()
+        for tag in response.get("legalTags") or []:
+            self._cache.set(tag["name"], _Entry(tag, now))
+
+    def get(self, name: str) -> dict | None:
+        """Returns the legal tag, or None if it does not exist."""
+        return self.get_many([name])[name]
+
+    def get_many(self, names: Iterable[str]) -> dict[str, dict | None]:
+        """Returns name -> legal tag (None if it does not exist). Missing names are fetched in parallel batches."""
+        names = list(dict.fromkeys(names))
+        now = time.monotonic()
+        entries, stale = {}, []
+        for name in names:
+            entry = self._cache.get(name)
+            if entry is not None:
+                entries[name] = entry
+                if now - entry.loaded_at >= self.refresh_ahead * self.ttl:
+                    stale.append(name)
+        missing = [name for name in names if name not in entries]
+        if missing:
+            entries.update(self._cache.get_or_load_many(missing, self._fetch))
+        if stale:
+            self._refresh_in_background(stale)
+        return {name: entries[name].tag for name in names}
+
+    def is_valid(self, name: str, at: datetime | None = None) -> bool:
+        return not self.invalid([name], at)
+
+    def invalid(self, names: Iterable[str], at: datetime | None = None) -> dict[str, str]:
+        """Local counterpart of validate_legaltags, returns name -> reason for names which are not valid.
+            Args:
+                names (Iterable[str]): legal tag names.
+                at (datetime): moment of the check, now by default.
+            Returns:
+                dict mapping invalid names to the reason
+        """
+        at = at or datetime.now(timezone.utc)
+        reasons = {}
+        for name, tag in self.get_many(names).items():
+            if tag is None:
+                reasons[name] = NOT_FOUND_REASON
+            else:
+                expires_at = expiration_of(tag)
+                if expires_at is not None and expires_at <= at:
+                    reasons[name] = EXPIRED_REASON
+        return reasons
+
+    def invalidate(self, name: str | None = None):
+        """Drops one tag, e.g. after updating it, or all tags when name is None."""
+        if name is None:
+            self._cache.clear()
+        else:
+            self._cache.invalidate(name)
+
+    def _load(self, names: Iterable[str]) -> dict[str, _Entry]:
+        entries = self._fetch(list(names))
+        for name, entry in entries.items():
+            self._cache.set(name, entry)
+        return entries
+
+    def _fetch(self, names: list[str]) -> dict[str, _Entry]:
+        batches = [names[start:start + MAX_BATCH_NAMES] for start in range(0, len(names), MAX_BATCH_NAMES)]
+        responses = map_concurrently(self._fetch_batch, batches, max_workers=self.max_workers)
+        now = time.monotonic()
+        tags = {tag["name"]: tag for batch_tags in responses for tag in batch_tags}
+        with self._lock:
+            for name in names:
+                self.errors.pop(name, None)
+        return {name: _Entry(tags.get(name), now) for name in names}
+
+    def _fetch_batch(self, names: list[str]) -> list[dict]:
+        """Returns the tags of names which exist. The service answers 404 when any name of the batch does not exist,
+        such a batch is bisected until the unknown names are isolated.
+        """
+        try:
+            response = self.legal_client.get_batch_legaltags(names=names, data_partition_id=self.data_partition_id)
+        except LegalAPIError as e:
+            if len(e.args) < 2 or e.args[1] != 404:
+                raise
+            if len(names) == 1:
+                return []
+            middle = len(names) // 2
+            return self._fetch_batch(names[:middle]) + self._fetch_batch(names[middle:])
+        return response.get("legalTags") or []
+
+    def _refresh_in_background(self, names: list[str]):
+        with self._lock:
+            names = [name for name in names if name not in self._refreshing]
+            self._refreshing.update(names)
+        if names:
+            threading.Thread(target=self._refresh, args=(names,), name="osdu-legal-tag-refresh", daemon=True).start()
+
+    def _refresh(self, names: list[str]):
+        try:
+            self._load(names)
+        except Exception as e:
+            # The current entries stay until they expire, the next lookup after that loads them again.
+            with self._lock:
+                for name in names:
+                    self.errors[name] = e
+        finally:
+            with self._lock:
+                self._refreshing.difference_update(names)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import PartitionInfo
@@ -31,15 +28,13 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "partitions/%s" % partition_id)
-        response = requests.get(url, headers=headers)
+        url = self._url("partitions/%s" % partition_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_partitions(
         self,
@@ -60,9 +55,7 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "properties": properties,
@@ -71,11 +64,11 @@ class PartitionClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, PartitionInfo)
 
-        url = urljoin(self.base_url, self.service_path, "partitions/%s" % partition_id)
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("partitions/%s" % partition_id)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_partition(
         self, *, partition_id: str, data_partition_id: str | None = None
@@ -91,15 +84,13 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "partitions/%s" % partition_id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("partitions/%s" % partition_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_partitions(
         self,
@@ -120,9 +111,7 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "properties": properties,
@@ -131,11 +120,11 @@ class PartitionClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, PartitionInfo)
 
-        url = urljoin(self.base_url, self.service_path, "partitions/%s" % partition_id)
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("partitions/%s" % partition_id)
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_partitions(self, data_partition_id: str | None = None) -> dict:
         """
@@ -148,15 +137,13 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "partitions")
-        response = requests.get(url, headers=headers)
+        url = self._url("partitions")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -169,15 +156,13 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -190,12 +175,10 @@ class PartitionClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PartitionAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Optional
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently
+
+from .client import PartitionClient
+
+DEFAULT_REFRESH_INTERVAL = 300.0
+
+# Called with partition id, previous properties and new properties, None when the partition appeared or was removed.
+Subscriber = Callable[[str, Optional[dict], Optional[dict]], None]
+
+
+class PartitionPropertiesCache:
+    """Keeps properties of all data partitions in memory and refreshes them in the background.
+
+        load lists partitions with list_partitions and fetches properties of all of them concurrently. After start,
+        a background thread reloads them every refresh_interval seconds, so lookups never wait for the Partition
+        service, and subscribers are notified about every partition whose properties changed. A partition which
+        fails to load keeps its previous properties, the error is kept in errors until it loads again. When a
+        background refresh fails to list partitions, its error is kept in last_error until a refresh succeeds.
+    """
+
+    def __init__(
+        self,
+        partition_client: PartitionClient,
+        refresh_interval: float = DEFAULT_REFRESH_INTERVAL,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        data_partition_id: str | None = None,
+    ):
+        self.partition_client = partition_client
+        self.refresh_interval = refresh_interval
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+        self.errors: dict[str, BaseException] = {}
+        self.last_error: BaseException | None = None
+
+        self._properties = None
+        self._subscribers = []
+        self._lock = threading.Lock()
+        self._load_lock = threading.RLock()
+        self._stopped = threading.Event()
+        self._refresher = None
+
+    @property
+    def partitions(self) -> list[str]:
+        return sorted(self._loaded())
+
+    def get(self, partition_id: str) -> dict | None:
+        """Returns properties of a partition, or None if it is unknown. Loads all partitions on first use."""
+        return self._loaded().get(partition_id)
+
+    def value(self, partition_id: str, name: str, default: Any = None) -> Any:
+        """Returns the value of one property, e.g. value("opendes", "elasticsearch.host")."""
+        properties = self.get(partition_id) or {}
+        if name not in properties:
+            return default
+        prop = properties[name]
+        return prop.get("value", default) if isinstance(prop, dict) else prop
+
+    def subscribe(self, subscriber: Subscriber) -> Callable[[], None]:
+        """Registers a callback called for every changed partition, returns a function removing it."""
+        with self._lock:
+            self._subscribers.append(subscriber)
+
+        def unsubscribe():
+            with self._lock:
+                if subscriber in self._subscribers:
+                    self._subscribers.remove(subscriber)
+
+        return unsubscribe
+
+    def load(self) -> list[str]:
+        """Reloads all partitions concurrently and notifies subscribers.
+            Returns:
+                list of ids of partitions whose properties changed
+        """
+        with self._load_lock:
+            partition_ids = list(
+                dict.fromkeys(self.partition_client.list_partitions(data_partition_id=self.data_partition_id))
+            )
+            previous = self._properties or {}
+            properties, errors = {}, {}
+            for partition_id, result, error in iter_concurrently(
+                self._fetch, partition_ids, max_workers=self.max_workers
+            ):
+                if error is None:
+                    properties[partition_id] = result
+                else:
+                    errors[partition_id] = error
+                    if partition_id in previous:
+                        properties[partition_id] = previous[partition_id]
+
+            changed = sorted(
+                partition_id
+                for partition_id in properties.keys() | previous.keys()
+                if properties.get(partition_id) != previous.get(partition_id)
+            )
+            with self._lock:
+                self._properties = properties
+                self.errors = errors
+                self.last_error = None
+                subscribers = list(self._subscribers)
+
+        for partition_id in changed:
+            self._notify(subscribers, partition_id, previous.get(partition_id), properties.get(partition_id))
+        return changed
+
+    def start(self) -> PartitionPropertiesCache:
+        """Loads partitions if not loaded yet and starts the background refresh."""
+        self._loaded()
+        with self._lock:
+            if self._refresher is None:
+                self._stopped.clear()
+                self._refresher = threading.Thread(
+                    target=self._refresh_loop, name="osdu-partition-refresh", daemon=True
+                )
+                self._refresher.start()
+        return self
+
+    def stop(self):
+        self._stopped.set()
+        with self._lock:
+            refresher, self._refresher = self._refresher, None
+        # A subscriber may stop the cache while being notified from the refresher thread, which cannot join itself.
+        if refresher is not None and refresher is not threading.current_thread():
+            refresher.join()
+
+    def __enter__(self) -> PartitionPropertiesCache:
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def _loaded(self) -> dict[str, dict]:
+        if self._properties is None:
+            with self._load_lock:
+                if self._properties is None:
+                    self.load()
+        return self._properties
+
+    def _fetch(self, partition_id: str) -> dict:
+        return self.partition_client.get_partition(partition_id=partition_id, data_partition_id=self.data_partition_id)
+
+    def _refresh_loop(self):
+        while not self._stopped.wait(self.refresh_interval):
+            try:
+                self.load()
+            except Exception as e:
+                # list_partitions failed, the current properties stay until the next refresh.
+                with self._lock:
+                    self.last_error = e
+
+    @staticmethod
+    def _notify(subscribers: list[Subscriber], partition_id: str, previous: dict | None, current: dict | None):
+        for subscriber in subscribers:
+            try:
+                subscriber(partition_id, previous, current)
+            except Exception:
+                # A failing subscriber must not stop the refresh or the other subscribers.
+                pass
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import TranslateItem
@@ -36,19 +33,17 @@ class PolicyClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
             headers["user-agent"] = user_agent
 
-        url = urljoin(self.base_url, self.service_path, "")
-        response = requests.get(url, headers=headers)
+        url = self._url("")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_api_policy_v1_policies(
         self,
@@ -73,9 +68,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -83,11 +76,11 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/policies")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/policies")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fetch_policy(
         self,
@@ -112,9 +105,7 @@ class PolicyClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -122,13 +113,11 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/policy/v1/policies/%s" % policy_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/policies/%s" % policy_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fetch_instance_policy(
         self,
@@ -153,9 +142,7 @@ class PolicyClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -163,15 +150,11 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/policy/v1/policies/osdu/instance/%s" % policy_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/policies/osdu/instance/%s" % policy_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_api_policy_v1_policies_osdu_partition(
         self,
@@ -199,9 +182,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -209,15 +190,13 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition),
+        url = self._url(
+            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_partition_policy(
         self,
@@ -277,9 +256,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -287,15 +264,13 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition),
+        url = self._url(
+            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition)
         )
-        response = requests.delete(url, headers=headers)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_partition_policy(
         self,
@@ -305,6 +280,7 @@ class PolicyClient(OSDUAPIClient):
         correlation_id: str | None = None,
         user_agent: str | None = None,
         x_user_id: str | None = None,
+        file: bytes,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -352,15 +328,14 @@ class PolicyClient(OSDUAPIClient):
                 correlation_id (str):
                 user_agent (str):
                 x_user_id (str): identifier the user in the query
+                file (bytes):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -368,15 +343,17 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition),
+        files = {
+            "file": file,
+        }
+
+        url = self._url(
+            "api/policy/v1/policies/osdu/partition/%s/%s" % (policy_id, data_partition)
         )
-        response = requests.put(url, headers=headers)
+        response = self._request("put", url, headers=headers, files=files)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def evaluate_policy(
         self,
@@ -386,6 +363,7 @@ class PolicyClient(OSDUAPIClient):
         correlation_id: str | None = None,
         user_agent: str | None = None,
         x_user_id: str | None = None,
+        file: bytes,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -429,15 +407,14 @@ class PolicyClient(OSDUAPIClient):
                 correlation_id (str):
                 user_agent (str):
                 x_user_id (str): identifier the user in the query
+                file (bytes):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -451,13 +428,17 @@ class PolicyClient(OSDUAPIClient):
         if include_auth is not None:
             params["include_auth"] = include_auth
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/policy/v1/evaluations/query"
+        files = {
+            "file": file,
+        }
+
+        url = self._url("api/policy/v1/evaluations/query")
+        response = self._request(
+            "post", url, headers=headers, params=params, files=files
         )
-        response = requests.post(url, headers=headers, params=params)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def translate_policy_api(
         self,
@@ -490,9 +471,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -509,11 +488,11 @@ class PolicyClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, TranslateItem)
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/translate")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("api/policy/v1/translate")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_api_policy_v1_info(
         self,
@@ -535,19 +514,17 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
             headers["user-agent"] = user_agent
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/info")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_api_policy_v1_compile(
         self,
@@ -557,6 +534,7 @@ class PolicyClient(OSDUAPIClient):
         correlation_id: str | None = None,
         user_agent: str | None = None,
         x_user_id: str | None = None,
+        file: bytes,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -586,15 +564,14 @@ class PolicyClient(OSDUAPIClient):
                 correlation_id (str):
                 user_agent (str):
                 x_user_id (str): identifier the user in the query
+                file (bytes):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -608,11 +585,17 @@ class PolicyClient(OSDUAPIClient):
         if instrument is not None:
             params["instrument"] = instrument
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/compile")
-        response = requests.post(url, headers=headers, params=params)
+        files = {
+            "file": file,
+        }
+
+        url = self._url("api/policy/v1/compile")
+        response = self._request(
+            "post", url, headers=headers, params=params, files=files
+        )
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_tenant(
         self,
@@ -638,9 +621,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -652,11 +633,11 @@ class PolicyClient(OSDUAPIClient):
         if all_data is not None:
             params["all_data"] = all_data
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/tenant")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/policy/v1/tenant")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_tenant(
         self,
@@ -686,9 +667,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -704,11 +683,11 @@ class PolicyClient(OSDUAPIClient):
         if polling_max_delay_seconds is not None:
             params["polling_max_delay_seconds"] = polling_max_delay_seconds
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/tenant")
-        response = requests.put(url, headers=headers, params=params)
+        url = self._url("api/policy/v1/tenant")
+        response = self._request("put", url, headers=headers, params=params)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_tenant(
         self,
@@ -732,9 +711,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -742,11 +719,11 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/tenant")
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/policy/v1/tenant")
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_health(
         self,
@@ -772,19 +749,17 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
             headers["user-agent"] = user_agent
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/health")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/health")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ready(
         self,
@@ -814,19 +789,17 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
             headers["user-agent"] = user_agent
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/ready")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/ready")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def validate_policy(
         self,
@@ -836,6 +809,7 @@ class PolicyClient(OSDUAPIClient):
         correlation_id: str | None = None,
         user_agent: str | None = None,
         x_user_id: str | None = None,
+        file: bytes,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -853,15 +827,14 @@ class PolicyClient(OSDUAPIClient):
                 correlation_id (str):
                 user_agent (str):
                 x_user_id (str): identifier the user in the query
+                file (bytes):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -873,13 +846,17 @@ class PolicyClient(OSDUAPIClient):
         if template is not None:
             params["template"] = template
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/policy/v1/validate/%s" % policy_id
+        files = {
+            "file": file,
+        }
+
+        url = self._url("api/policy/v1/validate/%s" % policy_id)
+        response = self._request(
+            "put", url, headers=headers, params=params, files=files
         )
-        response = requests.put(url, headers=headers, params=params)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_backup(
         self,
@@ -906,9 +883,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -916,11 +891,11 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/backup")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/backup")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def bootstrap(
         self,
@@ -959,9 +934,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -973,11 +946,11 @@ class PolicyClient(OSDUAPIClient):
         if force is not None:
             params["force"] = force
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/bootstrap")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("api/policy/v1/bootstrap")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_api_policy_v1_config(
         self,
@@ -1001,9 +974,7 @@ class PolicyClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if correlation_id is not None:
             headers["correlation-id"] = correlation_id
         if user_agent is not None:
@@ -1011,8 +982,8 @@ class PolicyClient(OSDUAPIClient):
         if x_user_id is not None:
             headers["x-user-id"] = x_user_id
 
-        url = urljoin(self.base_url, self.service_path, "api/policy/v1/config")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/policy/v1/config")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PolicyAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+from typing import Any, Iterable
+
+from osdu_client.cache import DEFAULT_MAX_ENTRIES, TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+from .client import PolicyClient
+
+DEFAULT_DECISION_TTL = 60.0
+
+
+def input_hash(policy_input: Any) -> str:
+    """Returns a hash of a policy input which does not depend on the order of object keys."""
+    normalized = json.dumps(policy_input, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+class PolicyDecisionCache:
+    """Evaluates policies through the Policy service and memoises decisions for ttl seconds.
+
+    Decisions are keyed by policy id, user and the hash of the normalised input, so repeated evaluations within
+    a job do not leave the process. evaluate_many deduplicates inputs and evaluates the distinct ones which are
+    not cached concurrently. Concurrent evaluations of the same input share one request.
+    """
+
+    def __init__(
+        self,
+        policy_client: PolicyClient,
+        ttl: float = DEFAULT_DECISION_TTL,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        data_partition_id: str | None = None,
+    ):
+        self.policy_client = policy_client
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+        self._cache = TTLCache(ttl, max_entries)
+
+    def evaluate(
+        self,
+        policy_id: str,
+        policy_input: Any,
+        *,
+        include_auth: bool | None = None,
+        x_user_id: str | None = None,
+        correlation_id: str | None = None,
+        user_agent: str | None = None,
+    ) -> dict:
+        """Returns the decision of a policy for one input, from the cache when possible.
+        Args:
+            policy_id (str): policy to evaluate, e.g. "osdu/partition/opendes/dataauthz.rego".
+            policy_input (Any): value sent as "input" of the evaluation.
+            include_auth (bool): let the service add token, user and partition from the request headers.
+            x_user_id (str): identifier of the user the decision is made for.
+            correlation_id (str): correlation id of the request, not part of the cache key.
+            user_agent (str): user agent of the request, not part of the cache key.
+        Returns:
+            response data (dict), a copy which callers may modify
+        """
+        decision = self._decision(policy_id, policy_input, include_auth, x_user_id, correlation_id, user_agent)
+        return copy.deepcopy(decision)
+
+    def evaluate_many(
+        self,
+        policy_id: str,
+        policy_inputs: Iterable[Any],
+        *,
+        include_auth: bool | None = None,
+        x_user_id: str | None = None,
+        correlation_id: str | None = None,
+        user_agent: str | None = None,
+    ) -> list[dict]:
+        """Returns copies of decisions for many inputs, in order. Each distinct input is evaluated at most once."""
+        policy_inputs = list(policy_inputs)
+        distinct = {}
+        for policy_input in policy_inputs:
+            distinct.setdefault(input_hash(policy_input), policy_input)
+        decisions = map_concurrently(
+            lambda policy_input: self._decision(
+                policy_id, policy_input, include_auth, x_user_id, correlation_id, user_agent
+            ),
+            distinct.values(),
+            max_workers=self.max_workers,
+        )
+        by_hash = dict(zip(distinct, decisions))
+        return [copy.deepcopy(by_hash[input_hash(policy_input)]) for policy_input in policy_inputs]
+
+    def clear(self):
+        """Drops all decisions, e.g. after a policy was updated."""
+        self._cache.clear()
+
+    def _decision(
+        self,
+        policy_id: str,
+        policy_input: Any,
+        include_auth: bool | None,
+        x_user_id: str | None,
+        correlation_id: str | None,
+        user_agent: str | None,
+    ) -> dict:
+        # Returns the cached dict itself, the public methods copy it.
+        key = (policy_id, include_auth, x_user_id, input_hash(policy_input))
+        return self._cache.get_or_load(
+            key,
+            lambda: self.policy_client.evaluate_policy(
+                policy_id=policy_id,
+                include_auth=include_auth,
+                correlation_id=correlation_id,
+                user_agent=user_agent,
+                x_user_id=x_user_id,
+                file=self.policy_client.json_codec.dumps({"input": policy_input}),
+                data_partition_id=self.data_partition_id,
+            ),
+        )
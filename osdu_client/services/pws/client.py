@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import StatusDto
@@ -28,15 +25,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects")
-        response = requests.get(url, headers=headers)
+        url = self._url("projects")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_project(self, data_partition_id: str | None = None) -> dict:
         """
@@ -49,15 +44,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects")
-        response = requests.post(url, headers=headers)
+        url = self._url("projects")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def change_projects_status(
         self,
@@ -78,9 +71,7 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if status is not None:
@@ -89,11 +80,11 @@ class PWSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, StatusDto)
 
-        url = urljoin(self.base_url, self.service_path, "projects/%s/status" % id)
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("projects/%s/status" % id)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_project_resources(
         self, *, id: str, data_partition_id: str | None = None
@@ -109,15 +100,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects/%s/resources" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("projects/%s/resources" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def assign_projects_resources(
         self, *, id: str, data_partition_id: str | None = None
@@ -133,15 +122,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects/%s/resources" % id)
-        response = requests.post(url, headers=headers)
+        url = self._url("projects/%s/resources" % id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_projects_resources(
         self, *, id: str, data_partition_id: str | None = None
@@ -157,15 +144,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects/%s/resources" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("projects/%s/resources" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_projects_lifecycleevent(
         self, *, id: str, data_partition_id: str | None = None
@@ -181,17 +166,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "projects/%s/lifecycleevent" % id
-        )
-        response = requests.get(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("projects/%s/lifecycleevent" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def assign_projects_lifecycleevent(
         self, *, id: str, data_partition_id: str | None = None
@@ -207,17 +188,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "projects/%s/lifecycleevent" % id
-        )
-        response = requests.post(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("projects/%s/lifecycleevent" % id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_projects_lifecycleevent(
         self, *, id: str, data_partition_id: str | None = None
@@ -233,17 +210,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "projects/%s/lifecycleevent" % id
-        )
-        response = requests.delete(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("projects/%s/lifecycleevent" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_project(self, *, id: str, data_partition_id: str | None = None) -> dict:
         """
@@ -257,15 +230,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "projects/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("projects/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_projects_wip_resources(
         self, *, id: str, data_partition_id: str | None = None
@@ -281,17 +252,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "projects/%s/wip-resources" % id
-        )
-        response = requests.get(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("projects/%s/wip-resources" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -304,15 +271,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_readiness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -325,15 +290,13 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/readiness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/readiness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -346,12 +309,10 @@ class PWSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "_ah/liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("_ah/liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise PWSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 
 
 class RAFSAPIError(OSDUAPIError):
@@ -25,15 +22,13 @@ class RAFSCommonClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "metrics")
-        response = requests.get(url, headers=headers)
+        url = self._url("metrics")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -49,12 +44,10 @@ class RAFSCommonClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/info")
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
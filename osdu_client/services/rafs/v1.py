@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.rafs.common import RAFSCommonClient
-from osdu_client.utils import urljoin
 
 
 class RAFSAPIError(OSDUAPIError):
@@ -39,9 +36,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -51,16 +46,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/rocksampleanalyses/%s/rca/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_rock_sample_analysis_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -76,19 +69,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s/rca/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses/%s/rca/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rock_sample_source_data(
         self,
@@ -122,23 +109,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s/rca/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses/%s/rca/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rock_sample_analysis_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -154,19 +135,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_rock_sample_analysis_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -182,19 +157,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_rock_sample_analysis_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -210,19 +179,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_rock_sample_analysis_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -239,44 +202,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksampleanalyses/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/rocksampleanalyses/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_rock_sample_analysis_record(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `RockSampleAnalysis` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/rocksampleanalyses"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/rocksampleanalyses")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_coring_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -292,19 +250,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/coringreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/coringreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_coring_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -320,19 +272,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/coringreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/coringreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_coring_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -348,19 +294,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/coringreports/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/coringreports/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_coring_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -377,44 +317,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/coringreports/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/coringreports/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_coring_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `Coring` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/coringreports"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/coringreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rock_sample_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -430,19 +365,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksamples/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksamples/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_rock_sample_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -458,19 +387,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksamples/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksamples/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rock_sample_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -486,19 +409,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksamples/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksamples/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rock_sample_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -515,42 +432,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rocksamples/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/rocksamples/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_rock_sample_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `RockSample` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/v1/rocksamples")
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rocksamples")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -566,19 +480,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/pvtreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/pvtreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_pvt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -594,19 +502,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/pvtreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/pvtreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -622,19 +524,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/pvtreports/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/pvtreports/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -651,42 +547,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/pvtreports/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/pvtreports/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_pvt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `PVT` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/v1/pvtreports")
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/pvtreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record_source_data(
         self,
@@ -707,23 +600,17 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/pvtreports/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/pvtreports/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cce_data(
         self,
@@ -750,9 +637,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -762,15 +647,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/ccereports/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_cce_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -786,19 +669,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/ccereports/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cce_source_data(
         self,
@@ -832,23 +709,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/ccereports/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cce_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -864,19 +735,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/ccereports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_cce_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -892,19 +757,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/ccereports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cce_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -920,19 +779,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/ccereports/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cce_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -949,42 +802,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/ccereports/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/ccereports/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_cce_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `ConstantCompositionExpansionTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/v1/ccereports")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/ccereports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_difflib_data(
         self,
@@ -1011,9 +861,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -1023,15 +871,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/difflibreports/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_difflib_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1047,19 +893,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/difflibreports/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_difflib_source_data(
         self,
@@ -1093,23 +933,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/difflibreports/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_difflib_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1125,19 +959,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/difflibreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_difflib_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1153,19 +981,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/difflibreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_difflib_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1181,19 +1003,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/difflibreports/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_difflib_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -1210,44 +1026,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/difflibreports/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/difflibreports/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_difflib_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `DifferentialLiberationTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/difflibreports"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/difflibreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_transporttest_data(
         self,
@@ -1274,9 +1085,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -1286,15 +1095,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/transporttests/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_transporttest_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1310,19 +1117,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/transporttests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_transporttest_source_data(
         self,
@@ -1356,23 +1157,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/transporttests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_transporttest_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1388,19 +1183,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/transporttests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_transporttest_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1416,19 +1205,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/transporttests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_transporttest_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1444,19 +1227,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/transporttests/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_transporttest_record_specific_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -1473,44 +1250,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/transporttests/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/transporttests/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_transporttest_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `TransportTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/transporttests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/transporttests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_compositionalanalysis_data(
         self,
@@ -1537,9 +1309,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -1549,16 +1319,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/compositionalanalysisreports/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_compositionalanalysis_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1574,19 +1342,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/compositionalanalysisreports/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_compositionalanalysis_source_data(
         self,
@@ -1620,23 +1384,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/compositionalanalysisreports/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_compositionalanalysis_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1652,19 +1412,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/compositionalanalysisreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_compositionalanalysis_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1680,19 +1434,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/compositionalanalysisreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_compositionalanalysis_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1708,19 +1456,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/compositionalanalysisreports/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_compositionalanalysis_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -1737,47 +1481,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/compositionalanalysisreports/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_compositionalanalysis_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `CompositionAnalysisTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/compositionalanalysisreports",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/compositionalanalysisreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_multistageseparatortests_data(
         self,
@@ -1804,9 +1541,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -1816,16 +1551,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/multistageseparatortests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_multistageseparatortests_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1841,19 +1574,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/multistageseparatortests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_multistageseparatortests_source_data(
         self,
@@ -1887,23 +1614,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multistageseparatortests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_multistageseparatortests_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1919,19 +1642,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/multistageseparatortests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_multistageseparatortests_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1947,19 +1664,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/multistageseparatortests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_multistageseparatortests_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1975,19 +1686,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multistageseparatortests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_multistageseparatortests_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -2004,47 +1711,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/multistageseparatortests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def post_multistageseparatortests_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `MultiStageSeparatorTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multistageseparatortests",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/multistageseparatortests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_swellingtests_data(
         self,
@@ -2071,9 +1771,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -2083,15 +1781,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/swellingtests/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_swellingtests_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2107,19 +1803,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/swellingtests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_swellingtests_source_data(
         self,
@@ -2153,23 +1843,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/swellingtests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_swellingtests_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2185,19 +1869,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/swellingtests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_swellingtests_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2213,19 +1891,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/swellingtests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_swellingtests_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2241,19 +1913,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/swellingtests/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_swellingtests_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -2270,44 +1936,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/swellingtests/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/swellingtests/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_swellingtests_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `SwellingTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/swellingtests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/swellingtests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cvdt_data(
         self,
@@ -2334,9 +1995,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -2346,16 +2005,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/constantvolumedepletiontests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_cvdt_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2371,19 +2028,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cvdt_source_data(
         self,
@@ -2417,23 +2070,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cvdt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2449,19 +2098,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/constantvolumedepletiontests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_cvdt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2477,19 +2120,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/constantvolumedepletiontests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cvdt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2505,19 +2142,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/constantvolumedepletiontests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cvdt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -2534,47 +2167,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/constantvolumedepletiontests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_cvdt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `ConstantVolumeDepletionTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/constantvolumedepletiontests",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/constantvolumedepletiontests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wat_data(
         self,
@@ -2601,9 +2227,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -2613,16 +2237,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s/data/%s"
-            % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/wateranalysisreports/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_wat_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2638,19 +2259,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wat_source_data(
         self,
@@ -2684,23 +2299,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wat_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2716,19 +2325,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_wat_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2744,19 +2347,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wat_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2772,19 +2369,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/wateranalysisreports/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wat_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -2801,45 +2392,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/wateranalysisreports/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_wat_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `WaterAnalysisTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/wateranalysisreports"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/wateranalysisreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stoat_data(
         self,
@@ -2866,9 +2452,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -2878,16 +2462,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_stoat_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2903,19 +2485,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stoat_source_data(
         self,
@@ -2949,23 +2527,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stoat_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -2981,19 +2555,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/stocktankoilanalysisreports/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_stoat_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3009,19 +2577,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/stocktankoilanalysisreports/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_stoat_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3037,19 +2599,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stoat_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -3066,47 +2624,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/stocktankoilanalysisreports/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_stoat_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `StockTankOilAnalysisTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/stocktankoilanalysisreports",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/stocktankoilanalysisreports")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_itt_data(
         self,
@@ -3133,9 +2684,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -3145,16 +2694,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/interfacialtensiontests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_itt_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3170,19 +2717,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/interfacialtensiontests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/interfacialtensiontests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_itt_source_data(
         self,
@@ -3216,23 +2757,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/interfacialtensiontests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/interfacialtensiontests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_itt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3248,19 +2785,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/interfacialtensiontests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/interfacialtensiontests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_itt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3276,19 +2807,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/interfacialtensiontests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/interfacialtensiontests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_itt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3304,19 +2829,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/interfacialtensiontests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/interfacialtensiontests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_itt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -3333,45 +2854,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/interfacialtensiontests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_itt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `InterfacialTensionTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/interfacialtensiontests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/interfacialtensiontests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_vlet_data(
         self,
@@ -3398,9 +2914,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -3410,16 +2924,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_vlet_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3435,19 +2947,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_vlet_source_data(
         self,
@@ -3481,23 +2989,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_vlet_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3513,19 +3017,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/vaporliquidequilibriumtests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_vlet_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3541,19 +3039,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/vaporliquidequilibriumtests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_vlet_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3569,19 +3061,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_vlet_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -3598,47 +3086,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/vaporliquidequilibriumtests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_vlet_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `VaporLiquidEquilibriumTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/vaporliquidequilibriumtests",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/vaporliquidequilibriumtests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_mcmt_data(
         self,
@@ -3665,9 +3146,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -3677,16 +3156,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_mcmt_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3702,19 +3179,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_mcmt_source_data(
         self,
@@ -3748,23 +3221,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_mcmt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3780,19 +3249,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_mcmt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3808,19 +3273,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s" % record_id
         )
-        response = requests.delete(url, headers=headers)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_mcmt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3836,19 +3297,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_mcmt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -3865,47 +3322,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/multiplecontactmiscibilitytests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_mcmt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `MultipleContactMiscibilityTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/multiplecontactmiscibilitytests",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/multiplecontactmiscibilitytests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stt_data(
         self,
@@ -3932,9 +3382,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -3944,15 +3392,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/slimtubetests/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_stt_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -3968,19 +3414,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/slimtubetests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stt_source_data(
         self,
@@ -4014,23 +3454,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/slimtubetests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4046,19 +3480,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/slimtubetests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_stt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4074,19 +3502,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/slimtubetests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4102,19 +3524,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/slimtubetests/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_stt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -4131,44 +3547,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/slimtubetests/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/slimtubetests/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_stt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `SlimTubeTest` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/slimtubetests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/slimtubetests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4184,19 +3595,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/samplesanalysesreport/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/samplesanalysesreport/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_sar_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4212,19 +3617,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/samplesanalysesreport/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/samplesanalysesreport/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_sar_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4240,19 +3639,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/samplesanalysesreport/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/samplesanalysesreport/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -4269,45 +3664,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/samplesanalysesreport/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_sar_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `SamplesAnalysesReport` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/samplesanalysesreport"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/samplesanalysesreport")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_source_data(
         self,
@@ -4341,23 +3731,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/samplesanalysesreport/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/samplesanalysesreport/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cp_data(
         self,
@@ -4384,9 +3768,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -4396,16 +3778,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/capillarypressuretests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_cp_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4421,19 +3801,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/capillarypressuretests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/capillarypressuretests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cp_source_data(
         self,
@@ -4467,23 +3841,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/capillarypressuretests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/capillarypressuretests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4499,19 +3867,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/capillarypressuretests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/capillarypressuretests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_cp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4527,19 +3889,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/capillarypressuretests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/capillarypressuretests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cp_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4555,19 +3911,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/capillarypressuretests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/capillarypressuretests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_cp_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -4584,43 +3936,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/capillarypressuretests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_cp_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_cp_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `CapPressure` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/capillarypressuretests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/capillarypressuretests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4636,19 +3985,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/relativepermeabilitytests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_rp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4664,19 +4007,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/relativepermeabilitytests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rp_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4692,19 +4029,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/relativepermeabilitytests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rp_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -4721,45 +4054,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/relativepermeabilitytests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_rp_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_rp_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `RelativePermeability` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/relativepermeabilitytests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rp_data(
         self,
@@ -4786,9 +4114,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -4798,16 +4124,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/relativepermeabilitytests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_rp_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4823,19 +4147,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/relativepermeabilitytests/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rp_source_data(
         self,
@@ -4869,23 +4189,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/relativepermeabilitytests/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/relativepermeabilitytests/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ft_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4901,19 +4217,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/fractionationtests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_ft_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4929,19 +4239,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/fractionationtests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ft_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -4957,19 +4261,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/fractionationtests/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ft_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -4986,42 +4284,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/fractionationtests/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_ft_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_ft_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `Fractionation` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/fractionationtests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/fractionationtests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ft_data(
         self,
@@ -5048,9 +4343,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -5060,15 +4353,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/fractionationtests/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_ft_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5084,19 +4375,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/fractionationtests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ft_source_data(
         self,
@@ -5130,23 +4415,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/fractionationtests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/fractionationtests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_et_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5162,19 +4441,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/extractiontests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_et_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5190,19 +4463,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/extractiontests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_et_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5218,19 +4485,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/extractiontests/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_et_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -5247,42 +4508,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v1/extractiontests/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_er_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_er_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `Extraction` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/extractiontests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/extractiontests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_et_data(
         self,
@@ -5309,9 +4567,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -5321,15 +4577,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s/data/%s" % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/extractiontests/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_et_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5345,19 +4599,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/extractiontests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_et_source_data(
         self,
@@ -5391,23 +4639,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/extractiontests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/extractiontests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_physchem_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5423,19 +4665,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/physicalchemistrytests/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/physicalchemistrytests/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_physchem_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5451,19 +4687,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/physicalchemistrytests/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/physicalchemistrytests/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_physchem_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5479,19 +4709,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/physicalchemistrytests/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/physicalchemistrytests/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_physchem_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -5508,45 +4734,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/physicalchemistrytests/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_physchem_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `PhysChem` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/physicalchemistrytests"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/physicalchemistrytests")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_physchem_data(
         self,
@@ -5573,9 +4794,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -5585,16 +4804,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/physicalchemistrytests/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_physchem_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5610,19 +4827,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/physicalchemistrytests/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/physicalchemistrytests/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_physchem_source_data(
         self,
@@ -5656,23 +4867,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/physicalchemistrytests/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/physicalchemistrytests/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ep_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5688,19 +4893,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/electricalproperties/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_ep_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5716,19 +4915,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/electricalproperties/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ep_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5744,19 +4937,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/electricalproperties/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ep_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -5773,43 +4960,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/electricalproperties/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_ep_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_ep_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `ElectricalProperties` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/electricalproperties"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/electricalproperties")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ep_data(
         self,
@@ -5836,9 +5020,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -5848,16 +5030,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s/data/%s"
-            % (record_id, dataset_id),
+        url = self._url(
+            "api/rafs-ddms/v1/electricalproperties/%s/data/%s" % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_ep_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5873,19 +5052,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/electricalproperties/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_ep_source_data(
         self,
@@ -5919,23 +5092,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/electricalproperties/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/electricalproperties/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rc_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5951,19 +5118,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rockcompressibilities/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rockcompressibilities/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_rc_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -5979,19 +5140,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rockcompressibilities/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rockcompressibilities/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_rc_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6007,19 +5162,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rockcompressibilities/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/rockcompressibilities/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rc_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -6036,43 +5187,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/rockcompressibilities/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_rc_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_rc_records(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `RockCompressibility` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v1/rockcompressibilities"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/rockcompressibilities")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rc_data(
         self,
@@ -6099,9 +5247,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -6111,16 +5257,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/rockcompressibilities/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_rc_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6136,19 +5280,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rockcompressibilities/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/rockcompressibilities/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_rc_source_data(
         self,
@@ -6182,23 +5320,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/rockcompressibilities/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v1/rockcompressibilities/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wgrp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6214,19 +5346,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_wgrp_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6242,19 +5370,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s" % record_id
         )
-        response = requests.delete(url, headers=headers)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wgrp_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6270,19 +5394,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wgrp_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -6299,47 +5419,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_wgrp_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `WaterGasRelativePermeability` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/watergasrelativepermeabilities")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wgrp_data(
         self,
@@ -6366,9 +5479,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -6378,16 +5489,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_wgrp_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6403,19 +5512,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wgrp_source_data(
         self,
@@ -6449,23 +5554,19 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/watergasrelativepermeabilities/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fri_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6481,19 +5582,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/formationresistivityindexes/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_fri_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6509,19 +5604,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v1/formationresistivityindexes/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fri_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6537,19 +5626,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/formationresistivityindexes/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fri_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -6566,47 +5651,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/formationresistivityindexes/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_fri_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `FormationResistivityIndex` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes",
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v1/formationresistivityindexes")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fri_data(
         self,
@@ -6633,9 +5711,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -6645,16 +5721,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v1/formationresistivityindexes/%s/data/%s"
-            % (record_id, dataset_id),
+            % (record_id, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_fri_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -6670,19 +5744,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes/%s/data" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/formationresistivityindexes/%s/data" % record_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_fri_source_data(
         self,
@@ -6716,20 +5786,16 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v1/formationresistivityindexes/%s/source" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v1/formationresistivityindexes/%s/source" % record_id
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.rafs.common import RAFSCommonClient
-from osdu_client.utils import urljoin
 
 
 class RAFSAPIError(OSDUAPIError):
@@ -28,19 +25,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysesreport/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysesreport/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_sar_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -56,19 +47,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysesreport/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysesreport/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -84,19 +69,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysesreport/%s/versions" % record_id,
+        url = self._url(
+            "api/rafs-ddms/v2/samplesanalysesreport/%s/versions" % record_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_record_specific_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -113,45 +94,40 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v2/samplesanalysesreport/%s/versions/%s"
-            % (version, record_id),
+            % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_sar_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `SamplesAnalysesReport` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v2/samplesanalysesreport"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v2/samplesanalysesreport")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sar_source_data(
         self,
@@ -185,23 +161,17 @@ class RAFSClient(RAFSCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if version is not None:
             params["version"] = version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysesreport/%s/source" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v2/samplesanalysesreport/%s/source" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_types(self, data_partition_id: str | None = None) -> dict:
         """
@@ -214,19 +184,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/analysistypes",
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysis/analysistypes")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -242,19 +206,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysis/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_sa_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -270,19 +228,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysis/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -298,19 +250,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/samplesanalysis/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -327,42 +273,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v2/samplesanalysis/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_sa_records(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_sa_records(
+        self, *, body: list[dict] | None = None, data_partition_id: str | None = None
+    ) -> dict:
         """
         Create or update `SamplesAnalysis` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]): SamplesAnalysis records payload
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v2/samplesanalysis"
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v2/samplesanalysis")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_content_schema(
         self, *, analysistype: str, data_partition_id: str | None = None
@@ -378,19 +321,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/data/schema" % analysistype,
+        url = self._url(
+            "api/rafs-ddms/v2/samplesanalysis/%s/data/schema" % analysistype
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_sa_data(
         self,
@@ -419,9 +358,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -431,16 +368,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v2/samplesanalysis/%s/data/%s/%s"
-            % (record_id, analysis_type, dataset_id),
+            % (record_id, analysis_type, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_sa_data(
         self,
@@ -461,19 +396,15 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/data/%s" % (record_id, analysis_type),
+        url = self._url(
+            "api/rafs-ddms/v2/samplesanalysis/%s/data/%s" % (record_id, analysis_type)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def search_sa_data(
         self,
@@ -498,9 +429,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -510,15 +439,13 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/search/data" % analysis_type,
+        url = self._url(
+            "api/rafs-ddms/v2/samplesanalysis/%s/search/data" % analysis_type
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_sa(
         self,
@@ -543,9 +470,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -555,15 +480,11 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/samplesanalysis/%s/search" % analysis_type,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("api/rafs-ddms/v2/samplesanalysis/%s/search" % analysis_type)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_masterdata_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -579,19 +500,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/masterdata/%s" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/masterdata/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_masterdata_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -607,19 +522,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/masterdata/%s" % record_id,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/masterdata/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_masterdata_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -635,19 +544,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/masterdata/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/masterdata/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_masterdata_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -664,42 +567,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/masterdata/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v2/masterdata/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_masterdata_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict] | None = None, data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `(osdu:wks:master-data--GenericFacility:1.0.0|osdu:wks:master-data--GenericSite:1.0.0|osdu:wks:master-data--Sample:2.0.0|osdu:wks:master-data--SampleAcquisitionJob:1.0.0|osdu:wks:master-data--SampleChainOfCustodyEvent:1.0.0|osdu:wks:master-data--SampleContainer:1.0.0)` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]): Master Data records payload
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/v2/masterdata")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("api/rafs-ddms/v2/masterdata")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -715,17 +615,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v2/pvtmodel/%s" % record_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/pvtmodel/%s" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def soft_delete_pvt_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -741,17 +637,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "api/rafs-ddms/v2/pvtmodel/%s" % record_id
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/pvtmodel/%s" % record_id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record_versions(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -767,19 +659,13 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/pvtmodel/%s/versions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/pvtmodel/%s/versions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_record_version(
         self, *, version: str, record_id: str, data_partition_id: str | None = None
@@ -796,42 +682,39 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/pvtmodel/%s/versions/%s" % (version, record_id),
+        url = self._url(
+            "api/rafs-ddms/v2/pvtmodel/%s/versions/%s" % (version, record_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_pvt_records(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Create or update `(rafsddms:wks:work-product-component--MultiPhaseFlowMeterCalibration:1.0.0|rafsddms:wks:work-product-component--PVTModel:1.0.0|rafsddms:wks:work-product-component--ComponentScenario:1.0.0|rafsddms:wks:work-product-component--BlackOilTable:1.0.0)` record(s).        Required roles: `users.datalake.editors` or `users.datalake.admins`.         In addition, users must be members of a data group(ACL) to access the data.
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "api/rafs-ddms/v2/pvtmodel")
-        response = requests.post(url, headers=headers)
+        url = self._url("api/rafs-ddms/v2/pvtmodel")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_pvt_data(
         self,
@@ -860,9 +743,7 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if columns_filter is not None:
@@ -872,16 +753,14 @@ class RAFSClient(RAFSCommonClient):
         if columns_aggregation is not None:
             params["columns_aggregation"] = columns_aggregation
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "api/rafs-ddms/v2/pvtmodel/%s/data/%s/%s"
-            % (record_id, analysis_type, dataset_id),
+            % (record_id, analysis_type, dataset_id)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_pvt_data(
         self,
@@ -902,16 +781,12 @@ class RAFSClient(RAFSCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "api/rafs-ddms/v2/pvtmodel/%s/data/%s" % (record_id, analysis_type),
+        url = self._url(
+            "api/rafs-ddms/v2/pvtmodel/%s/data/%s" % (record_id, analysis_type)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise RAFSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
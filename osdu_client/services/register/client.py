@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CreateAction, Ddms, Record, Secret, Subscription, TestAction
@@ -29,15 +26,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_ddms(self, *, id: str, data_partition_id: str | None = None) -> dict:
         """
@@ -51,15 +46,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/%s" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/%s" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_ddms(
         self,
@@ -86,9 +79,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if id is not None:
@@ -105,11 +96,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Ddms)
 
-        url = urljoin(self.base_url, self.service_path, "ddms")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("ddms")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_ddms(self, *, type: str, data_partition_id: str | None = None) -> dict:
         """
@@ -123,19 +114,17 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "type": type,
         }
 
-        url = urljoin(self.base_url, self.service_path, "ddms")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_d(
         self, *, id: str, type: str, localid: str, data_partition_id: str | None = None
@@ -153,17 +142,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/%s/%s/%s" % (id, type, localid)
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/%s/%s/%s" % (id, type, localid))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_action(self, *, id: str, data_partition_id: str | None = None) -> dict:
         """
@@ -177,15 +162,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "action/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("action/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_action(self, *, id: str, data_partition_id: str | None = None) -> dict:
         """
@@ -199,15 +182,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "action/%s" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("action/%s" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_action(
         self,
@@ -238,9 +219,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if id is not None:
@@ -261,11 +240,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, CreateAction)
 
-        url = urljoin(self.base_url, self.service_path, "action")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("action")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_action_test(
         self,
@@ -286,9 +265,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if action is not None:
@@ -299,11 +276,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, TestAction)
 
-        url = urljoin(self.base_url, self.service_path, "action:test")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("action:test")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_action_get(
         self,
@@ -330,9 +307,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if id is not None:
@@ -349,11 +324,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Record)
 
-        url = urljoin(self.base_url, self.service_path, "action:retrieve")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("action:retrieve")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_subscription(
         self,
@@ -380,9 +355,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if name is not None:
@@ -399,11 +372,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Subscription)
 
-        url = urljoin(self.base_url, self.service_path, "subscription")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("subscription")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_subscription(
         self, *, id: str, data_partition_id: str | None = None
@@ -419,15 +392,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "subscription/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("subscription/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_subscription(
         self, *, id: str, data_partition_id: str | None = None
@@ -443,15 +414,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "subscription/%s" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("subscription/%s" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_subscription_secret(
         self,
@@ -474,9 +443,7 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if secret_type is not None:
@@ -487,11 +454,11 @@ class RegisterClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Secret)
 
-        url = urljoin(self.base_url, self.service_path, "subscription/%s/secret" % id)
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("subscription/%s/secret" % id)
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_topics(self, data_partition_id: str | None = None) -> dict:
         """
@@ -504,15 +471,13 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "topics")
-        response = requests.get(url, headers=headers)
+        url = self._url("topics")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -525,12 +490,10 @@ class RegisterClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise RegisterAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import SchemaRequest
@@ -32,9 +29,7 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "schemaInfo": schema_info,
@@ -44,11 +39,11 @@ class SchemaClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SchemaRequest)
 
-        url = urljoin(self.base_url, self.service_path, "schemas/system")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("schemas/system")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def search_schemas(
         self,
@@ -87,9 +82,7 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if authority is not None:
@@ -115,11 +108,11 @@ class SchemaClient(OSDUAPIClient):
         if offset is not None:
             params["offset"] = offset
 
-        url = urljoin(self.base_url, self.service_path, "schema")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("schema")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_schema(
         self, *, schema_info: dict, schema: dict, data_partition_id: str | None = None
@@ -136,9 +129,7 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "schemaInfo": schema_info,
@@ -148,11 +139,11 @@ class SchemaClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SchemaRequest)
 
-        url = urljoin(self.base_url, self.service_path, "schema")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("schema")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_schema(
         self, *, schema_info: dict, schema: dict, data_partition_id: str | None = None
@@ -169,9 +160,7 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "schemaInfo": schema_info,
@@ -181,11 +170,11 @@ class SchemaClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SchemaRequest)
 
-        url = urljoin(self.base_url, self.service_path, "schema")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("schema")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_schema(self, *, id: str, data_partition_id: str | None = None) -> dict:
         """
@@ -199,15 +188,13 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "schema/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("schema/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -220,15 +207,13 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -241,12 +226,10 @@ class SchemaClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SchemaAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -0,0 +1,195 @@
+from __future__ import annotations
+
+import json
+import math
+import os
+import threading
+from dataclasses import dataclass, field
+from urllib.parse import quote
+
+from osdu_client.cache import DEFAULT_MAX_ENTRIES, TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+from .client import SchemaClient
+
+DEFAULT_PAGE_SIZE = 100
+INDEX_FILE = "index.json"
+SCHEMAS_DIR = "schemas"
+# Schemas in development can be updated in place, the others only change by getting a new version or status.
+MUTABLE_STATUSES = ("DEVELOPMENT",)
+
+
+@dataclass
+class SchemaSyncResult:
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+
+def schema_version(info: dict) -> tuple[int, int, int]:
+    identity = info["schemaIdentity"]
+    return (
+        int(identity.get("schemaVersionMajor") or 0),
+        int(identity.get("schemaVersionMinor") or 0),
+        int(identity.get("schemaVersionPatch") or 0),
+    )
+
+
+def _entity_key(info: dict) -> tuple[str, str, str]:
+    identity = info["schemaIdentity"]
+    return identity.get("authority") or "", identity.get("source") or "", identity.get("entityType") or ""
+
+
+class SchemaMirror:
+    """Local copy of the schema registry kept in a directory, serving schema lookups without calling the service.
+
+        The directory holds index.json with the SchemaInfo of every schema and one file per schema body. sync lists
+        the registry with search_schemas, fetching all pages in parallel, and downloads only bodies of schemas which
+        are new, whose SchemaInfo changed (e.g. status) or whose status allows in-place updates. Schemas no longer
+        listed are removed. The index is written atomically after the bodies, so an interrupted sync is repeated.
+    """
+
+    def __init__(
+        self,
+        schema_client: SchemaClient,
+        path: str,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_size: int | None = DEFAULT_MAX_ENTRIES,
+        data_partition_id: str | None = None,
+    ):
+        self.schema_client = schema_client
+        self.path = path
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+
+        self._schemas = TTLCache(math.inf, cache_size)
+        self._lock = threading.Lock()
+        self._set_index(self._read_index())
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, kind: str) -> bool:
+        return kind in self._index
+
+    def sync(self) -> SchemaSyncResult:
+        """Brings the mirror up to date with the registry.
+            Returns:
+                SchemaSyncResult with ids of added, updated and removed schemas
+        """
+        infos = {info["schemaIdentity"]["id"]: info for info in self._list_infos()}
+        with self._lock:
+            index = self._index
+        result = SchemaSyncResult(
+            added=sorted(infos.keys() - index.keys()),
+            updated=sorted(
+                schema_id
+                for schema_id in infos.keys() & index.keys()
+                if infos[schema_id] != index[schema_id] or infos[schema_id].get("status") in MUTABLE_STATUSES
+            ),
+            removed=sorted(index.keys() - infos.keys()),
+        )
+
+        os.makedirs(os.path.join(self.path, SCHEMAS_DIR), exist_ok=True)
+        map_concurrently(self._download, result.added + result.updated, max_workers=self.max_workers)
+        self._write_json(os.path.join(self.path, INDEX_FILE), infos)
+        for schema_id in result.removed:
+            try:
+                os.remove(self._schema_path(schema_id))
+            except FileNotFoundError:
+                pass
+
+        with self._lock:
+            self._set_index(infos)
+        for schema_id in result.updated + result.removed:
+            self._schemas.invalidate(schema_id)
+        return result
+
+    def info(self, kind: str) -> dict | None:
+        return self._index.get(kind)
+
+    def get(self, kind: str) -> dict | None:
+        """Returns the mirrored schema of a kind, or None if the registry has no such schema."""
+        if kind not in self._index:
+            return None
+        return self._schemas.get_or_load(kind, lambda: self._read_json(self._schema_path(kind)))
+
+    def get_schema(self, *, id: str, data_partition_id: str | None = None) -> dict:
+        """Same as SchemaClient.get_schema, so the mirror can be used in its place, e.g. by RecordValidator.
+            Schemas missing from the mirror are fetched from the service.
+        """
+        schema = self.get(id)
+        if schema is None:
+            schema = self.schema_client.get_schema(id=id, data_partition_id=data_partition_id or self.data_partition_id)
+        return schema
+
+    def find(
+        self,
+        *,
+        authority: str | None = None,
+        source: str | None = None,
+        entity_type: str | None = None,
+        status: str | None = None,
+    ) -> list[dict]:
+        """Returns SchemaInfos matching all given fields, ordered by entity and version."""
+        with self._lock:
+            by_entity = self._by_entity
+        infos = []
+        for key in sorted(by_entity):
+            if all(
+                expected is None or value == expected for value, expected in zip(key, (authority, source, entity_type))
+            ):
+                infos += [info for info in by_entity[key] if status is None or info.get("status") == status]
+        return infos
+
+    def latest(self, authority: str, source: str, entity_type: str, status: str | None = None) -> str | None:
+        """Returns the id of the highest version of an entity type, optionally with the given status."""
+        infos = self.find(authority=authority, source=source, entity_type=entity_type, status=status)
+        return infos[-1]["schemaIdentity"]["id"] if infos else None
+
+    def _list_infos(self) -> list[dict]:
+        first_page = self._search_page(0)
+        offsets = range(self.page_size, first_page.get("totalCount") or 0, self.page_size)
+        pages = [first_page] + map_concurrently(self._search_page, offsets, max_workers=self.max_workers)
+        return [info for page in pages for info in page.get("schemaInfos") or []]
+
+    def _search_page(self, offset: int) -> dict:
+        return self.schema_client.search_schemas(
+            limit=str(self.page_size), offset=str(offset), data_partition_id=self.data_partition_id
+        )
+
+    def _download(self, schema_id: str):
+        schema = self.schema_client.get_schema(id=schema_id, data_partition_id=self.data_partition_id)
+        self._write_json(self._schema_path(schema_id), schema)
+
+    def _set_index(self, index: dict[str, dict]):
+        by_entity = {}
+        for info in index.values():
+            by_entity.setdefault(_entity_key(info), []).append(info)
+        for infos in by_entity.values():
+            infos.sort(key=schema_version)
+        self._index = index
+        self._by_entity = by_entity
+
+    def _read_index(self) -> dict[str, dict]:
+        index_path = os.path.join(self.path, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return {}
+        return self._read_json(index_path)
+
+    def _schema_path(self, schema_id: str) -> str:
+        return os.path.join(self.path, SCHEMAS_DIR, quote(schema_id, safe="") + ".json")
+
+    @staticmethod
+    def _read_json(path: str):
+        with open(path, encoding="utf-8") as file:
+            return json.load(file)
+
+    @staticmethod
+    def _write_json(path: str, data):
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(data, file)
+        os.replace(temporary_path, path)
@@ -0,0 +1,270 @@
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, Iterable, Iterator
+
+from osdu_client.cache import TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+from osdu_client.exceptions import OSDUClientError
+
+from .client import SchemaAPIError, SchemaClient
+
+DEFAULT_SEARCH_PAGE_SIZE = 100
+
+
+def _import_optional(name: str) -> Any:
+    try:
+        return import_module(name)
+    except ImportError as e:
+        raise ImportError(
+            f"Record validation requires package {name}, install osdu-client with the validation extra."
+        ) from e
+
+
+@dataclass(frozen=True)
+class ValidationIssue:
+    path: str
+    message: str
+
+
+@lru_cache(maxsize=None)
+def _ecma_regex(pattern: str) -> Any:
+    return _import_optional("regress").Regex(pattern)
+
+
+def _pattern(validator, pattern: str, instance: Any, schema: dict):
+    if validator.is_type(instance, "string") and _ecma_regex(pattern).find(instance) is None:
+        yield _import_optional("jsonschema").ValidationError(f"{instance!r} does not match {pattern!r}")
+
+
+def _pattern_properties(validator, pattern_properties: dict, instance: Any, schema: dict):
+    if not validator.is_type(instance, "object"):
+        return
+    for pattern, subschema in pattern_properties.items():
+        for name, value in instance.items():
+            if _ecma_regex(pattern).find(name) is not None:
+                yield from validator.descend(value, subschema, path=name, schema_path=pattern)
+
+
+def _additional_properties(validator, additional: Any, instance: Any, schema: dict):
+    if not validator.is_type(instance, "object"):
+        return
+    properties = schema.get("properties") or {}
+    patterns = [_ecma_regex(pattern) for pattern in schema.get("patternProperties") or {}]
+    extras = [
+        name
+        for name in instance
+        if name not in properties and not any(pattern.find(name) is not None for pattern in patterns)
+    ]
+    if validator.is_type(additional, "object"):
+        for name in extras:
+            yield from validator.descend(instance[name], additional, path=name)
+    elif additional is False and extras:
+        names = ", ".join(repr(name) for name in sorted(extras))
+        verb = "was" if len(extras) == 1 else "were"
+        yield _import_optional("jsonschema").ValidationError(
+            f"Additional properties are not allowed ({names} {verb} unexpected)"
+        )
+
+
+@lru_cache(maxsize=None)
+def _ecma_validator_class(validator_class: type) -> type:
+    # jsonschema matches regexes with Python re, JSON schema regexes follow ECMA-262.
+    return _import_optional("jsonschema").validators.extend(
+        validator_class,
+        {
+            "pattern": _pattern,
+            "patternProperties": _pattern_properties,
+            "additionalProperties": _additional_properties,
+        },
+    )
+
+
+class SchemaCompiler:
+    """Compiles an OSDU schema into a validator function using the jsonschema package (validation extra).
+
+        The JSON schema draft is taken from $schema, draft-07 by default, and regexes follow ECMA-262 (regress package).
+        References to other schemas, e.g. "osdu:wks:AbstractAccessControlList:1.0.0", are passed to load_document
+        by schema id and resolved when compiling, so validation does not make requests. Keywords which are not
+        validation keywords, such as the x-osdu-* annotations, and format are ignored. Invalid schemas, e.g. with
+        unknown type names, and unresolvable references are rejected with OSDUClientError.
+    """
+
+    def __init__(self, load_document: Callable[[str], dict] | None = None):
+        self.load_document = load_document
+
+    def compile(self, schema: dict) -> Callable[[Any], list[ValidationIssue]]:
+        jsonschema = _import_optional("jsonschema")
+        unresolvable = _import_optional("referencing.exceptions").Unresolvable
+        validator_class = _ecma_validator_class(jsonschema.validators.validator_for(schema, jsonschema.Draft7Validator))
+        documents = {"": schema, **self._load_references(schema)}
+        for document_id, document in documents.items():
+            try:
+                validator_class.check_schema(document)
+            except jsonschema.SchemaError as e:
+                name = f"Schema {document_id}" if document_id else "Schema"
+                raise OSDUClientError(f"{name} is invalid: {e.message}") from e
+
+        referencing = _import_optional("referencing")
+        specification = _import_optional("referencing.jsonschema").specification_with(
+            validator_class.META_SCHEMA["$schema"]
+        )
+        registry = referencing.Registry().with_resources(
+            (document_id, referencing.Resource.from_contents(document, default_specification=specification))
+            for document_id, document in documents.items()
+            if document_id
+        )
+        validator = validator_class(schema, registry=registry.crawl())
+
+        def validate(value: Any) -> list[ValidationIssue]:
+            try:
+                return [
+                    ValidationIssue("".join(f"/{name}" for name in error.absolute_path), error.message)
+                    for error in validator.iter_errors(value)
+                ]
+            except unresolvable as e:
+                raise OSDUClientError(f"Cannot resolve $ref {e.ref}.") from e
+
+        return validate
+
+    def _load_references(self, schema: dict) -> dict[str, dict]:
+        documents = {}
+        pending = [schema]
+        while pending:
+            for document_id in _external_refs(pending.pop()):
+                if document_id in documents:
+                    continue
+                if self.load_document is None:
+                    raise OSDUClientError(f"Cannot resolve $ref {document_id} without load_document.")
+                documents[document_id] = self.load_document(document_id)
+                pending.append(documents[document_id])
+        return documents
+
+
+def _external_refs(node: Any) -> Iterator[str]:
+    """Yields ids of documents referenced by a schema, "#/..." references within it are skipped."""
+    if isinstance(node, dict):
+        ref = node.get("$ref")
+        if isinstance(ref, str) and not ref.startswith("#"):
+            yield ref.partition("#")[0]
+        for value in node.values():
+            yield from _external_refs(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from _external_refs(value)
+
+
+class RecordValidator:
+    """Validates records locally against the schemas of their kinds, before they are sent to Storage.
+
+        The schema of a kind is fetched with get_schema (the schema id equals the kind), referenced schemas are
+        fetched the same way and shared between kinds. Compiled validators are cached per kind for ttl seconds,
+        by default forever since published schemas do not change.
+    """
+
+    def __init__(
+        self,
+        schema_client: SchemaClient,
+        ttl: float = math.inf,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        data_partition_id: str | None = None,
+    ):
+        self.schema_client = schema_client
+        self.max_workers = max_workers
+        self.data_partition_id = data_partition_id
+        self._documents = TTLCache(ttl, max_entries=None)
+        self._validators = TTLCache(ttl, max_entries=None)
+
+    def validator(self, kind: str) -> Callable[[Any], list[ValidationIssue]]:
+        """Returns the compiled validator of a kind, which returns the list of issues of a record."""
+        return self._validators.get_or_load(kind, lambda: SchemaCompiler(self._document).compile(self._document(kind)))
+
+    def prefetch(self, kinds: Iterable[str] | None = None, **search_kwargs) -> list[str]:
+        """Compiles validators of kinds, or of all schemas found by search_schemas with search_kwargs, in parallel.
+            Args:
+                kinds (Iterable[str]): kinds to prepare.
+                **search_kwargs: search_schemas filters used when kinds is None, e.g. authority or latest_version.
+            Returns:
+                list of prepared kinds
+        """
+        kinds = list(kinds) if kinds is not None else self._search_kinds(search_kwargs)
+        map_concurrently(self.validator, kinds, max_workers=self.max_workers)
+        return kinds
+
+    def validate(self, record: dict) -> list[ValidationIssue]:
+        """Returns issues of a record. A record without a kind, or of a kind without a schema, has an issue at /kind."""
+        if not record.get("kind"):
+            return [ValidationIssue("/kind", "Record has no kind.")]
+        if not self._kind_exists(record["kind"]):
+            return [_unknown_kind(record["kind"])]
+        return self.validator(record["kind"])(record)
+
+    def validate_records(self, records: Iterable[dict]) -> dict[int, list[ValidationIssue]]:
+        """Validates records, fetching missing schemas of their kinds in parallel first.
+            Args:
+                records (Iterable[dict]): records to check, e.g. a batch for update_records.
+            Returns:
+                dict mapping positions of invalid records to their issues
+        """
+        records = list(records)
+        kinds = list({record["kind"] for record in records if record.get("kind")})
+        known = map_concurrently(self._prepare, kinds, max_workers=self.max_workers)
+        unknown = {kind for kind, exists in zip(kinds, known) if not exists}
+        results = {}
+        for position, record in enumerate(records):
+            issues = [_unknown_kind(record["kind"])] if record.get("kind") in unknown else self.validate(record)
+            if issues:
+                results[position] = issues
+        return results
+
+    def invalidate(self, kind: str | None = None):
+        """Drops the validator of a kind, or all cached schemas and validators when kind is None."""
+        if kind is None:
+            self._documents.clear()
+            self._validators.clear()
+        else:
+            self._documents.invalidate(kind)
+            self._validators.invalidate(kind)
+
+    def _prepare(self, kind: str) -> bool:
+        if not self._kind_exists(kind):
+            return False
+        self.validator(kind)
+        return True
+
+    def _kind_exists(self, kind: str) -> bool:
+        try:
+            self._document(kind)
+        except SchemaAPIError as e:
+            if len(e.args) > 1 and e.args[1] == 404:
+                return False
+            raise
+        return True
+
+    def _document(self, schema_id: str) -> dict:
+        return self._documents.get_or_load(
+            schema_id, lambda: self.schema_client.get_schema(id=schema_id, data_partition_id=self.data_partition_id)
+        )
+
+    def _search_kinds(self, search_kwargs: dict) -> list[str]:
+        kinds = []
+        offset = 0
+        while True:
+            response = self.schema_client.search_schemas(
+                limit=str(DEFAULT_SEARCH_PAGE_SIZE),
+                offset=str(offset),
+                data_partition_id=self.data_partition_id,
+                **search_kwargs,
+            )
+            infos = response.get("schemaInfos") or []
+            kinds += [info["schemaIdentity"]["id"] for info in infos]
+            offset += len(infos)
+            if not infos or offset >= response.get("totalCount", 0):
+                return kinds
+
+
+def _unknown_kind(kind: str) -> ValidationIssue:
+    return ValidationIssue("/kind", f"Kind {kind} has no schema.")
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import (DatasetBulkDeleteBody, DatasetCheckList, DatasetListBody, DatasetLsBody, DatasetPatch,
@@ -30,15 +27,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "svcstatus")
-        response = requests.get(url, headers=headers)
+        url = self._url("svcstatus")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_svcstatus_access(self, data_partition_id: str | None = None) -> dict:
         """
@@ -51,15 +46,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "svcstatus/access")
-        response = requests.get(url, headers=headers)
+        url = self._url("svcstatus/access")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -72,15 +65,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def register_new_dataset(
         self,
@@ -121,9 +112,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
         if ltag is not None:
@@ -150,16 +139,16 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetRegisterBody)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
+        )
+        response = self._request(
+            "post", url, headers=headers, params=params, json=request_data
         )
-        response = requests.post(url, headers=headers, params=params, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dataset(
         self,
@@ -192,9 +181,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -208,16 +195,14 @@ class SDMSClient(OSDUAPIClient):
         if record_version is not None:
             params["record-version"] = record_version
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_dataset(
         self,
@@ -244,9 +229,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -254,16 +237,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.delete(url, headers=headers, params=params)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_dataset_metadata(
         self,
@@ -334,9 +315,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -375,18 +354,16 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetPatch)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.patch(
-            url, headers=headers, params=params, json=request_data
+        response = self._request(
+            "patch", url, headers=headers, params=params, json=request_data
         )
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def acquire_lock_for_dataset(
         self,
@@ -433,9 +410,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -447,16 +422,14 @@ class SDMSClient(OSDUAPIClient):
         if wid is not None:
             params["wid"] = wid
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/lock"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.put(url, headers=headers, params=params)
+        response = self._request("put", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def remove_lock_associated_with_dataset(
         self,
@@ -492,9 +465,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -502,16 +473,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/unlock"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.put(url, headers=headers, params=params)
+        response = self._request("put", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dataset_access_permissions(
         self,
@@ -547,9 +516,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -557,16 +524,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/permission"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def validate_ctag(
         self,
@@ -595,9 +560,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -607,16 +570,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/ctagcheck"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upsert_tags_to_dataset(
         self,
@@ -654,9 +615,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -666,16 +625,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/gtags"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.put(url, headers=headers, params=params)
+        response = self._request("put", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def compute_and_get_size_dataset(
         self,
@@ -705,9 +662,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -715,16 +670,14 @@ class SDMSClient(OSDUAPIClient):
             "path": path,
         }
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/dataset/%s/size"
-            % (tenantid, subprojectid, datasetid),
+            % (tenantid, subprojectid, datasetid)
         )
-        response = requests.post(url, headers=headers, params=params)
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_datasets_sizes(
         self,
@@ -753,9 +706,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -765,15 +716,13 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "dataset/tenant/%s/subproject/%s/size" % (tenantid, subprojectid),
+        url = self._url(
+            "dataset/tenant/%s/subproject/%s/size" % (tenantid, subprojectid)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_content_list(
         self,
@@ -801,9 +750,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -811,16 +758,14 @@ class SDMSClient(OSDUAPIClient):
         if path is not None:
             params["path"] = path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "dataset/tenant/%s/subproject/%s/readdsdirfulllist"
-            % (tenantid, subprojectid),
+            % (tenantid, subprojectid)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_datasets_in_subproject(
         self,
@@ -861,9 +806,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -888,15 +831,13 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetListBody)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "dataset/tenant/%s/subproject/%s" % (tenantid, subprojectid),
+        url = self._url("dataset/tenant/%s/subproject/%s" % (tenantid, subprojectid))
+        response = self._request(
+            "post", url, headers=headers, params=params, json=request_data
         )
-        response = requests.post(url, headers=headers, params=params, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def check_datasets_list(
         self,
@@ -924,9 +865,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -937,15 +876,13 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetCheckList)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "dataset/tenant/%s/subproject/%s/exist" % (tenantid, subprojectid),
+        url = self._url(
+            "dataset/tenant/%s/subproject/%s/exist" % (tenantid, subprojectid)
         )
-        response = requests.post(url, headers=headers, json=request_data)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_datasets_sizes(
         self,
@@ -975,9 +912,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -988,15 +923,13 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetCheckList)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "dataset/tenant/%s/subproject/%s/sizes" % (tenantid, subprojectid),
+        url = self._url(
+            "dataset/tenant/%s/subproject/%s/sizes" % (tenantid, subprojectid)
         )
-        response = requests.post(url, headers=headers, json=request_data)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def ls(
         self,
@@ -1026,9 +959,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1042,11 +973,11 @@ class SDMSClient(OSDUAPIClient):
         if cursor is not None:
             params["cursor"] = cursor
 
-        url = urljoin(self.base_url, self.service_path, "utility/ls")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("utility/ls")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def ls_post(
         self,
@@ -1076,9 +1007,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1095,11 +1024,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetLsBody)
 
-        url = urljoin(self.base_url, self.service_path, "utility/ls")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("utility/ls")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_storage_tiers(self, data_partition_id: str | None = None) -> dict:
         """
@@ -1112,15 +1041,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "utility/storage-tiers")
-        response = requests.get(url, headers=headers)
+        url = self._url("utility/storage-tiers")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def copy_dataset(
         self,
@@ -1154,9 +1081,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1167,11 +1092,11 @@ class SDMSClient(OSDUAPIClient):
         if lock is not None:
             params["lock"] = lock
 
-        url = urljoin(self.base_url, self.service_path, "utility/cp")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("utility/cp")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_gcs_access_token(
         self,
@@ -1203,9 +1128,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1215,11 +1138,11 @@ class SDMSClient(OSDUAPIClient):
         if readonly is not None:
             params["readonly"] = readonly
 
-        url = urljoin(self.base_url, self.service_path, "utility/gcs-access-token")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("utility/gcs-access-token")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_upload_connection_credential_string(
         self,
@@ -1240,9 +1163,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1250,13 +1171,11 @@ class SDMSClient(OSDUAPIClient):
             "sdpath": sdpath,
         }
 
-        url = urljoin(
-            self.base_url, self.service_path, "utility/upload-connection-string"
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("utility/upload-connection-string")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_download_connection_credentials_string(
         self,
@@ -1277,9 +1196,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if impersonation_token_context is not None:
             headers["impersonation-token-context"] = impersonation_token_context
 
@@ -1287,13 +1204,11 @@ class SDMSClient(OSDUAPIClient):
             "sdpath": sdpath,
         }
 
-        url = urljoin(
-            self.base_url, self.service_path, "utility/download-connection-string"
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("utility/download-connection-string")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_imptoken(
         self,
@@ -1319,9 +1234,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "token": token,
@@ -1332,11 +1245,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, ImpTokenRequest)
 
-        url = urljoin(self.base_url, self.service_path, "imptoken")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("imptoken")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def refresh_imptoken(
         self, *, token: str, data_partition_id: str | None = None
@@ -1352,9 +1265,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "token": token,
@@ -1363,11 +1274,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, RefreshTokenRequest)
 
-        url = urljoin(self.base_url, self.service_path, "imptoken")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("imptoken")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_imptoken(
         self, *, token: str, refresh_url: str, data_partition_id: str | None = None
@@ -1387,9 +1298,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "token": token,
@@ -1399,11 +1308,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, ImpTokenPatchRequest)
 
-        url = urljoin(self.base_url, self.service_path, "imptoken")
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("imptoken")
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_impersonation_token(
         self,
@@ -1426,9 +1335,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         headers.update(
             {
                 "user-token": user_token,
@@ -1444,11 +1351,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, ImpersonationTokenRequest)
 
-        url = urljoin(self.base_url, self.service_path, "impersonation-token")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("impersonation-token")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def refresh_impersonation_token(
         self,
@@ -1469,9 +1376,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         headers.update(
             {
                 "impersonation-token": impersonation_token,
@@ -1479,11 +1384,11 @@ class SDMSClient(OSDUAPIClient):
             }
         )
 
-        url = urljoin(self.base_url, self.service_path, "impersonation-token")
-        response = requests.put(url, headers=headers)
+        url = self._url("impersonation-token")
+        response = self._request("put", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_new_subproject(
         self,
@@ -1519,9 +1424,7 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if ltag is not None:
             headers["ltag"] = ltag
 
@@ -1540,15 +1443,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SubProjectCreateBody)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid),
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid))
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_subproject_metadata(
         self,
@@ -1571,23 +1470,17 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if translate_user_info is not None:
             params["translate-user-info"] = translate_user_info
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid),
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid))
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_subproject(
         self, *, subprojectid: str, tenantid: str, data_partition_id: str | None = None
@@ -1604,19 +1497,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid),
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("subproject/tenant/%s/subproject/%s" % (subprojectid, tenantid))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_subprojects_metadata(
         self,
@@ -1653,9 +1540,7 @@ class SDMSClient(OSDUAPIClient):
               OSDUValidation: if request values are wrong.
               OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         headers.update(
             {
                 "ltag": ltag,
@@ -1675,17 +1560,13 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, SubProjectPatchBody)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "subproject/tenant/%s/subproject/%s" % (tenantid, subprojectid),
-        )
-        response = requests.patch(
-            url, headers=headers, params=params, json=request_data
+        url = self._url("subproject/tenant/%s/subproject/%s" % (tenantid, subprojectid))
+        response = self._request(
+            "patch", url, headers=headers, params=params, json=request_data
         )
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_subprojects_in_tenant(
         self, *, tenantid: str, data_partition_id: str | None = None
@@ -1701,17 +1582,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "subproject/tenant/%s" % tenantid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("subproject/tenant/%s" % tenantid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def register_tenant(
         self,
@@ -1736,9 +1613,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "gcpid": gcpid,
@@ -1749,11 +1624,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, TenantCreateBody)
 
-        url = urljoin(self.base_url, self.service_path, "tenant/%s" % tenantid)
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("tenant/%s" % tenantid)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_tenant(
         self, *, tenantid: str, data_partition_id: str | None = None
@@ -1769,15 +1644,13 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "tenant/%s" % tenantid)
-        response = requests.get(url, headers=headers)
+        url = self._url("tenant/%s" % tenantid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_tenant_sdpath(
         self, *, datapartition: str, data_partition_id: str | None = None
@@ -1793,19 +1666,17 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "datapartition": datapartition,
         }
 
-        url = urljoin(self.base_url, self.service_path, "tenant/sdpath")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("tenant/sdpath")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_user(
         self, *, email: str, path: str, group: str, data_partition_id: str | None = None
@@ -1823,9 +1694,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "email": email,
@@ -1836,11 +1705,11 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, UserAddRequest)
 
-        url = urljoin(self.base_url, self.service_path, "user")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("user")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_user(self, *, sdpath: str, data_partition_id: str | None = None) -> dict:
         """
@@ -1854,19 +1723,17 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "user")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("user")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_user(
         self, *, email: str, path: str, data_partition_id: str | None = None
@@ -1883,20 +1750,18 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "email": email,
             "path": path,
         }
 
-        url = urljoin(self.base_url, self.service_path, "user")
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("user")
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_user_roles(
         self, *, sdpath: str, data_partition_id: str | None = None
@@ -1912,19 +1777,17 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "user/roles")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("user/roles")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def register_app(
         self, *, email: str, sdpath: str, data_partition_id: str | None = None
@@ -1941,20 +1804,18 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "email": email,
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "app")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("app")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_app(self, *, sdpath: str, data_partition_id: str | None = None) -> dict:
         """
@@ -1971,19 +1832,17 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "app")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("app")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def set_app_trusted(
         self, *, email: str, sdpath: str, data_partition_id: str | None = None
@@ -2003,20 +1862,18 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "email": email,
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "app/trusted")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("app/trusted")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_app_trusted(
         self, *, sdpath: str, data_partition_id: str | None = None
@@ -2035,19 +1892,17 @@ class SDMSClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "sdpath": sdpath,
         }
 
-        url = urljoin(self.base_url, self.service_path, "app/trusted")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("app/trusted")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_all_datasets_in_subproject(
         self,
@@ -2068,9 +1923,7 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {
             "path": path,
@@ -2083,11 +1936,13 @@ class SDMSClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, DatasetBulkDeleteBody)
 
-        url = urljoin(self.base_url, self.service_path, "operation/bulk-delete")
-        response = requests.put(url, headers=headers, params=params, json=request_data)
+        url = self._url("operation/bulk-delete")
+        response = self._request(
+            "put", url, headers=headers, params=params, json=request_data
+        )
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_operation_bulk_delete_status(
         self, *, operation_id: str, data_partition_id: str | None = None
@@ -2103,14 +1958,10 @@ class SDMSClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "operation/bulk-delete/%s" % operation_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("operation/bulk-delete/%s" % operation_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SDMSAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
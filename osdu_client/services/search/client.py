@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CursorQueryRequest, QueryRequest
@@ -54,9 +51,7 @@ class SearchClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "kind": kind,
@@ -83,11 +78,11 @@ class SearchClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, CursorQueryRequest)
 
-        url = urljoin(self.base_url, self.service_path, "query_with_cursor")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("query_with_cursor")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SearchAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query(
         self,
@@ -127,9 +122,7 @@ class SearchClient(OSDUAPIClient):
                OSDUValidation: if request values are wrong.
                OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "kind": kind,
@@ -158,11 +151,11 @@ class SearchClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, QueryRequest)
 
-        url = urljoin(self.base_url, self.service_path, "query")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("query")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SearchAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_readiness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -175,15 +168,13 @@ class SearchClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "readiness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("readiness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SearchAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -196,15 +187,13 @@ class SearchClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SearchAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -217,12 +206,10 @@ class SearchClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SearchAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
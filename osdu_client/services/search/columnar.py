@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any, Iterator
+
+from osdu_client.exceptions import OSDUClientError
+
+from .client import SearchClient
+
+DEFAULT_BATCH_SIZE = 1000
+
+
+def _import_optional(name: str) -> Any:
+    try:
+        return import_module(name)
+    except ImportError as e:
+        raise OSDUClientError(f"Columnar export requires package {name} to be installed.") from e
+
+
+def iter_cursor_pages(
+    search_client: SearchClient, *, kind: Any, batch_size: int = DEFAULT_BATCH_SIZE, **query_kwargs
+) -> Iterator[list[dict]]:
+    """Yields result pages of SearchClient.query_with_cursor until the cursor is exhausted.
+        Args:
+            search_client (SearchClient): search client.
+            kind (str | list[str]): kind or kinds to query.
+            batch_size (int): page size sent as the query limit.
+            **query_kwargs: other query_with_cursor arguments, e.g. query, returned_fields or data_partition_id.
+        Returns:
+            Iterator over lists of hits
+    """
+    cursor = None
+    while True:
+        response = search_client.query_with_cursor(kind=kind, limit=batch_size, cursor=cursor, **query_kwargs)
+        results = response.get("results") or []
+        if results:
+            yield results
+        cursor = response.get("cursor")
+        if not cursor or not results:
+            return
+
+
+def project_columns(results: list[dict], returned_fields: list[str]) -> dict[str, list]:
+    """Flattens hits into columns named after dotted field paths, e.g. "data.FacilityName".
+        Missing values are None.
+    """
+    columns = {}
+    for field in returned_fields:
+        path = field.split(".")
+        column = []
+        append = column.append
+        for hit in results:
+            value = hit
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key)
+            append(value)
+        columns[field] = column
+    return columns
+
+
+def iter_column_batches(
+    search_client: SearchClient,
+    *,
+    kind: Any,
+    returned_fields: list[str],
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **query_kwargs,
+) -> Iterator[dict[str, list]]:
+    """Streams search results as column batches, only one page of hits is held as dicts at a time.
+        Args:
+            search_client (SearchClient): search client.
+            kind (str | list[str]): kind or kinds to query.
+            returned_fields (list[str]): dotted field paths, they are both requested from Search and used as columns.
+            batch_size (int): number of hits per batch.
+            **query_kwargs: other query_with_cursor arguments.
+        Returns:
+            Iterator over dicts mapping field path to list of values
+    """
+    pages = iter_cursor_pages(
+        search_client, kind=kind, returned_fields=returned_fields, batch_size=batch_size, **query_kwargs
+    )
+    for results in pages:
+        yield project_columns(results, returned_fields)
+
+
+def iter_record_batches(
+    search_client: SearchClient,
+    *,
+    kind: Any,
+    returned_fields: list[str],
+    schema: Any = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **query_kwargs,
+) -> Iterator[Any]:
+    """Streams search results as pyarrow.RecordBatch objects. Requires pyarrow.
+        Args:
+            schema (pyarrow.Schema): optional schema, by default column types are inferred per batch.
+            See iter_column_batches for other arguments.
+        Returns:
+            Iterator over pyarrow.RecordBatch
+    """
+    pa = _import_optional("pyarrow")
+    batches = iter_column_batches(
+        search_client, kind=kind, returned_fields=returned_fields, batch_size=batch_size, **query_kwargs
+    )
+    for columns in batches:
+        yield pa.RecordBatch.from_pydict(columns, schema=schema)
+
+
+def to_arrow_table(
+    search_client: SearchClient,
+    *,
+    kind: Any,
+    returned_fields: list[str],
+    schema: Any = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **query_kwargs,
+) -> Any:
+    """Collects all search results into a pyarrow.Table. Requires pyarrow 14 or newer.
+        Without schema, column types inferred for each batch are promoted to a common type, e.g. int64 and double.
+    """
+    pa = _import_optional("pyarrow")
+    batches = iter_record_batches(
+        search_client, kind=kind, returned_fields=returned_fields, schema=schema, batch_size=batch_size, **query_kwargs
+    )
+    if schema is not None:
+        return pa.Table.from_batches(list(batches), schema=schema)
+
+    tables = [pa.Table.from_batches([batch]) for batch in batches]
+    if not tables:
+        return pa.table({field: pa.array([], pa.null()) for field in returned_fields})
+    return pa.concat_tables(tables, promote_options="permissive")
+
+
+def iter_structured_arrays(
+    search_client: SearchClient,
+    *,
+    kind: Any,
+    returned_fields: list[str],
+    dtypes: dict[str, Any] | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    **query_kwargs,
+) -> Iterator[Any]:
+    """Streams search results as NumPy structured arrays. Requires numpy.
+        Args:
+            dtypes (dict): NumPy dtype per field path, fields without dtype are stored as objects.
+                Use fixed width types (e.g. "U64", "f8") to keep values out of Python objects.
+            See iter_column_batches for other arguments.
+        Returns:
+            Iterator over numpy.ndarray with one named field per returned field
+    """
+    np = _import_optional("numpy")
+    dtypes = dtypes or {}
+    dtype = np.dtype([(field, dtypes.get(field, object)) for field in returned_fields])
+    batches = iter_column_batches(
+        search_client, kind=kind, returned_fields=returned_fields, batch_size=batch_size, **query_kwargs
+    )
+    for columns in batches:
+        array = np.empty(len(columns[returned_fields[0]]), dtype=dtype)
+        for field, values in columns.items():
+            if field in dtypes and dtype[field].kind in "fc":
+                values = [np.nan if value is None else value for value in values]
+            elif field in dtypes and dtype[field].kind in "US":
+                values = ["" if value is None else value for value in values]
+            array[field] = values
+        yield array
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+from osdu_client.cache import DEFAULT_MAX_ENTRIES, TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+
+from .client import SearchClient
+
+DEFAULT_FACET_TTL = 30.0
+
+
+def normalize_query(**query_kwargs) -> str:
+    """Returns a cache key for SearchClient.query arguments.
+        None values are dropped, kind lists are sorted and whitespace in the query string is collapsed.
+    """
+    normalized = {}
+    for name, value in query_kwargs.items():
+        if value is None:
+            continue
+        if name == "kind" and isinstance(value, (list, tuple)):
+            value = sorted(set(value))
+        elif name == "query" and isinstance(value, str):
+            value = re.sub(r"\s+", " ", value).strip()
+        normalized[name] = value
+    return json.dumps(normalized, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def merge_aggregations(*aggregations: list[dict]) -> list[dict]:
+    """Sums bucket counts with the same key, returns buckets ordered by count descending."""
+    counts = {}
+    for buckets in aggregations:
+        for bucket in buckets:
+            counts[bucket["key"]] = counts.get(bucket["key"], 0) + bucket["count"]
+    return [{"key": key, "count": count} for key, count in sorted(counts.items(), key=lambda item: -item[1])]
+
+
+class FacetCache:
+    """Runs SearchClient.query aggregate_by queries concurrently and keeps their aggregations for ttl seconds.
+
+        Results are cached by the normalized query, so equivalent queries share one entry. Concurrent requests for
+        the same facet share a single Search call.
+    """
+
+    def __init__(
+        self,
+        search_client: SearchClient,
+        ttl: float = DEFAULT_FACET_TTL,
+        max_entries: int | None = DEFAULT_MAX_ENTRIES,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.search_client = search_client
+        self.max_workers = max_workers
+        self.cache = TTLCache(ttl, max_entries=max_entries)
+
+    def aggregate(self, *, kind: Any, field: str, **query_kwargs) -> list[dict]:
+        """Returns aggregation buckets ({"key": ..., "count": ...}) of field.
+            Args:
+                kind (str | list[str]): kind or kinds to query.
+                field (str): field to aggregate by.
+                **query_kwargs: other SearchClient.query arguments, e.g. query, spatial_filter or data_partition_id.
+            Returns:
+                list of buckets
+        """
+        query_kwargs = {"limit": 0, **query_kwargs}
+        key = normalize_query(kind=kind, aggregate_by=field, **query_kwargs)
+
+        def load() -> tuple[dict, ...]:
+            response = self.search_client.query(kind=kind, aggregate_by=field, **query_kwargs)
+            return tuple(response.get("aggregations") or [])
+
+        # Cached buckets are shared between callers, each one gets its own copies.
+        return [dict(bucket) for bucket in self.cache.get_or_load(key, load)]
+
+    def facets(self, *, kind: Any, fields: list[str], **query_kwargs) -> dict[str, list[dict]]:
+        """Returns aggregation buckets for every field, missing facets are fetched concurrently.
+            See aggregate for arguments.
+        """
+        results = map_concurrently(
+            lambda field: self.aggregate(kind=kind, field=field, **query_kwargs), fields, max_workers=self.max_workers
+        )
+        return dict(zip(fields, results))
+
+    def by_kind(self, *, kinds: list[str], field: str, **query_kwargs) -> dict[str, list[dict]]:
+        """Returns aggregation buckets of field for every kind (or wildcard kind) queried separately."""
+        results = map_concurrently(
+            lambda kind: self.aggregate(kind=kind, field=field, **query_kwargs), kinds, max_workers=self.max_workers
+        )
+        return dict(zip(kinds, results))
+
+    def combined(self, *, kinds: list[str], field: str, **query_kwargs) -> list[dict]:
+        """Merges per-kind aggregations of field. Kinds are cached separately, so a dashboard combining different
+            kind lists reuses entries. Kinds should not overlap, records matched by two kinds are counted twice.
+        """
+        return merge_aggregations(*self.by_kind(kinds=kinds, field=field, **query_kwargs).values())
+
+    def invalidate(self):
+        self.cache.clear()
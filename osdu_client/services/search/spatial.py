@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently, map_concurrently
+from osdu_client.exceptions import OSDUClientError
+
+from .client import SearchClient
+from .columnar import DEFAULT_BATCH_SIZE, iter_cursor_pages
+
+DEFAULT_MAX_RESULTS_PER_TILE = 10000
+DEFAULT_MAX_DEPTH = 8
+
+POLYGON_FILTERS = ("byGeoPolygon", "byWithinPolygon")
+# A shape crossing a tile border is within none of the tiles, so these filters are never split.
+UNSPLITTABLE_FILTERS = ("byWithinPolygon",)
+
+
+@dataclass(frozen=True)
+class BoundingBox:
+    south: float
+    west: float
+    north: float
+    east: float
+
+    @classmethod
+    def from_filter(cls, by_bounding_box: dict) -> BoundingBox:
+        top_left, bottom_right = by_bounding_box["topLeft"], by_bounding_box["bottomRight"]
+        return cls(
+            south=bottom_right["latitude"],
+            west=top_left["longitude"],
+            north=top_left["latitude"],
+            east=bottom_right["longitude"],
+        )
+
+    @classmethod
+    def around(cls, points: list[dict]) -> BoundingBox:
+        latitudes = [p["latitude"] for p in points]
+        longitudes = [p["longitude"] for p in points]
+        return cls(min(latitudes), min(longitudes), max(latitudes), max(longitudes))
+
+    def to_filter(self) -> dict:
+        return {
+            "topLeft": {"latitude": self.north, "longitude": self.west},
+            "bottomRight": {"latitude": self.south, "longitude": self.east},
+        }
+
+    def split(self) -> list[BoundingBox]:
+        """Splits the box into quadrants. A box crossing the antimeridian (west > east) is split into its parts west
+            and east of the antimeridian instead.
+        """
+        if self.west > self.east:
+            return [
+                BoundingBox(self.south, self.west, self.north, 180.0),
+                BoundingBox(self.south, -180.0, self.north, self.east),
+            ]
+        middle_latitude = (self.south + self.north) / 2
+        middle_longitude = (self.west + self.east) / 2
+        return [
+            BoundingBox(middle_latitude, self.west, self.north, middle_longitude),
+            BoundingBox(middle_latitude, middle_longitude, self.north, self.east),
+            BoundingBox(self.south, self.west, middle_latitude, middle_longitude),
+            BoundingBox(self.south, middle_longitude, middle_latitude, self.east),
+        ]
+
+
+def clip_polygon(points: list[dict], box: BoundingBox) -> list[dict]:
+    """Clips polygon to the bounding box (Sutherland-Hodgman). Returns an empty list when they do not overlap."""
+    closed = len(points) > 1 and points[0] == points[-1]
+    vertices = [(p["longitude"], p["latitude"]) for p in (points[:-1] if closed else points)]
+
+    edges = (
+        (lambda x, y: x >= box.west, lambda a, b: _cross_longitude(a, b, box.west)),
+        (lambda x, y: x <= box.east, lambda a, b: _cross_longitude(a, b, box.east)),
+        (lambda x, y: y >= box.south, lambda a, b: _cross_latitude(a, b, box.south)),
+        (lambda x, y: y <= box.north, lambda a, b: _cross_latitude(a, b, box.north)),
+    )
+    for inside, intersection in edges:
+        if not vertices:
+            break
+        clipped = []
+        previous = vertices[-1]
+        for current in vertices:
+            if inside(*current):
+                if not inside(*previous):
+                    clipped.append(intersection(previous, current))
+                clipped.append(current)
+            elif inside(*previous):
+                clipped.append(intersection(previous, current))
+            previous = current
+        vertices = clipped
+
+    if len(vertices) < 3:
+        return []
+    result = [{"latitude": y, "longitude": x} for x, y in vertices]
+    if closed:
+        result.append(dict(result[0]))
+    return result
+
+
+def _cross_longitude(a: tuple, b: tuple, longitude: float) -> tuple:
+    ratio = (longitude - a[0]) / (b[0] - a[0])
+    return longitude, a[1] + ratio * (b[1] - a[1])
+
+
+def _cross_latitude(a: tuple, b: tuple, latitude: float) -> tuple:
+    ratio = (latitude - a[1]) / (b[1] - a[1])
+    return a[0] + ratio * (b[0] - a[0]), latitude
+
+
+@dataclass
+class Tile:
+    box: BoundingBox
+    spatial_filter: dict
+    depth: int = 0
+    total_count: int | None = None
+
+
+class SpatialTiler:
+    """Splits a large spatial_filter query into tiles holding at most max_results_per_tile hits each.
+
+        Tiles are counted with SearchClient.query and split into quadrants until they fit or max_depth is reached.
+        Supported filters are byBoundingBox, byGeoPolygon and byWithinPolygon. Polygons are clipped to every tile.
+        Records on or crossing tile borders are returned by several tiles and are deduplicated by id. byWithinPolygon
+        queries are never split, as a record crossing a tile border would be within none of the tiles, and are
+        fetched as a single tile.
+    """
+
+    def __init__(
+        self,
+        search_client: SearchClient,
+        max_results_per_tile: int = DEFAULT_MAX_RESULTS_PER_TILE,
+        max_depth: int = DEFAULT_MAX_DEPTH,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.search_client = search_client
+        self.max_results_per_tile = max_results_per_tile
+        self.max_depth = max_depth
+        self.max_workers = max_workers
+
+    def plan(self, *, kind: Any, spatial_filter: dict, **query_kwargs) -> list[Tile]:
+        """Returns non-empty tiles covering spatial_filter, each with its total_count.
+            Args:
+                kind (str | list[str]): kind or kinds to query.
+                spatial_filter (dict): Search spatial filter with "field" and one of the supported filters.
+                **query_kwargs: other SearchClient.query arguments, e.g. query or data_partition_id.
+            Returns:
+                list of Tile
+            Raises:
+                OSDUClientError: if spatial filter type is not supported
+        """
+        pending = [self._root_tile(spatial_filter)]
+        max_depth = 0 if any(name in spatial_filter for name in UNSPLITTABLE_FILTERS) else self.max_depth
+        tiles = []
+        while pending:
+            counted = map_concurrently(
+                lambda tile: self._count(tile, kind, query_kwargs), pending, max_workers=self.max_workers
+            )
+            pending = []
+            for tile in counted:
+                if not tile.total_count:
+                    continue
+                if tile.total_count <= self.max_results_per_tile or tile.depth >= max_depth:
+                    tiles.append(tile)
+                else:
+                    pending += self._split(tile, spatial_filter)
+        return tiles
+
+    def iter_results(
+        self,
+        *,
+        kind: Any,
+        spatial_filter: dict,
+        returned_fields: list[str] | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        **query_kwargs,
+    ) -> Iterator[dict]:
+        """Plans tiles for spatial_filter and yields unique hits of all tiles, fetched in parallel.
+            Args:
+                returned_fields (list[str]): fields to return, "id" is always added for deduplication.
+                batch_size (int): page size of the cursor queries.
+                See plan for other arguments.
+            Returns:
+                Iterator over hits
+        """
+        if returned_fields is not None and "id" not in returned_fields:
+            returned_fields = ["id", *returned_fields]
+        tiles = self.plan(kind=kind, spatial_filter=spatial_filter, **query_kwargs)
+
+        def fetch(tile: Tile) -> list[dict]:
+            hits = []
+            for page in iter_cursor_pages(
+                self.search_client,
+                kind=kind,
+                spatial_filter=tile.spatial_filter,
+                returned_fields=returned_fields,
+                batch_size=batch_size,
+                **query_kwargs,
+            ):
+                hits += page
+            return hits
+
+        seen = set()
+        for _, hits, error in iter_concurrently(fetch, tiles, max_workers=self.max_workers):
+            if error is not None:
+                raise error
+            for hit in hits:
+                record_id = hit.get("id")
+                if record_id is None or record_id not in seen:
+                    seen.add(record_id)
+                    yield hit
+
+    def _root_tile(self, spatial_filter: dict) -> Tile:
+        if "byBoundingBox" in spatial_filter:
+            box = BoundingBox.from_filter(spatial_filter["byBoundingBox"])
+            return Tile(box, spatial_filter)
+        for name in POLYGON_FILTERS:
+            if name in spatial_filter:
+                return Tile(BoundingBox.around(spatial_filter[name]["points"]), spatial_filter)
+        raise OSDUClientError(
+            f"Spatial filter {spatial_filter} is not supported. Supported: byBoundingBox, {', '.join(POLYGON_FILTERS)}"
+        )
+
+    def _split(self, tile: Tile, spatial_filter: dict) -> list[Tile]:
+        tiles = []
+        for box in tile.box.split():
+            tile_filter = {"field": spatial_filter["field"]}
+            if "byBoundingBox" in spatial_filter:
+                tile_filter["byBoundingBox"] = box.to_filter()
+            else:
+                name = "byGeoPolygon"
+                points = clip_polygon(spatial_filter[name]["points"], box)
+                if not points:
+                    continue
+                tile_filter[name] = {"points": points}
+            tiles.append(Tile(box, tile_filter, tile.depth + 1))
+        return tiles
+
+    def _count(self, tile: Tile, kind: Any, query_kwargs: dict) -> Tile:
+        response = self.search_client.query(
+            kind=kind, spatial_filter=tile.spatial_filter, limit=0, track_total_count=True, **query_kwargs
+        )
+        tile.total_count = response.get("totalCount", 0)
+        return tile
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from importlib import import_module
+
+import requests
+
+from osdu_client.exceptions import OSDUAPIError, OSDUCircuitOpenError, OSDUTimeoutError
+
+from .client import SecretClient
+
+DEFAULT_SECRET_TTL = 300.0
+DEFAULT_REFRESH_AHEAD = 0.8
+DEFAULT_MAX_STALE = 600.0
+
+_NONCE_SIZE = 12
+
+
+def is_unavailable(error: BaseException) -> bool:
+    """Tells if an error means the service could not answer, as opposed to rejecting the request."""
+    if isinstance(error, (requests.RequestException, OSDUTimeoutError, OSDUCircuitOpenError)):
+        return True
+    if isinstance(error, OSDUAPIError) and len(error.args) > 1 and isinstance(error.args[1], int):
+        return error.args[1] >= 500 or error.args[1] == 429
+    return False
+
+
+def _aesgcm():
+    try:
+        return import_module("cryptography.hazmat.primitives.ciphers.aead").AESGCM
+    except ImportError as e:
+        raise ImportError(
+            "SecretCache requires package cryptography, install osdu-client with the encryption extra."
+        ) from e
+
+
+@dataclass
+class _Entry:
+    nonce: bytes = field(repr=False)
+    ciphertext: bytes = field(repr=False)
+    loaded_at: float
+
+
+class SecretCache:
+    """Cache of secrets fetched with SecretClient.get_secret, keeping values encrypted in memory.
+
+        Secrets are encrypted with AES-GCM under a random key of the cache, so plaintext lives only in values returned
+        to callers. It requires the cryptography package (encryption extra). An entry is used for ttl seconds. Once it
+        is older than refresh_ahead * ttl, the next lookup returns it and fetches it again in the background. Concurrent
+        fetches of one secret share a single request, and a fetch started before invalidate does not store its result.
+        When the service is unavailable (connection errors, timeouts, 5XX or 429) the last known value is returned for
+        up to max_stale seconds after it expired.
+    """
+
+    def __init__(
+        self,
+        secret_client: SecretClient,
+        ttl: float = DEFAULT_SECRET_TTL,
+        refresh_ahead: float = DEFAULT_REFRESH_AHEAD,
+        max_stale: float = DEFAULT_MAX_STALE,
+        data_partition_id: str | None = None,
+    ):
+        if not 0 < refresh_ahead <= 1:
+            raise ValueError("refresh_ahead must be between 0 and 1.")
+        self.secret_client = secret_client
+        self.ttl = ttl
+        self.refresh_ahead = refresh_ahead
+        self.max_stale = max_stale
+        self.data_partition_id = data_partition_id
+
+        self._key = os.urandom(32)
+        self._cipher = _aesgcm()(self._key)
+        self._entries = {}
+        self._loading = {}
+        self._generations = {}
+        self._lock = threading.Lock()
+
+    def get(self, secret_name: str) -> dict:
+        """Returns the secret as returned by get_secret, fetching it only when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(secret_name)
+        age = time.monotonic() - entry.loaded_at if entry is not None else None
+        if age is not None and age < self.ttl:
+            if age >= self.refresh_ahead * self.ttl:
+                self._refresh_in_background(secret_name)
+            return self._decrypt(entry)
+
+        try:
+            return self._decrypt(self._load(secret_name))
+        except Exception as e:
+            if age is not None and age < self.ttl + self.max_stale and is_unavailable(e):
+                return self._decrypt(entry)
+            raise
+
+    def value(self, secret_name: str) -> str | None:
+        return self.get(secret_name).get("value")
+
+    def invalidate(self, secret_name: str | None = None):
+        """Drops one secret, e.g. after rotating it, or all secrets when secret_name is None."""
+        with self._lock:
+            if secret_name is None:
+                self._entries.clear()
+                names = self._generations.keys() | self._loading.keys()
+            else:
+                self._entries.pop(secret_name, None)
+                names = [secret_name]
+            for name in names:
+                # Fetches started before are dropped, the next lookup fetches the secret again.
+                self._generations[name] = self._generations.get(name, 0) + 1
+                self._loading.pop(name, None)
+
+    def _load(self, secret_name: str) -> _Entry:
+        future, generation = self._start_load(secret_name)
+        if generation is not None:
+            self._fetch(secret_name, future, generation)
+        return future.result()
+
+    def _refresh_in_background(self, secret_name: str):
+        future, generation = self._start_load(secret_name)
+        if generation is not None:
+            threading.Thread(
+                target=self._fetch, args=(secret_name, future, generation), name="osdu-secret-refresh", daemon=True
+            ).start()
+
+    def _start_load(self, secret_name: str) -> tuple[Future, int | None]:
+        """Returns the fetch of a secret and, if the caller has to run it, the generation it was started in."""
+        with self._lock:
+            future = self._loading.get(secret_name)
+            if future is not None:
+                return future, None
+            future = self._loading[secret_name] = Future()
+            return future, self._generations.get(secret_name, 0)
+
+    def _fetch(self, secret_name: str, future: Future, generation: int):
+        try:
+            secret = self.secret_client.get_secret(secret_name=secret_name, data_partition_id=self.data_partition_id)
+            entry = self._encrypt(secret)
+        except BaseException as e:
+            self._finish_load(secret_name, future)
+            # Failed refreshes keep the current entry, the error reaches only callers waiting for this fetch.
+            future.set_exception(e)
+            return
+        with self._lock:
+            if self._generations.get(secret_name, 0) == generation:
+                self._entries[secret_name] = entry
+        self._finish_load(secret_name, future)
+        future.set_result(entry)
+
+    def _finish_load(self, secret_name: str, future: Future):
+        with self._lock:
+            if self._loading.get(secret_name) is future:
+                del self._loading[secret_name]
+
+    def _encrypt(self, secret: dict) -> _Entry:
+        plaintext = json.dumps(secret).encode("utf-8")
+        nonce = os.urandom(_NONCE_SIZE)
+        return _Entry(nonce, self._cipher.encrypt(nonce, plaintext, None), time.monotonic())
+
+    def _decrypt(self, entry: _Entry) -> dict:
+        return json.loads(self._cipher.decrypt(entry.nonce, entry.ciphertext, None))
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import Secret
@@ -31,15 +28,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "secrets/%s" % secret_name)
-        response = requests.get(url, headers=headers)
+        url = self._url("secrets/%s" % secret_name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_secret(
         self,
@@ -68,9 +63,7 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if id is not None:
@@ -87,11 +80,11 @@ class SecretClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Secret)
 
-        url = urljoin(self.base_url, self.service_path, "secrets/%s" % secret_name)
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("secrets/%s" % secret_name)
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_secret(
         self, *, secret_name: str, data_partition_id: str | None = None
@@ -107,15 +100,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "secrets/%s" % secret_name)
-        response = requests.delete(url, headers=headers)
+        url = self._url("secrets/%s" % secret_name)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_secrets(self, data_partition_id: str | None = None) -> dict:
         """
@@ -128,15 +119,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "secrets")
-        response = requests.get(url, headers=headers)
+        url = self._url("secrets")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_secrets(
         self,
@@ -163,9 +152,7 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {}
         if id is not None:
@@ -182,32 +169,35 @@ class SecretClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, Secret)
 
-        url = urljoin(self.base_url, self.service_path, "secrets")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("secrets")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_secrets_get(self, data_partition_id: str | None = None) -> dict:
+    def create_secrets_get(
+        self, *, body: list[str], data_partition_id: str | None = None
+    ) -> dict:
         """
 
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[str]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "secrets:retrieve")
-        response = requests.post(url, headers=headers)
+        url = self._url("secrets:retrieve")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_secrets_recover(
         self, *, secret_name: str, data_partition_id: str | None = None
@@ -223,17 +213,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "secrets/recover/%s" % secret_name
-        )
-        response = requests.post(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("secrets/recover/%s" % secret_name)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_secrets_deleted(
         self, *, secret_name: str, data_partition_id: str | None = None
@@ -249,17 +235,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
-
-        url = urljoin(
-            self.base_url, self.service_path, "secrets/deleted/%s" % secret_name
-        )
-        response = requests.get(url, headers=headers)
+        headers = self._headers(data_partition_id)
+
+        url = self._url("secrets/deleted/%s" % secret_name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -272,15 +254,13 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_health(self, data_partition_id: str | None = None) -> dict:
         """
@@ -293,12 +273,10 @@ class SecretClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "health")
-        response = requests.get(url, headers=headers)
+        url = self._url("health")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise SecretAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+import os
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Iterable, Iterator
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, iter_concurrently
+from osdu_client.exceptions import OSDUClientError
+from osdu_client.rate_limit import RateLimiter
+
+from .client import StorageAPIError, StorageClient
+
+SOFT_DELETE = "delete"
+PURGE = "purge"
+PURGE_VERSIONS = "purge_versions"
+MODES = (SOFT_DELETE, PURGE, PURGE_VERSIONS)
+
+# Maximum number of record ids accepted by POST /records/delete.
+MAX_DELETE_BATCH_SIZE = 500
+DEFAULT_PURGE_BATCH_SIZE = 100
+DEFAULT_CHECKPOINT_EVERY = 10
+
+
+@dataclass
+class BulkDeleteResult:
+    position: int = 0
+    deleted: int = 0
+    failed: dict[str, str] = field(default_factory=dict)
+
+
+class BulkDeleter:
+    """Deletes or purges a stream of records in batches, concurrently and under an optional rate limit.
+
+        Modes:
+            delete: soft deletion through POST /records/delete, up to 500 ids per call.
+            purge: purge_record for every id, records which are already gone count as deleted.
+            purge_versions: purge_record_versions for every id, with request_kwargs such as limit or version_ids.
+
+        With checkpoint_path, progress is saved every checkpoint_every batches and when the run stops. The checkpoint
+        holds the number of leading ids of the stream which are done, so a resumed run must be given the same stream
+        in the same order, e.g. a RecordIdFile. Batches finished after that prefix are repeated on resume.
+        Records rejected by the API (4XX responses) are collected in the result, other errors (e.g. timeouts, 429 or
+        5XX responses) stop the run.
+    """
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        mode: str = SOFT_DELETE,
+        batch_size: int | None = None,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        rate_limit: float | None = None,
+        checkpoint_path: str | None = None,
+        checkpoint_every: int = DEFAULT_CHECKPOINT_EVERY,
+    ):
+        if mode not in MODES:
+            raise OSDUClientError(f"Unknown mode {mode}, use one of: {', '.join(MODES)}.")
+        if batch_size is None:
+            batch_size = MAX_DELETE_BATCH_SIZE if mode == SOFT_DELETE else DEFAULT_PURGE_BATCH_SIZE
+        if mode == SOFT_DELETE and batch_size > MAX_DELETE_BATCH_SIZE:
+            raise OSDUClientError(f"Soft deletion accepts at most {MAX_DELETE_BATCH_SIZE} records per call.")
+        self.storage_client = storage_client
+        self.mode = mode
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.rate_limiter = RateLimiter(rate_limit) if rate_limit is not None else None
+        self.checkpoint_path = checkpoint_path
+        self.checkpoint_every = checkpoint_every
+
+    def run(self, record_ids: Iterable[str], **request_kwargs) -> BulkDeleteResult:
+        """Deletes record_ids, skipping the ids already done according to the checkpoint.
+            Args:
+                record_ids (Iterable[str]): record ids, consumed lazily.
+                **request_kwargs: other Storage arguments, e.g. data_partition_id or x_collaboration.
+            Returns:
+                BulkDeleteResult with the number of ids done, deleted records and failed records with reasons
+        """
+        result = self.load_checkpoint()
+        batches = self._batches(islice(record_ids, result.position, None), result.position)
+
+        # Batches complete out of order, position only moves past a contiguous prefix of finished batches.
+        finished = {}
+        completed_batches = 0
+        try:
+            for (start, batch), failed, error in iter_concurrently(
+                lambda item: self._delete_batch(item[1], request_kwargs), batches, max_workers=self.max_workers
+            ):
+                if error is not None:
+                    raise error
+                finished[start] = (len(batch), failed)
+                while result.position in finished:
+                    size, batch_failed = finished.pop(result.position)
+                    result.position += size
+                    result.deleted += size - len(batch_failed)
+                    result.failed.update(batch_failed)
+                completed_batches += 1
+                if completed_batches % self.checkpoint_every == 0:
+                    self.save_checkpoint(result)
+        finally:
+            self.save_checkpoint(result)
+        return result
+
+    def load_checkpoint(self) -> BulkDeleteResult:
+        if self.checkpoint_path is None or not os.path.exists(self.checkpoint_path):
+            return BulkDeleteResult()
+        with open(self.checkpoint_path, encoding="utf-8") as file:
+            checkpoint = json.load(file)
+        if checkpoint.get("mode") != self.mode:
+            raise OSDUClientError(f"Checkpoint {self.checkpoint_path} was written for mode {checkpoint.get('mode')}.")
+        return BulkDeleteResult(checkpoint["position"], checkpoint["deleted"], checkpoint["failed"])
+
+    def save_checkpoint(self, result: BulkDeleteResult):
+        if self.checkpoint_path is None:
+            return
+        checkpoint = {
+            "mode": self.mode,
+            "position": result.position,
+            "deleted": result.deleted,
+            "failed": result.failed,
+        }
+        temporary_path = f"{self.checkpoint_path}.tmp"
+        with open(temporary_path, "w", encoding="utf-8") as file:
+            json.dump(checkpoint, file)
+        os.replace(temporary_path, self.checkpoint_path)
+
+    def _batches(self, record_ids: Iterable[str], start: int) -> Iterator[tuple[int, list[str]]]:
+        record_ids = iter(record_ids)
+        while True:
+            batch = list(islice(record_ids, self.batch_size))
+            if not batch:
+                return
+            yield start, batch
+            start += len(batch)
+
+    def _delete_batch(self, batch: list[str], request_kwargs: dict) -> dict[str, str]:
+        if self.mode == SOFT_DELETE:
+            self._acquire()
+            return self._soft_delete(batch, request_kwargs)
+
+        failed = {}
+        for record_id in batch:
+            self._acquire()
+            try:
+                if self.mode == PURGE:
+                    self.storage_client.purge_record(id=record_id, **request_kwargs)
+                else:
+                    self.storage_client.purge_record_versions(id=record_id, **request_kwargs)
+            except StorageAPIError as e:
+                if self.mode == PURGE and _status_code(e) == 404:
+                    continue
+                if not _is_rejection(e):
+                    raise
+                failed[record_id] = str(e.args[0])
+        return failed
+
+    def _soft_delete(self, batch: list[str], request_kwargs: dict) -> dict[str, str]:
+        try:
+            response = self.storage_client.create_records_delete(body=batch, **request_kwargs)
+        except StorageAPIError as e:
+            if _status_code(e) in (400, 403, 404):
+                return {record_id: str(e.args[0]) for record_id in batch}
+            raise
+        # 207 Multi-Status lists records which were not deleted, 204 has no content.
+        if isinstance(response, list):
+            return {item["notDeletedRecordId"]: item.get("message", "") for item in response}
+        return {}
+
+    def _acquire(self):
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+
+
+def _status_code(error: StorageAPIError) -> int | None:
+    return error.args[1] if len(error.args) > 1 else None
+
+
+def _is_rejection(error: StorageAPIError) -> bool:
+    # 4XX rejects the record, 429 and 5XX mean the service could not handle the call and stop the run.
+    status_code = _status_code(error)
+    return isinstance(status_code, int) and 400 <= status_code < 500 and status_code != 429
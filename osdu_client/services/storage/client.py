@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CopyRecordReferencesModel, MultiRecordIds, MultiRecordRequest, RecordBulkUpdateParam, ReplayRequest
@@ -22,6 +19,7 @@ class StorageClient(OSDUAPIClient):
         *,
         x_collaboration: str | None = None,
         skipdupes: bool | None = None,
+        body: list[dict],
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -32,15 +30,14 @@ class StorageClient(OSDUAPIClient):
                 data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
                 x_collaboration (str): x-collaboration
                 skipdupes (bool): Skip duplicates when updating records with the same value.
+                body (list[dict]): Records to be created/updated
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -48,11 +45,15 @@ class StorageClient(OSDUAPIClient):
         if skipdupes is not None:
             params["skipdupes"] = skipdupes
 
-        url = urljoin(self.base_url, self.service_path, "records")
-        response = requests.put(url, headers=headers, params=params)
+        request_data = body
+
+        url = self._url("records")
+        response = self._request(
+            "put", url, headers=headers, params=params, json=request_data
+        )
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_records(
         self,
@@ -76,9 +77,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -90,11 +89,11 @@ class StorageClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, RecordBulkUpdateParam)
 
-        url = urljoin(self.base_url, self.service_path, "records")
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("records")
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_records_copy(
         self,
@@ -117,9 +116,7 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -132,11 +129,11 @@ class StorageClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, CopyRecordReferencesModel)
 
-        url = urljoin(self.base_url, self.service_path, "records/copy")
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("records/copy")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_record(
         self,
@@ -158,22 +155,21 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
-        url = urljoin(self.base_url, self.service_path, "records/%s:delete" % id)
-        response = requests.post(url, headers=headers)
+        url = self._url("records/%s:delete" % id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_records_delete(
         self,
         *,
         x_collaboration: str | None = None,
+        body: list[str],
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -182,23 +178,24 @@ class StorageClient(OSDUAPIClient):
             Args:
                 data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
                 x_collaboration (str): x-collaboration
+                body (list[str]): recordIds to be deleted
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
-        url = urljoin(self.base_url, self.service_path, "records/delete")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("records/delete")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_records_from_kind(
         self,
@@ -224,9 +221,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -238,11 +233,11 @@ class StorageClient(OSDUAPIClient):
         if limit is not None:
             params["limit"] = limit
 
-        url = urljoin(self.base_url, self.service_path, "query/records")
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("query/records")
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_records(
         self,
@@ -266,9 +261,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -281,11 +274,11 @@ class StorageClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, MultiRecordIds)
 
-        url = urljoin(self.base_url, self.service_path, "query/records")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("query/records")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_records_batch(
         self,
@@ -309,9 +302,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         headers.update(
             {
                 "frame-of-reference": frame_of_reference,
@@ -327,11 +318,11 @@ class StorageClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, MultiRecordRequest)
 
-        url = urljoin(self.base_url, self.service_path, "query/records:batch")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("query/records:batch")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record(
         self,
@@ -355,9 +346,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -365,11 +354,11 @@ class StorageClient(OSDUAPIClient):
         if attribute is not None:
             params["attribute"] = attribute
 
-        url = urljoin(self.base_url, self.service_path, "records/%s" % id)
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("records/%s" % id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def purge_record(
         self,
@@ -392,17 +381,15 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
-        url = urljoin(self.base_url, self.service_path, "records/%s" % id)
-        response = requests.delete(url, headers=headers)
+        url = self._url("records/%s" % id)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_version(
         self,
@@ -428,9 +415,7 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -438,11 +423,11 @@ class StorageClient(OSDUAPIClient):
         if attribute is not None:
             params["attribute"] = attribute
 
-        url = urljoin(self.base_url, self.service_path, "records/%s/%s" % (id, version))
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("records/%s/%s" % (id, version))
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_versions(
         self,
@@ -464,17 +449,15 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
-        url = urljoin(self.base_url, self.service_path, "records/versions/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("records/versions/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_liveness_check(self, data_partition_id: str | None = None) -> dict:
         """
@@ -487,15 +470,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "liveness_check")
-        response = requests.get(url, headers=headers)
+        url = self._url("liveness_check")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_info(self, data_partition_id: str | None = None) -> dict:
         """
@@ -508,15 +489,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "info")
-        response = requests.get(url, headers=headers)
+        url = self._url("info")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def purge_record_versions(
         self,
@@ -544,9 +523,7 @@ class StorageClient(OSDUAPIClient):
                OSDUValidation: if request values are wrong.
                OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         if x_collaboration is not None:
             headers["x-collaboration"] = x_collaboration
 
@@ -558,11 +535,11 @@ class StorageClient(OSDUAPIClient):
         if _form is not None:
             params["from"] = _form
 
-        url = urljoin(self.base_url, self.service_path, "records/%s/versions" % id)
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("records/%s/versions" % id)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_replay_status(
         self, *, id: str, data_partition_id: str | None = None
@@ -579,21 +556,19 @@ class StorageClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "replay/status/%s" % id)
-        response = requests.get(url, headers=headers)
+        url = self._url("replay/status/%s" % id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_replay(
         self,
         *,
         operation: str,
-        filter: list[str] | None = None,
+        filter: dict | None = None,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -601,16 +576,14 @@ class StorageClient(OSDUAPIClient):
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
             operation (str):
-            filter (list[str]):
+            filter (dict):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "operation": operation,
@@ -621,11 +594,11 @@ class StorageClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, ReplayRequest)
 
-        url = urljoin(self.base_url, self.service_path, "replay")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("replay")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -638,15 +611,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.get(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -659,15 +630,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.put(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("put", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -680,15 +649,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.post(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -701,15 +668,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.delete(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def options_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -722,15 +687,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.options(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("options", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def head_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -743,15 +706,13 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.head(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("head", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_whoami(self, data_partition_id: str | None = None) -> dict:
         """
@@ -764,12 +725,10 @@ class StorageClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "whoami")
-        response = requests.patch(url, headers=headers)
+        url = self._url("whoami")
+        response = self._request("patch", url, headers=headers)
         if not response.ok:
             raise StorageAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
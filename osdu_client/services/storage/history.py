@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from osdu_client.cache import TTLCache
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+from osdu_client.deadline import run_in_context
+
+from .client import StorageClient
+
+DEFAULT_VERSION_CACHE_SIZE = 10000
+
+ADD = "add"
+REMOVE = "remove"
+REPLACE = "replace"
+
+
+@dataclass(frozen=True)
+class Change:
+    op: str
+    path: tuple
+    old: Any = None
+    new: Any = None
+
+
+@dataclass
+class VersionDiff:
+    record_id: str
+    from_version: int
+    to_version: int
+    changes: list[Change]
+
+
+@dataclass
+class RecordHistory:
+    record_id: str
+    versions: dict[int, dict] = field(default_factory=dict)
+    error: BaseException | None = None
+
+    def diffs(self) -> Iterator[VersionDiff]:
+        """Yields diffs between consecutive versions, oldest first."""
+        numbers = sorted(self.versions)
+        for previous, current in zip(numbers, numbers[1:]):
+            changes = list(diff_records(self.versions[previous], self.versions[current]))
+            yield VersionDiff(self.record_id, previous, current, changes)
+
+
+def diff_records(old: Any, new: Any, path: tuple = ()) -> Iterator[Change]:
+    """Yields structural changes turning old into new.
+        Dicts are compared key by key and lists of equal length item by item, other differing values are replaced.
+    """
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key, value in old.items():
+            if key not in new:
+                yield Change(REMOVE, path + (key,), old=value)
+            else:
+                yield from diff_records(value, new[key], path + (key,))
+        for key, value in new.items():
+            if key not in old:
+                yield Change(ADD, path + (key,), new=value)
+    elif isinstance(old, list) and isinstance(new, list) and len(old) == len(new):
+        for index, (old_item, new_item) in enumerate(zip(old, new)):
+            yield from diff_records(old_item, new_item, path + (index,))
+    elif old != new:
+        yield Change(REPLACE, path, old=old, new=new)
+
+
+class RecordHistoryLoader:
+    """Loads version histories of many records concurrently.
+
+        Histories of different records, and versions of every record, are fetched in parallel, all requests sharing
+        one pool of max_workers threads. Record versions are immutable, so fetched versions are cached (without
+        expiry) up to cache_size entries and reused by later loads.
+    """
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        cache_size: int | None = DEFAULT_VERSION_CACHE_SIZE,
+    ):
+        self.storage_client = storage_client
+        self.max_workers = max_workers
+        self.cache = TTLCache(float("inf"), max_entries=cache_size)
+
+    def versions(self, record_ids: Iterable[str], **request_kwargs) -> dict[str, list[int]]:
+        """Returns sorted version numbers of every record.
+            Args:
+                record_ids (Iterable[str]): record ids.
+                **request_kwargs: other get_record_versions arguments, e.g. data_partition_id.
+            Returns:
+                dict mapping record id to its versions
+        """
+        record_ids = list(record_ids)
+        versions = map_concurrently(
+            lambda record_id: self._versions(record_id, request_kwargs), record_ids, max_workers=self.max_workers
+        )
+        return dict(zip(record_ids, versions))
+
+    def get_version(self, record_id: str, version: int, **request_kwargs) -> dict:
+        key = (record_id, int(version), tuple(sorted(request_kwargs.items())))
+        return self.cache.get_or_load(
+            key, lambda: self.storage_client.get_record_version(id=record_id, version=str(version), **request_kwargs)
+        )
+
+    def iter_histories(self, record_ids: Iterable[str], **request_kwargs) -> Iterator[RecordHistory]:
+        """Yields RecordHistory of every record in completion order. record_ids are consumed lazily.
+            A failing record is yielded with its error and does not stop the others.
+            Args:
+                record_ids (Iterable[str]): record ids.
+                **request_kwargs: other Storage arguments, e.g. data_partition_id or x_collaboration.
+            Returns:
+                Iterator over RecordHistory
+        """
+
+        record_ids = iter(record_ids)
+        list_versions = run_in_context(self._versions)
+        get_version = run_in_context(self.get_version)
+        # Version lists and versions of all records share one pool, so at most max_workers requests run at once.
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: dict[Future, tuple[RecordHistory, int | None]] = {}
+            remaining: dict[int, int] = {}
+
+            def start(count: int) -> None:
+                for record_id in islice(record_ids, count):
+                    history = RecordHistory(record_id)
+                    remaining[id(history)] = 1
+                    pending[executor.submit(list_versions, record_id, request_kwargs)] = (history, None)
+
+            def fail(history: RecordHistory, error: BaseException) -> RecordHistory:
+                for future, (other, _) in list(pending.items()):
+                    if other is history:
+                        future.cancel()
+                        del pending[future]
+                history.versions, history.error = {}, error
+                return history
+
+            start(self.max_workers * 2)
+            try:
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    finished = []
+                    for future in [future for future in pending if future in done]:
+                        if future not in pending:
+                            # Dropped after another request of the same record failed.
+                            continue
+                        history, version = pending.pop(future)
+                        error = future.exception()
+                        if error is not None:
+                            finished.append(fail(history, error))
+                            continue
+                        if version is None:
+                            versions = future.result()
+                            for number in versions:
+                                future = executor.submit(get_version, history.record_id, number, **request_kwargs)
+                                pending[future] = (history, number)
+                            remaining[id(history)] = len(versions)
+                        else:
+                            history.versions[version] = future.result()
+                            remaining[id(history)] -= 1
+                        if not remaining[id(history)]:
+                            history.versions = dict(sorted(history.versions.items()))
+                            finished.append(history)
+                    for history in finished:
+                        del remaining[id(history)]
+                        yield history
+                    start(len(finished))
+            finally:
+                for future in pending:
+                    future.cancel()
+
+    def iter_diffs(self, record_ids: Iterable[str], **request_kwargs) -> Iterator[VersionDiff]:
+        """Yields diffs between consecutive versions of every record, only one history per worker is held at a time.
+            Raises the error of the first record which failed to load. See iter_histories for arguments.
+        """
+        for history in self.iter_histories(record_ids, **request_kwargs):
+            if history.error is not None:
+                raise history.error
+            yield from history.diffs()
+
+    def _versions(self, record_id: str, request_kwargs: dict) -> list[int]:
+        response = self.storage_client.get_record_versions(id=record_id, **request_kwargs)
+        return sorted(int(version) for version in response.get("versions") or [])
@@ -238,6 +238,10 @@ class PatchRecordsRequestModel(BaseModel):
     ops: JsonPatch
 
 
+class ReplayFilter(BaseModel):
+    kinds: Kind
+
+
 class ReplayRequest(BaseModel):
     operation: str
-    filter: Optional[Kind] = None
+    filter: Optional[ReplayFilter] = None
@@ -0,0 +1,196 @@
+from __future__ import annotations
+
+import heapq
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from typing import Iterable, Iterator
+
+from osdu_client.deadline import run_in_context
+from osdu_client.exceptions import OSDUClientError
+
+from .client import StorageClient
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_RUN_SIZE = 500_000
+
+# File layout: utf-8 ids back to back, count + 1 offsets into them, count, magic. All integers are little-endian uint64.
+MAGIC = b"OSDUIDS1"
+_UINT64 = struct.Struct("<Q")
+_FOOTER_SIZE = _UINT64.size + len(MAGIC)
+
+
+def iter_record_id_pages(
+    storage_client: StorageClient, *, kind: str, limit: int = DEFAULT_PAGE_SIZE, **query_kwargs
+) -> Iterator[list[str]]:
+    """Yields pages of record ids of a kind from StorageClient.query_records_from_kind.
+        The next page is requested in the background while the current one is consumed. Pages are chained by cursor,
+        so at most one page is prefetched.
+        Args:
+            storage_client (StorageClient): storage client.
+            kind (str): kind to enumerate.
+            limit (int): page size.
+            **query_kwargs: other query_records_from_kind arguments, e.g. data_partition_id.
+        Returns:
+            Iterator over lists of record ids
+    """
+    fetch = run_in_context(
+        lambda cursor: storage_client.query_records_from_kind(kind=kind, limit=limit, cursor=cursor, **query_kwargs)
+    )
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="osdu-id-prefetch") as executor:
+        response = fetch(None)
+        while True:
+            results = response.get("results") or []
+            cursor = response.get("cursor")
+            next_page = executor.submit(fetch, cursor) if cursor and results else None
+            if results:
+                try:
+                    yield results
+                except GeneratorExit:
+                    if next_page is not None:
+                        next_page.cancel()
+                    raise
+            if next_page is None:
+                return
+            response = next_page.result()
+
+
+def write_record_id_file(path: str, ids: Iterable[str], run_size: int = DEFAULT_RUN_SIZE) -> int:
+    """Writes ids sorted and deduplicated to a RecordIdFile.
+        At most run_size ids are held in memory, bigger inputs are sorted in runs spilled to temporary files and merged.
+        Args:
+            path (str): destination file path.
+            ids (Iterable[str]): record ids, in any order and with duplicates.
+            run_size (int): number of ids sorted in memory at once.
+        Returns:
+            number of unique ids written
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    with ExitStack() as stack:
+        runs = []
+        run = set()
+        for record_id in ids:
+            run.add(record_id)
+            if len(run) >= run_size:
+                runs.append(_spill_run(stack, run, directory))
+                run = set()
+
+        if runs:
+            if run:
+                runs.append(_spill_run(stack, run, directory))
+            sorted_ids = (line.rstrip("\n") for line in heapq.merge(*runs))
+        else:
+            sorted_ids = iter(sorted(run))
+        return _write_sorted(path, sorted_ids)
+
+
+def _spill_run(stack: ExitStack, run: set, directory: str):
+    run_file = stack.enter_context(
+        tempfile.TemporaryFile("w+", encoding="utf-8", dir=directory, prefix=".ids-run-", newline="\n")
+    )
+    run_file.writelines(f"{record_id}\n" for record_id in sorted(run))
+    run_file.seek(0)
+    return run_file
+
+
+def _write_sorted(path: str, sorted_ids: Iterator[str]) -> int:
+    offsets = array("Q", [0])
+    previous = None
+    temporary_path = f"{path}.tmp"
+    try:
+        with open(temporary_path, "wb") as file:
+            for record_id in sorted_ids:
+                if record_id == previous:
+                    continue
+                previous = record_id
+                encoded = record_id.encode()
+                file.write(encoded)
+                offsets.append(offsets[-1] + len(encoded))
+            if sys.byteorder == "big":
+                offsets.byteswap()
+            file.write(offsets.tobytes())
+            count = len(offsets) - 1
+            file.write(_UINT64.pack(count))
+            file.write(MAGIC)
+    except BaseException:
+        if os.path.exists(temporary_path):
+            os.remove(temporary_path)
+        raise
+    os.replace(temporary_path, path)
+    return count
+
+
+class RecordIdFile:
+    """Read-only, memory-mapped view of a file written by write_record_id_file.
+
+        Ids are decoded on access only, membership is checked with a binary search over the mapped file.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        size = os.path.getsize(path)
+        if size < _FOOTER_SIZE:
+            raise OSDUClientError(f"{path} is not a record id file.")
+        with open(path, "rb") as file:
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[size - len(MAGIC):] != MAGIC:
+            self._mmap.close()
+            raise OSDUClientError(f"{path} is not a record id file.")
+        (self._count,) = _UINT64.unpack_from(self._mmap, size - _FOOTER_SIZE)
+        self._offsets_start = size - _FOOTER_SIZE - _UINT64.size * (self._count + 1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index: int) -> str:
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError(index)
+        start, end = struct.unpack_from("<2Q", self._mmap, self._offsets_start + _UINT64.size * index)
+        return self._mmap[start:end].decode()
+
+    def __iter__(self) -> Iterator[str]:
+        for index in range(self._count):
+            yield self[index]
+
+    def __contains__(self, record_id: str) -> bool:
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self[middle] < record_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low < self._count and self[low] == record_id
+
+    def close(self):
+        self._mmap.close()
+
+    def __enter__(self) -> RecordIdFile:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def enumerate_kind_ids(
+    storage_client: StorageClient,
+    path: str,
+    *,
+    kind: str,
+    limit: int = DEFAULT_PAGE_SIZE,
+    run_size: int = DEFAULT_RUN_SIZE,
+    **query_kwargs,
+) -> RecordIdFile:
+    """Enumerates all record ids of a kind into a sorted, deduplicated id file and opens it.
+        See iter_record_id_pages and write_record_id_file for arguments.
+    """
+    pages = iter_record_id_pages(storage_client, kind=kind, limit=limit, **query_kwargs)
+    write_record_id_file(path, (record_id for page in pages for record_id in page), run_size=run_size)
+    return RecordIdFile(path)
@@ -0,0 +1,211 @@
+from __future__ import annotations
+
+import threading
+import time
+from concurrent.futures import Future, wait
+from typing import Iterable
+
+from osdu_client.concurrency import DEFAULT_MAX_WORKERS, map_concurrently
+from osdu_client.exceptions import OSDUReplayFailedError
+
+from .client import StorageClient
+
+DEFAULT_OPERATION = "reindex"
+DEFAULT_MIN_INTERVAL = 1.0
+DEFAULT_MAX_INTERVAL = 60.0
+DEFAULT_MAX_POLL_ERRORS = 5
+
+COMPLETED = "COMPLETED"
+FAILED = "FAILED"
+
+
+def _status_value(status: dict, *names: str):
+    # The service reports e.g. both "overallState" and "OverallState", "totalRecords" and "totalRecordsOverall".
+    for name in names:
+        if status.get(name) is not None:
+            return status[name]
+    return None
+
+
+class ReplayJob:
+    """One replay started by ReplayManager. future resolves to the final status or fails with
+        OSDUReplayFailedError.
+    """
+
+    def __init__(self, replay_id: str, kind: str | None, data_partition_id: str | None, interval: float):
+        self.replay_id = replay_id
+        self.kind = kind
+        self.data_partition_id = data_partition_id
+        self.status: dict | None = None
+        self.future = Future()
+
+        now = time.monotonic()
+        self.interval = interval
+        self.next_poll_at = now + interval
+        self._last_progress = (now, 0)
+        self._poll_errors = 0
+
+    @property
+    def state(self) -> str | None:
+        state = _status_value(self.status or {}, "overallState", "OverallState", "state")
+        return state.upper() if state else None
+
+    @property
+    def total_records(self) -> int:
+        return int(_status_value(self.status or {}, "totalRecords", "totalRecordsOverall") or 0)
+
+    @property
+    def processed_records(self) -> int:
+        return int(_status_value(self.status or {}, "processedRecords", "processedRecordsOverall") or 0)
+
+    def done(self) -> bool:
+        return self.future.done()
+
+    def result(self, timeout: float | None = None) -> dict:
+        return self.future.result(timeout)
+
+
+class ReplayManager:
+    """Starts Storage replays for many kinds and tracks them with one background poller.
+
+        Each job is polled on its own schedule. While a replay progresses, the next poll is planned at half of its
+        estimated remaining time, otherwise the interval is doubled. Intervals stay between min_interval and
+        max_interval seconds. Use as a context manager or call close to stop the poller, unfinished jobs are cancelled.
+    """
+
+    def __init__(
+        self,
+        storage_client: StorageClient,
+        min_interval: float = DEFAULT_MIN_INTERVAL,
+        max_interval: float = DEFAULT_MAX_INTERVAL,
+        max_poll_errors: int = DEFAULT_MAX_POLL_ERRORS,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+    ):
+        self.storage_client = storage_client
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.max_poll_errors = max_poll_errors
+        self.max_workers = max_workers
+
+        self._jobs = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._closed = False
+        self._poller = None
+
+    @property
+    def jobs(self) -> list[ReplayJob]:
+        with self._lock:
+            return list(self._jobs)
+
+    def start(
+        self,
+        *,
+        kinds: Iterable[str] | None = None,
+        operation: str = DEFAULT_OPERATION,
+        data_partition_id: str | None = None,
+    ) -> list[ReplayJob]:
+        """Starts one replay per kind concurrently, or a single replay of all kinds when kinds is None.
+            Args:
+                kinds (Iterable[str]): kinds to replay.
+                operation (str): replay operation, e.g. "reindex" or "replay".
+                data_partition_id (str): identifier of the data partition. If None sets by auth session.
+            Returns:
+                list of ReplayJob
+        """
+        kinds = [None] if kinds is None else list(kinds)
+        jobs = map_concurrently(
+            lambda kind: self._launch(kind, operation, data_partition_id), kinds, max_workers=self.max_workers
+        )
+        with self._lock:
+            self._jobs += jobs
+            if self._poller is None:
+                self._poller = threading.Thread(target=self._poll_loop, name="osdu-replay-poller", daemon=True)
+                self._poller.start()
+        self._wakeup.set()
+        return jobs
+
+    def progress(self) -> float:
+        """Returns the share of processed records over all jobs, from 0.0 to 1.0."""
+        jobs = self.jobs
+        total = sum(job.total_records for job in jobs)
+        if total:
+            return min(sum(job.processed_records for job in jobs) / total, 1.0)
+        return 1.0 if jobs and all(job.done() for job in jobs) else 0.0
+
+    def wait(self, timeout: float | None = None) -> bool:
+        """Blocks until all jobs are finished, returns False if timeout passed first."""
+        _, not_done = wait([job.future for job in self.jobs], timeout=timeout)
+        return not not_done
+
+    def close(self):
+        """Stops the poller and cancels jobs which are not finished, so wait and result do not block."""
+        self._closed = True
+        self._wakeup.set()
+        if self._poller is not None:
+            self._poller.join()
+        for job in self.jobs:
+            # Waiters are only woken up once the cancellation is notified.
+            if job.future.cancel():
+                job.future.set_running_or_notify_cancel()
+
+    def __enter__(self) -> ReplayManager:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _launch(self, kind: str | None, operation: str, data_partition_id: str | None) -> ReplayJob:
+        response = self.storage_client.create_replay(
+            operation=operation,
+            filter={"kinds": [kind]} if kind is not None else None,
+            data_partition_id=data_partition_id,
+        )
+        return ReplayJob(str(response["replayId"]), kind, data_partition_id, self.min_interval)
+
+    def _poll_loop(self):
+        while not self._closed:
+            now = time.monotonic()
+            active = [job for job in self.jobs if not job.done()]
+            due = [job for job in active if job.next_poll_at <= now]
+            if due:
+                map_concurrently(self._poll, due, max_workers=self.max_workers)
+                continue
+            timeout = min(job.next_poll_at for job in active) - now if active else None
+            self._wakeup.wait(timeout)
+            self._wakeup.clear()
+
+    def _poll(self, job: ReplayJob):
+        try:
+            status = self.storage_client.get_replay_status(id=job.replay_id, data_partition_id=job.data_partition_id)
+        except Exception as e:
+            job._poll_errors += 1
+            if job._poll_errors >= self.max_poll_errors:
+                job.future.set_exception(e)
+            else:
+                job.interval = min(job.interval * 2, self.max_interval)
+                job.next_poll_at = time.monotonic() + job.interval
+            return
+
+        job._poll_errors = 0
+        job.status = status
+        if job.state == COMPLETED:
+            job.future.set_result(status)
+        elif job.state == FAILED:
+            job.future.set_exception(OSDUReplayFailedError(f"Replay {job.replay_id} failed.", status))
+        else:
+            now = time.monotonic()
+            job.interval = self._next_interval(job, now)
+            job.next_poll_at = now + job.interval
+
+    def _next_interval(self, job: ReplayJob, now: float) -> float:
+        previous_time, previous_processed = job._last_progress
+        processed = job.processed_records
+        job._last_progress = (now, processed)
+        remaining = job.total_records - processed
+        if processed > previous_processed and remaining > 0 and now > previous_time:
+            rate = (processed - previous_processed) / (now - previous_time)
+            interval = remaining / rate / 2
+        else:
+            interval = job.interval * 2
+        return min(max(interval, self.min_interval), self.max_interval)
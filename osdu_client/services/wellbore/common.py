@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CatalogRecord, GuessRequest
@@ -28,15 +25,13 @@ class WellboreCommonClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "about")
-        response = requests.get(url, headers=headers)
+        url = self._url("about")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def recognize_family(
         self,
@@ -59,9 +54,7 @@ class WellboreCommonClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "label": label,
@@ -74,11 +67,11 @@ class WellboreCommonClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, GuessRequest)
 
-        url = urljoin(self.base_url, self.service_path, "log-recognition/family")
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("log-recognition/family")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_log_recognition_upload_catalog(
         self,
@@ -104,9 +97,7 @@ class WellboreCommonClient(OSDUAPIClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "acl": acl,
@@ -117,13 +108,11 @@ class WellboreCommonClient(OSDUAPIClient):
         if self.validation:
             validate_data(request_data, CatalogRecord)
 
-        url = urljoin(
-            self.base_url, self.service_path, "log-recognition/upload-catalog"
-        )
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("log-recognition/upload-catalog")
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version(self, data_partition_id: str | None = None) -> dict:
         """
@@ -136,12 +125,10 @@ class WellboreCommonClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "version")
-        response = requests.get(url, headers=headers)
+        url = self._url("version")
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.wellbore.common import WellboreCommonClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CreateDataSessionRequest, Dip, UpdateSessionState
@@ -76,9 +73,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -94,13 +89,11 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url, self.service_path, "alpha/ddms/v2/logs/%s/data" % record_id
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("alpha/ddms/v2/logs/%s/data" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def write_alpha_logs_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -128,17 +121,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "alpha/ddms/v2/logs/%s/data" % record_id
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("alpha/ddms/v2/logs/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_records_sessions_v2(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -154,19 +143,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/sessions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("alpha/ddms/v2/logs/%s/sessions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_alpha_logs_sessions(
         self,
@@ -198,9 +181,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "mode": mode,
@@ -215,15 +196,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, CreateDataSessionRequest)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/sessions" % record_id,
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("alpha/ddms/v2/logs/%s/sessions" % record_id)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_session_v2(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -240,19 +217,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/sessions/%s" % (record_id, session_id),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("alpha/ddms/v2/logs/%s/sessions/%s" % (record_id, session_id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_alpha_logs_sessions(
         self,
@@ -277,9 +248,7 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "state": state,
@@ -288,15 +257,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, UpdateSessionState)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/sessions/%s" % (record_id, session_id),
-        )
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("alpha/ddms/v2/logs/%s/sessions/%s" % (record_id, session_id))
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def send_alpha_logs_sessions_data(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -314,19 +279,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/sessions/%s/data" % (record_id, session_id),
+        url = self._url(
+            "alpha/ddms/v2/logs/%s/sessions/%s/data" % (record_id, session_id)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_alpha_logs_versions_data(
         self,
@@ -389,9 +350,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -407,36 +366,35 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v2/logs/%s/versions/%s/data" % (record_id, version),
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("alpha/ddms/v2/logs/%s/versions/%s/data" % (record_id, version))
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_dipset(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_dipset(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/dipsets")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("ddms/v2/dipsets")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_dipset(
         self,
@@ -457,19 +415,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if recursive is not None:
             params["recursive"] = recursive
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/dipsets/%s" % dipsetid)
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v2/dipsets/%s" % dipsetid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dipset(
         self, *, dipsetid: str, data_partition_id: str | None = None
@@ -487,15 +443,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/dipsets/%s" % dipsetid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/dipsets/%s" % dipsetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dip(
         self,
@@ -521,9 +475,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if index is not None:
@@ -531,16 +483,14 @@ class WellboreClient(WellboreCommonClient):
         if limit is not None:
             params["limit"] = limit
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/dipsets/%s/dips" % dipsetid
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/dipsets/%s/dips" % dipsetid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def define_dips_dipset(
-        self, *, dipsetid: str, data_partition_id: str | None = None
+        self, *, dipsetid: str, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
             Replace previous dips by provided dips. Sort dips by reference and azimuth.
@@ -548,26 +498,25 @@ class WellboreClient(WellboreCommonClient):
             Args:
                 data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
                 dipsetid (str): The ID of the dipset
+                body (list[dict]):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/dipsets/%s/dips" % dipsetid
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("ddms/v2/dipsets/%s/dips" % dipsetid)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def insert_dip_in_dipset(
-        self, *, dipsetid: str, data_partition_id: str | None = None
+        self, *, dipsetid: str, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
             Insert dips in dipset.
@@ -578,25 +527,22 @@ class WellboreClient(WellboreCommonClient):
             Args:
                 data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
                 dipsetid (str):
+                body (list[dict]):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/dipsets/%s/dips/insert" % dipsetid,
-        )
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("ddms/v2/dipsets/%s/dips/insert" % dipsetid)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_dip_from_dipset(
         self,
@@ -623,9 +569,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if min_reference is not None:
@@ -635,13 +579,11 @@ class WellboreClient(WellboreCommonClient):
         if classification is not None:
             params["classification"] = classification
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/dipsets/%s/dips/query" % dipsetid
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/dipsets/%s/dips/query" % dipsetid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_dip(
         self, *, dipsetid: str, index: str, data_partition_id: str | None = None
@@ -659,19 +601,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index),
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dip_at_index(
         self, *, dipsetid: str, index: str, data_partition_id: str | None = None
@@ -690,19 +626,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_dip(
         self,
@@ -740,9 +670,7 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "azimuth": azimuth,
@@ -763,15 +691,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, Dip)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index),
-        )
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("ddms/v2/dipsets/%s/dips/%s" % (dipsetid, index))
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_versions_dipset(
         self, *, dipsetid: str, data_partition_id: str | None = None
@@ -788,17 +712,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/dipsets/%s/versions" % dipsetid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/dipsets/%s/versions" % dipsetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_dipsets_versions(
         self, *, dipsetid: str, version: str, data_partition_id: str | None = None
@@ -817,40 +737,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/dipsets/%s/versions/%s" % (dipsetid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/dipsets/%s/versions/%s" % (dipsetid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_logs(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_logs(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logs")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v2/logs")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_log(self, *, logid: str, data_partition_id: str | None = None) -> dict:
         """
@@ -864,15 +781,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logs/%s" % logid)
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v2/logs/%s" % logid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log(self, *, logid: str, data_partition_id: str | None = None) -> dict:
         """
@@ -892,15 +807,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logs/%s" % logid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logs/%s" % logid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log_data(
         self,
@@ -925,9 +838,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if orient is not None:
@@ -935,11 +846,11 @@ class WellboreClient(WellboreCommonClient):
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logs/%s/data" % logid)
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logs/%s/data" % logid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def write_log_data(
         self,
@@ -963,9 +874,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if orient is not None:
@@ -973,11 +882,11 @@ class WellboreClient(WellboreCommonClient):
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logs/%s/data" % logid)
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logs/%s/data" % logid)
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_decimated_log(
         self,
@@ -1009,9 +918,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if quantiles is not None:
@@ -1025,13 +932,11 @@ class WellboreClient(WellboreCommonClient):
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/logs/%s/decimated" % logid
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logs/%s/decimated" % logid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log_statistics(
         self,
@@ -1054,21 +959,17 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/logs/%s/statistics" % logid
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logs/%s/statistics" % logid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def upload_log_data(
         self,
@@ -1076,6 +977,7 @@ class WellboreClient(WellboreCommonClient):
         logid: str,
         orient: str | None = None,
         bulk_path: str | None = None,
+        file: bytes,
         data_partition_id: str | None = None,
     ) -> dict:
         """
@@ -1086,15 +988,14 @@ class WellboreClient(WellboreCommonClient):
                 logid (str):
                 orient (str): format for JSON only.
                 bulk_path (str): The json path to the bulk reference (see https://goessner.net/articles/JsonPath/). Required for non wks:log.
+                file (bytes):
             Returns:
                 response data (dict)
             Raises:
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if orient is not None:
@@ -1102,13 +1003,17 @@ class WellboreClient(WellboreCommonClient):
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/logs/%s/upload_data" % logid
+        files = {
+            "file": file,
+        }
+
+        url = self._url("ddms/v2/logs/%s/upload_data" % logid)
+        response = self._request(
+            "post", url, headers=headers, params=params, files=files
         )
-        response = requests.post(url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log_versions(
         self, *, logid: str, data_partition_id: str | None = None
@@ -1125,17 +1030,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/logs/%s/versions" % logid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logs/%s/versions" % logid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log_version(
         self, *, logid: str, version: str, data_partition_id: str | None = None
@@ -1153,19 +1054,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/logs/%s/versions/%s" % (logid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logs/%s/versions/%s" % (logid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_log_version_data(
         self,
@@ -1192,9 +1087,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if orient is not None:
@@ -1202,36 +1095,35 @@ class WellboreClient(WellboreCommonClient):
         if bulk_path is not None:
             params["bulk-path"] = bulk_path
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/logs/%s/versions/%s/data" % (logid, version),
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logs/%s/versions/%s/data" % (logid, version))
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_logsets(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_logsets(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logsets")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v2/logsets")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_logset(
         self,
@@ -1252,19 +1144,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if recursive is not None:
             params["recursive"] = recursive
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logsets/%s" % logsetid)
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v2/logsets/%s" % logsetid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_logset(
         self, *, logsetid: str, data_partition_id: str | None = None
@@ -1282,15 +1172,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/logsets/%s" % logsetid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logsets/%s" % logsetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_logset_versions(
         self, *, logsetid: str, data_partition_id: str | None = None
@@ -1307,17 +1195,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/logsets/%s/versions" % logsetid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logsets/%s/versions" % logsetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_logset_version(
         self, *, logsetid: str, version: str, data_partition_id: str | None = None
@@ -1336,40 +1220,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/logsets/%s/versions/%s" % (logsetid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/logsets/%s/versions/%s" % (logsetid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_marker(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_marker(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/markers")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("ddms/v2/markers")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_marker(
         self, *, markerid: str, data_partition_id: str | None = None
@@ -1385,15 +1266,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/markers/%s" % markerid)
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v2/markers/%s" % markerid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_marker(
         self, *, markerid: str, data_partition_id: str | None = None
@@ -1411,15 +1290,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/markers/%s" % markerid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/markers/%s" % markerid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_marker_versions(
         self, *, markerid: str, data_partition_id: str | None = None
@@ -1436,17 +1313,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/markers/%s/versions" % markerid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/markers/%s/versions" % markerid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_marker_version(
         self, *, markerid: str, version: str, data_partition_id: str | None = None
@@ -1464,42 +1337,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/markers/%s/versions/%s" % (markerid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/markers/%s/versions/%s" % (markerid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_trajectories(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/trajectories")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v2/trajectories")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_trajectory(
         self, *, trajectoryid: str, data_partition_id: str | None = None
@@ -1515,17 +1383,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/trajectories/%s" % trajectoryid
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v2/trajectories/%s" % trajectoryid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_trajectory(
         self, *, trajectoryid: str, data_partition_id: str | None = None
@@ -1543,17 +1407,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/trajectories/%s" % trajectoryid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/trajectories/%s" % trajectoryid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_trajectory_data(
         self,
@@ -1578,9 +1438,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if channels is not None:
@@ -1588,15 +1446,11 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/trajectories/%s/data" % trajectoryid,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v2/trajectories/%s/data" % trajectoryid)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_trajectory_data(
         self,
@@ -1618,23 +1472,17 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/trajectories/%s/data" % trajectoryid,
-        )
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("ddms/v2/trajectories/%s/data" % trajectoryid)
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_trajectory_versions(
         self, *, trajectoryid: str, data_partition_id: str | None = None
@@ -1651,19 +1499,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/trajectories/%s/versions" % trajectoryid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/trajectories/%s/versions" % trajectoryid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_trajectory_version(
         self, *, trajectoryid: str, version: str, data_partition_id: str | None = None
@@ -1681,19 +1523,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/trajectories/%s/versions/%s" % (trajectoryid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/trajectories/%s/versions/%s" % (trajectoryid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_trajectory_version_data(
         self,
@@ -1720,9 +1556,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if channels is not None:
@@ -1730,38 +1564,37 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/trajectories/%s/versions/%s/data" % (trajectoryid, version),
+        url = self._url(
+            "ddms/v2/trajectories/%s/versions/%s/data" % (trajectoryid, version)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_wellbore_v2(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/wellbores")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v2/wellbores")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_wellbores(
         self,
@@ -1782,21 +1615,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if recursive is not None:
             params["recursive"] = recursive
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/wellbores/%s" % wellboreid
-        )
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v2/wellbores/%s" % wellboreid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbores(
         self, *, wellboreid: str, data_partition_id: str | None = None
@@ -1818,17 +1647,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/wellbores/%s" % wellboreid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wellbores/%s" % wellboreid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_versions_wellbore(
         self, *, wellboreid: str, data_partition_id: str | None = None
@@ -1845,19 +1670,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/wellbores/%s/versions" % wellboreid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wellbores/%s/versions" % wellboreid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbores_versions(
         self, *, wellboreid: str, version: str, data_partition_id: str | None = None
@@ -1880,40 +1699,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/wellbores/%s/versions/%s" % (wellboreid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wellbores/%s/versions/%s" % (wellboreid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_well(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_well(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/wells")
-        response = requests.post(url, headers=headers)
+        request_data = body
+
+        url = self._url("ddms/v2/wells")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_well(
         self,
@@ -1934,19 +1750,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if recursive is not None:
             params["recursive"] = recursive
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/wells/%s" % wellid)
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v2/wells/%s" % wellid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_v2(self, *, wellid: str, data_partition_id: str | None = None) -> dict:
         """
@@ -1966,15 +1780,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v2/wells/%s" % wellid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wells/%s" % wellid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_versions_v2(
         self, *, wellid: str, data_partition_id: str | None = None
@@ -1991,17 +1803,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v2/wells/%s/versions" % wellid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wells/%s/versions" % wellid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_version(
         self, *, wellid: str, version: str, data_partition_id: str | None = None
@@ -2024,16 +1832,10 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v2/wells/%s/versions/%s" % (wellid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v2/wells/%s/versions/%s" % (wellid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
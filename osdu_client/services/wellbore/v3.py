@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.wellbore.common import WellboreCommonClient
-from osdu_client.utils import urljoin
 from osdu_client.validation import validate_data
 
 from .models import CreateDataSessionRequest, UpdateSessionState
@@ -36,19 +33,17 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if names is not None:
             params["names"] = names
 
-        url = urljoin(self.base_url, self.service_path, "alpha/ddms/v3/query/wellbores")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("alpha/ddms/v3/query/wellbores")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_alpha_query_wellbores_wellboretrajectories(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -68,19 +63,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "alpha/ddms/v3/query/wellbores/%s/wellboretrajectories" % wellbore_id,
+        url = self._url(
+            "alpha/ddms/v3/query/wellbores/%s/wellboretrajectories" % wellbore_id
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_alpha_query_welllogs(
         self,
@@ -106,9 +97,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if names is not None:
@@ -118,11 +107,11 @@ class WellboreClient(WellboreCommonClient):
         if mnemonics is not None:
             params["mnemonics"] = mnemonics
 
-        url = urljoin(self.base_url, self.service_path, "alpha/ddms/v3/query/welllogs")
-        response = requests.post(url, headers=headers, params=params)
+        url = self._url("alpha/ddms/v3/query/welllogs")
+        response = self._request("post", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_query_wellbore_welllogs(
         self, *, wellbore_attribute: str, data_partition_id: str | None = None
@@ -142,19 +131,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/query/wellbore/%s/welllogs" % wellbore_attribute,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/query/wellbore/%s/welllogs" % wellbore_attribute)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_query_wellbores_wellboremarkersets(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -174,19 +157,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/query/wellbores/%s/wellboremarkersets" % wellbore_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/query/wellbores/%s/wellboremarkersets" % wellbore_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_query_wellbores_welllogs(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -206,42 +183,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/query/wellbores/%s/welllogs" % wellbore_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/query/wellbores/%s/welllogs" % wellbore_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_wellbore_interval_set(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wellboreintervalsets")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wellboreintervalsets")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_wellbore_interval_set(
         self, *, wellboreintervalsetsid: str, data_partition_id: str | None = None
@@ -257,19 +229,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboreintervalsets/%s" % wellboreintervalsetsid,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v3/wellboreintervalsets/%s" % wellboreintervalsetsid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_interval_set(
         self, *, wellboreintervalsetsid: str, data_partition_id: str | None = None
@@ -287,19 +253,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboreintervalsets/%s" % wellboreintervalsetsid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellboreintervalsets/%s" % wellboreintervalsetsid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_versions_wellbore_interval_set(
         self, *, wellboreintervalsetsid: str, data_partition_id: str | None = None
@@ -316,19 +276,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboreintervalsets/%s/versions" % wellboreintervalsetsid,
+        url = self._url(
+            "ddms/v3/wellboreintervalsets/%s/versions" % wellboreintervalsetsid
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_interval_sets_versions(
         self,
@@ -351,41 +307,40 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "ddms/v3/wellboreintervalsets/%s/versions/%s"
-            % (wellboreintervalsetsid, version),
+            % (wellboreintervalsetsid, version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_wellbore_markerset(self, data_partition_id: str | None = None) -> dict:
+    def create_wellbore_markerset(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wellboremarkersets")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wellboremarkersets")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_wellbore_markerset(
         self, *, wellboremarkersetid: str, data_partition_id: str | None = None
@@ -401,19 +356,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboremarkersets/%s" % wellboremarkersetid,
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v3/wellboremarkersets/%s" % wellboremarkersetid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboremarkersets(
         self, *, wellboremarkersetid: str, data_partition_id: str | None = None
@@ -431,19 +380,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboremarkersets/%s" % wellboremarkersetid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellboremarkersets/%s" % wellboremarkersetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboremarkerset_versions(
         self, *, wellboremarkersetid: str, data_partition_id: str | None = None
@@ -460,19 +403,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboremarkersets/%s/versions" % wellboremarkersetid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellboremarkersets/%s/versions" % wellboremarkersetid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboremarkersets_versions(
         self,
@@ -495,43 +432,39 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboremarkersets/%s/versions/%s"
-            % (wellboremarkersetid, version),
+        url = self._url(
+            "ddms/v3/wellboremarkersets/%s/versions/%s" % (wellboremarkersetid, version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_or_update_wellbore_v3(
-        self, data_partition_id: str | None = None
+        self, *, body: list[dict], data_partition_id: str | None = None
     ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wellbores")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wellbores")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_wellbore(
         self, *, wellboreid: str, data_partition_id: str | None = None
@@ -547,17 +480,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/wellbores/%s" % wellboreid
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v3/wellbores/%s" % wellboreid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore(
         self, *, wellboreid: str, data_partition_id: str | None = None
@@ -575,17 +504,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/wellbores/%s" % wellboreid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellbores/%s" % wellboreid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_versions(
         self, *, wellboreid: str, data_partition_id: str | None = None
@@ -602,19 +527,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellbores/%s/versions" % wellboreid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellbores/%s/versions" % wellboreid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbores_versions(
         self, *, wellboreid: str, version: str, data_partition_id: str | None = None
@@ -633,40 +552,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellbores/%s/versions/%s" % (wellboreid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellbores/%s/versions/%s" % (wellboreid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_wellboretrajectories(self, data_partition_id: str | None = None) -> dict:
+    def create_wellboretrajectories(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wellboretrajectories")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wellboretrajectories")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboretrajectories_data(
         self,
@@ -727,9 +643,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -745,15 +659,11 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/data" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v3/wellboretrajectories/%s/data" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_wellboretrajectories_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -781,19 +691,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/data" % record_id,
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wellboretrajectories/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_records_sessions_v3(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -809,19 +713,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/sessions" % record_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellboretrajectories/%s/sessions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_wellboretrajectories_sessions(
         self,
@@ -853,9 +751,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "mode": mode,
@@ -870,15 +766,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, CreateDataSessionRequest)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/sessions" % record_id,
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("ddms/v3/wellboretrajectories/%s/sessions" % record_id)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_record_session_v3(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -895,19 +787,15 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/sessions/%s" % (record_id, session_id),
+        url = self._url(
+            "ddms/v3/wellboretrajectories/%s/sessions/%s" % (record_id, session_id)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def patch_wellboretrajectories_sessions(
         self,
@@ -932,9 +820,7 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "state": state,
@@ -943,15 +829,13 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, UpdateSessionState)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/sessions/%s" % (record_id, session_id),
+        url = self._url(
+            "ddms/v3/wellboretrajectories/%s/sessions/%s" % (record_id, session_id)
         )
-        response = requests.patch(url, headers=headers, json=request_data)
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_wellboretrajectories_sessions_data(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -969,20 +853,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/sessions/%s/data"
-            % (record_id, session_id),
+        url = self._url(
+            "ddms/v3/wellboretrajectories/%s/sessions/%s/data" % (record_id, session_id)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_returns_data_specified_version(
         self,
@@ -1045,9 +924,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -1063,15 +940,13 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/versions/%s/data" % (record_id, version),
+        url = self._url(
+            "ddms/v3/wellboretrajectories/%s/versions/%s/data" % (record_id, version)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_wellboretrajectories(
         self,
@@ -1092,23 +967,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if purge is not None:
             params["purge"] = purge
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s" % wellboretrajectoryid,
-        )
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v3/wellboretrajectories/%s" % wellboretrajectoryid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboretrajectories(
         self, *, wellboretrajectoryid: str, data_partition_id: str | None = None
@@ -1126,19 +995,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s" % wellboretrajectoryid,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wellboretrajectories/%s" % wellboretrajectoryid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_versions_wellboretrajectory(
         self, *, wellboretrajectoryid: str, data_partition_id: str | None = None
@@ -1155,19 +1018,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wellboretrajectories/%s/versions" % wellboretrajectoryid,
+        url = self._url(
+            "ddms/v3/wellboretrajectories/%s/versions" % wellboretrajectoryid
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellboretrajectories_versions(
         self,
@@ -1190,41 +1049,40 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "ddms/v3/wellboretrajectories/%s/versions/%s"
-            % (wellboretrajectoryid, version),
+            % (wellboretrajectoryid, version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_welllogs(self, data_partition_id: str | None = None) -> dict:
+    def create_welllogs(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/welllogs")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/welllogs")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllogs_data(
         self,
@@ -1285,9 +1143,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -1303,13 +1159,11 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s/data" % record_id
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v3/welllogs/%s/data" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_welllogs_data(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1337,17 +1191,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s/data" % record_id
-        )
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s/data" % record_id)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllogs_data_statistics(
         self,
@@ -1383,23 +1233,17 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if curves is not None:
             params["curves"] = curves
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/data/statistics" % record_id,
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v3/welllogs/%s/data/statistics" % record_id)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def list_session_given_record(
         self, *, record_id: str, data_partition_id: str | None = None
@@ -1415,17 +1259,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s/sessions" % record_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s/sessions" % record_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def create_welllogs_sessions(
         self,
@@ -1457,9 +1297,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "mode": mode,
@@ -1474,13 +1312,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, CreateDataSessionRequest)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s/sessions" % record_id
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("ddms/v3/welllogs/%s/sessions" % record_id)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_session(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -1497,19 +1333,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/sessions/%s" % (record_id, session_id),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s/sessions/%s" % (record_id, session_id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def update_welllogs_sessions(
         self,
@@ -1534,9 +1364,7 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         request_data = {
             "state": state,
@@ -1545,15 +1373,11 @@ class WellboreClient(WellboreCommonClient):
         if self.validation:
             validate_data(request_data, UpdateSessionState)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/sessions/%s" % (record_id, session_id),
-        )
-        response = requests.patch(url, headers=headers, json=request_data)
+        url = self._url("ddms/v3/welllogs/%s/sessions/%s" % (record_id, session_id))
+        response = self._request("patch", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def send_welllog_sessions_data(
         self, *, record_id: str, session_id: str, data_partition_id: str | None = None
@@ -1571,19 +1395,15 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/sessions/%s/data" % (record_id, session_id),
+        url = self._url(
+            "ddms/v3/welllogs/%s/sessions/%s/data" % (record_id, session_id)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllog_version_data(
         self,
@@ -1646,9 +1466,7 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if offset is not None:
@@ -1664,15 +1482,11 @@ class WellboreClient(WellboreCommonClient):
         if orient is not None:
             params["orient"] = orient
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/versions/%s/data" % (record_id, version),
-        )
-        response = requests.get(url, headers=headers, params=params)
+        url = self._url("ddms/v3/welllogs/%s/versions/%s/data" % (record_id, version))
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllog_version_data_statistics(
         self,
@@ -1709,23 +1523,19 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if curves is not None:
             params["curves"] = curves
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/versions/%s/data/statistics" % (record_id, version),
+        url = self._url(
+            "ddms/v3/welllogs/%s/versions/%s/data/statistics" % (record_id, version)
         )
-        response = requests.get(url, headers=headers, params=params)
+        response = self._request("get", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def trigger_welllog_version_data_statistics(
         self, *, record_id: str, version: str, data_partition_id: str | None = None
@@ -1745,19 +1555,15 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/versions/%s/data/statistics" % (record_id, version),
+        url = self._url(
+            "ddms/v3/welllogs/%s/versions/%s/data/statistics" % (record_id, version)
         )
-        response = requests.post(url, headers=headers)
+        response = self._request("post", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_welllog(
         self,
@@ -1778,21 +1584,17 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
         params = {}
         if purge is not None:
             params["purge"] = purge
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s" % welllogid
-        )
-        response = requests.delete(url, headers=headers, params=params)
+        url = self._url("ddms/v3/welllogs/%s" % welllogid)
+        response = self._request("delete", url, headers=headers, params=params)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllog(
         self, *, welllogid: str, data_partition_id: str | None = None
@@ -1810,17 +1612,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s" % welllogid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s" % welllogid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllog_versions(
         self, *, welllogid: str, data_partition_id: str | None = None
@@ -1837,17 +1635,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/welllogs/%s/versions" % welllogid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s/versions" % welllogid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_welllog_version(
         self, *, welllogid: str, version: str, data_partition_id: str | None = None
@@ -1866,40 +1660,37 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/welllogs/%s/versions/%s" % (welllogid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/welllogs/%s/versions/%s" % (welllogid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
-    def create_or_update_wells(self, data_partition_id: str | None = None) -> dict:
+    def create_or_update_wells(
+        self, *, body: list[dict], data_partition_id: str | None = None
+    ) -> dict:
         """
         Required roles: 'users.datalake.editors' or 'users.datalake.admins
         Args:
             data_partition_id (str): identifier of the data partition to query. If None sets by auth session.
+            body (list[dict]):
         Returns:
             response data (dict)
         Raises:
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
+
+        request_data = body
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wells")
-        response = requests.post(url, headers=headers)
+        url = self._url("ddms/v3/wells")
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_well(self, *, wellid: str, data_partition_id: str | None = None) -> dict:
         """
@@ -1913,15 +1704,13 @@ class WellboreClient(WellboreCommonClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wells/%s" % wellid)
-        response = requests.delete(url, headers=headers)
+        url = self._url("ddms/v3/wells/%s" % wellid)
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well(self, *, wellid: str, data_partition_id: str | None = None) -> dict:
         """
@@ -1937,15 +1726,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "ddms/v3/wells/%s" % wellid)
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wells/%s" % wellid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_versions(
         self, *, wellid: str, data_partition_id: str | None = None
@@ -1962,17 +1749,13 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "ddms/v3/wells/%s/versions" % wellid
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wells/%s/versions" % wellid)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_version(
         self, *, wellid: str, version: str, data_partition_id: str | None = None
@@ -1991,16 +1774,10 @@ class WellboreClient(WellboreCommonClient):
                 OSDUValidation: if request values are wrong.
                 OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "ddms/v3/wells/%s/versions/%s" % (wellid, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("ddms/v3/wells/%s/versions/%s" % (wellid, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellboreAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
@@ -1,10 +1,7 @@
 from __future__ import annotations
 
-import requests
-
 from osdu_client.exceptions import OSDUAPIError
 from osdu_client.services.base import OSDUAPIClient
-from osdu_client.utils import urljoin
 
 
 class WellDeliveryAPIError(OSDUAPIError):
@@ -29,19 +26,15 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        request_data = {
-            "Entity": entity,
-        }
+        request_data = entity
 
-        url = urljoin(self.base_url, self.service_path, "storage/v1/%s" % type)
-        response = requests.put(url, headers=headers, json=request_data)
+        url = self._url("storage/v1/%s" % type)
+        response = self._request("put", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_entity(
         self, *, type: str, id: str, data_partition_id: str | None = None
@@ -58,15 +51,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "storage/v1/%s/%s" % (type, id))
-        response = requests.get(url, headers=headers)
+        url = self._url("storage/v1/%s/%s" % (type, id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_entity(
         self, *, type: str, id: str, data_partition_id: str | None = None
@@ -83,15 +74,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(self.base_url, self.service_path, "storage/v1/%s/%s" % (type, id))
-        response = requests.delete(url, headers=headers)
+        url = self._url("storage/v1/%s/%s" % (type, id))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_entity_version(
         self, *, type: str, id: str, version: str, data_partition_id: str | None = None
@@ -109,19 +98,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "storage/v1/%s/%s/%s" % (type, id, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("storage/v1/%s/%s/%s" % (type, id, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def delete_storage_version(
         self, *, type: str, id: str, version: str, data_partition_id: str | None = None
@@ -139,19 +122,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "storage/v1/%s/%s/%s" % (type, id, version),
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("storage/v1/%s/%s/%s" % (type, id, version))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_storage_version(
         self, *, type: str, id: str, data_partition_id: str | None = None
@@ -168,17 +145,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "storage/v1/%s/versions/%s" % (type, id)
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("storage/v1/%s/versions/%s" % (type, id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def purge_entity(
         self, *, type: str, id: str, data_partition_id: str | None = None
@@ -195,17 +168,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "storage/v1/%s/%s:purge" % (type, id)
-        )
-        response = requests.delete(url, headers=headers)
+        url = self._url("storage/v1/%s/%s:purge" % (type, id))
+        response = self._request("delete", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version_number_list_well_activity_program(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -221,19 +190,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellActivityPrograms/v1/versions/by_well/%s" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellActivityPrograms/v1/versions/by_well/%s" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_activity_program(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -249,19 +212,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellActivityPrograms/v1/by_well/%s" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellActivityPrograms/v1/by_well/%s" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_activity_program_version(
         self, *, well_id: str, wap_version: str, data_partition_id: str | None = None
@@ -278,19 +235,15 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellActivityPrograms/v1/by_well/%s/%s" % (well_id, wap_version),
+        url = self._url(
+            "wellActivityPrograms/v1/by_well/%s/%s" % (well_id, wap_version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_activity_program_with_refs(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -306,19 +259,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellActivityPrograms/v1/reference_tree/by_well/%s" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellActivityPrograms/v1/reference_tree/by_well/%s" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_activity_program_version_with_refs(
         self, *, well_id: str, wap_version: str, data_partition_id: str | None = None
@@ -335,20 +282,16 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "wellActivityPrograms/v1/reference_tree/by_well/%s/%s"
-            % (well_id, wap_version),
+            % (well_id, wap_version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_activity_programs_full_content_by_well(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -364,19 +307,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellActivityPrograms/v1/full_content/by_well/%s" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellActivityPrograms/v1/full_content/by_well/%s" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_activity_plans_by_well(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -392,17 +329,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "activityPlans/v1/by_well/%s" % well_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("activityPlans/v1/by_well/%s" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version_number_list_actual_well(
         self, *, name: str, data_partition_id: str | None = None
@@ -418,19 +351,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wells/v1/versions/by_name/%s:actual" % name,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/versions/by_name/%s:actual" % name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_by_name_actual(
         self, *, name: str, data_partition_id: str | None = None
@@ -446,17 +373,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "wells/v1/by_name/%s:actual" % name
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/by_name/%s:actual" % name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_version_by_name_actual(
         self, *, name: str, version: str, data_partition_id: str | None = None
@@ -473,19 +396,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wells/v1/by_name/%s/%s:actual" % (name, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/by_name/%s/%s:actual" % (name, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version_number_list_planned_well(
         self, *, name: str, data_partition_id: str | None = None
@@ -501,19 +418,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wells/v1/versions/by_name/%s:planned" % name,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/versions/by_name/%s:planned" % name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_by_name_planned(
         self, *, name: str, data_partition_id: str | None = None
@@ -529,17 +440,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "wells/v1/by_name/%s:planned" % name
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/by_name/%s:planned" % name)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_well_version_by_name_planned(
         self, *, name: str, version: str, data_partition_id: str | None = None
@@ -556,19 +463,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wells/v1/by_name/%s/%s:planned" % (name, version),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wells/v1/by_name/%s/%s:planned" % (name, version))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version_number_list_actual_wellbore(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -584,19 +485,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellbores/v1/versions/by_well/%s:actual" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellbores/v1/versions/by_well/%s:actual" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_actual(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -612,17 +507,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url, self.service_path, "wellbores/v1/by_well/%s:actual" % well_id
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellbores/v1/by_well/%s:actual" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_version_actual(
         self,
@@ -643,19 +534,15 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellbores/v1/by_well/%s/%s:actual" % (well_id, wellbore_version),
+        url = self._url(
+            "wellbores/v1/by_well/%s/%s:actual" % (well_id, wellbore_version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_version_number_list_planned_wellbore(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -671,19 +558,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellbores/v1/versions/by_well/%s:planned" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellbores/v1/versions/by_well/%s:planned" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_planned(
         self, *, well_id: str, data_partition_id: str | None = None
@@ -699,19 +580,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellbores/v1/by_well/%s:planned" % well_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("wellbores/v1/by_well/%s:planned" % well_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_version_planned(
         self,
@@ -732,19 +607,15 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "wellbores/v1/by_well/%s/%s:planned" % (well_id, wellbore_version),
+        url = self._url(
+            "wellbores/v1/by_well/%s/%s:planned" % (well_id, wellbore_version)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_hole_sections_v1_by_wellbore(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -760,19 +631,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "holeSections/v1/by_wellbore/%s" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("holeSections/v1/by_wellbore/%s" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_bha_runs_v1_by_hole_section(
         self, *, hole_section_id: str, data_partition_id: str | None = None
@@ -788,19 +653,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "bhaRuns/v1/by_holeSection/%s" % hole_section_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("bhaRuns/v1/by_holeSection/%s" % hole_section_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_bha_runs_v1_by_wellbore_actual(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -816,19 +675,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "bhaRuns/v1/by_wellbore/%s:actual" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("bhaRuns/v1/by_wellbore/%s:actual" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_v1_by_well_batch(
         self,
@@ -851,26 +704,20 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
         headers.update(
             {
                 "Content-Type": content__type,
             }
         )
 
-        request_data = {
-            "well_ids": well_ids,
-        }
+        request_data = well_ids
 
-        url = urljoin(
-            self.base_url, self.service_path, "query/v1/by_well/%s:batch" % type
-        )
-        response = requests.post(url, headers=headers, json=request_data)
+        url = self._url("query/v1/by_well/%s:batch" % type)
+        response = self._request("post", url, headers=headers, json=request_data)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_v1_by_wellbore_planned(
         self, *, type: str, wellbore_id: str, data_partition_id: str | None = None
@@ -887,19 +734,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "query/v1/%s/by_wellbore/%s:planned" % (type, wellbore_id),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("query/v1/%s/by_wellbore/%s:planned" % (type, wellbore_id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def query_v1_by_wellbore_actual(
         self, *, type: str, wellbore_id: str, data_partition_id: str | None = None
@@ -916,19 +757,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "query/v1/%s/by_wellbore/%s:actual" % (type, wellbore_id),
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("query/v1/%s/by_wellbore/%s:actual" % (type, wellbore_id))
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_fluids_programs(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -944,19 +779,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "fluidsPrograms/v1/by_wellbore/%s" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("fluidsPrograms/v1/by_wellbore/%s" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_operations_reports(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -972,19 +801,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "operationsReports/v1/by_wellbore/%s" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("operationsReports/v1/by_wellbore/%s" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_operations_reports_latest(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -1000,19 +823,13 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "operationsReports/v1/latest/by_wellbore/%s" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("operationsReports/v1/latest/by_wellbore/%s" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_operations_reports_by_time_range(
         self, *, start_time: str, end_time: str, data_partition_id: str | None = None
@@ -1029,19 +846,15 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "operationsReports/v1/by_timeRange/%s/%s" % (start_time, end_time),
+        url = self._url(
+            "operationsReports/v1/by_timeRange/%s/%s" % (start_time, end_time)
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_operations_reports_with_refs_by_operations_report_id(
         self, *, operations_report_id: str, data_partition_id: str | None = None
@@ -1057,20 +870,16 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
+        url = self._url(
             "operationsReports/v1/reference_tree/by_operationsReport/%s"
-            % operations_report_id,
+            % operations_report_id
         )
-        response = requests.get(url, headers=headers)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
 
     def get_wellbore_fluids_reports(
         self, *, wellbore_id: str, data_partition_id: str | None = None
@@ -1086,16 +895,10 @@ class WellDeliveryClient(OSDUAPIClient):
             OSDUValidation: if request values are wrong.
             OSDUAPIError: if response is 4XX or 5XX
         """
-        headers = self.auth.get_headers()
-        if data_partition_id:
-            headers["data-partition-id"] = data_partition_id
+        headers = self._headers(data_partition_id)
 
-        url = urljoin(
-            self.base_url,
-            self.service_path,
-            "fluidsReports/v1/by_wellbore/%s" % wellbore_id,
-        )
-        response = requests.get(url, headers=headers)
+        url = self._url("fluidsReports/v1/by_wellbore/%s" % wellbore_id)
+        response = self._request("get", url, headers=headers)
         if not response.ok:
             raise WellDeliveryAPIError(response.text, response.status_code)
-        return response.json()
+        return self._parse_response(response)
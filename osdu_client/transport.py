@@ -0,0 +1,268 @@
+from __future__ import annotations
+
+import socket
+import ssl
+import threading
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from urllib3.exceptions import ConnectTimeoutError, NewConnectionError
+from urllib3.util.ssl_ import create_urllib3_context, resolve_cert_reqs
+
+DEFAULT_POOL_MAXSIZE = 10
+DEFAULT_DNS_TTL = 300
+# (connect, read) seconds, read timeout applies to each socket read, not to the whole response
+DEFAULT_TIMEOUT = (10, 300)
+
+
+class DNSCache:
+    """Thread-safe cache of resolved host addresses kept for ttl seconds."""
+
+    def __init__(self, ttl: float = DEFAULT_DNS_TTL):
+        self.ttl = ttl
+        self._entries = {}
+        self._lock = threading.Lock()
+
+    def resolve(self, host: str, port: int) -> list[str]:
+        """Returns all addresses of host in getaddrinfo order."""
+        key = (host, port)
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None and entry[1] > now:
+            return entry[0]
+
+        addresses = list(dict.fromkeys(info[4][0] for info in socket.getaddrinfo(host, port, 0, socket.SOCK_STREAM)))
+        with self._lock:
+            self._entries[key] = (addresses, now + self.ttl)
+        return addresses
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class _CachedDNSConnectionMixin:
+    dns_cache: DNSCache
+
+    def _new_conn(self):
+        # Only the socket is opened against the cached addresses, TLS SNI and
+        # certificate checks still use the original host name. Addresses are
+        # tried in order, e.g. IPv4 when IPv6 is unreachable.
+        dns_host = self._dns_host
+        error = None
+        try:
+            for address in self.dns_cache.resolve(dns_host, self.port):
+                self._dns_host = address
+                try:
+                    return super()._new_conn()
+                except (NewConnectionError, ConnectTimeoutError) as e:
+                    error = e
+            raise error
+        finally:
+            self._dns_host = dns_host
+
+
+class TLSSessionCache:
+    """Keeps the last TLS session of every host, new connections to the host offer it to resume the session.
+        A session can only be resumed within the SSLContext it was created in, so connections share one context per
+        CA bundle and client certificate.
+    """
+
+    def __init__(self):
+        self._contexts = {}
+        self._sessions = {}
+        self._sockets = {}
+        self._lock = threading.Lock()
+
+    def context(self, ca_certs: str | None, ca_cert_dir: str | None, cert_file: str | None, key_file: str | None):
+        key = (ca_certs, ca_cert_dir, cert_file, key_file)
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is None:
+                context = create_urllib3_context()
+                if not ca_certs and not ca_cert_dir:
+                    context.load_default_certs()
+                context.sslsocket_class = _ResumingSSLSocket
+                context.tls_sessions = self
+                self._contexts[key] = context
+        return context
+
+    def get(self, context: ssl.SSLContext, host: str | None) -> ssl.SSLSession | None:
+        key = (id(context), host)
+        with self._lock:
+            sock_ref = self._sockets.get(key)
+            session = self._sessions.get(key)
+        sock = sock_ref() if sock_ref is not None else None
+        # TLS 1.3 tickets arrive after the handshake, the session of the last connection is usable once it has one.
+        latest = sock.session if sock is not None else None
+        if latest is not None and latest.has_ticket:
+            self.store(context, host, latest)
+            session = latest
+        return session
+
+    def store(self, context: ssl.SSLContext, host: str | None, session: ssl.SSLSession):
+        with self._lock:
+            self._sessions[(id(context), host)] = session
+
+    def track(self, context: ssl.SSLContext, host: str | None, sock: ssl.SSLSocket):
+        with self._lock:
+            self._sockets[(id(context), host)] = weakref.ref(sock)
+
+    def clear(self):
+        with self._lock:
+            self._sessions.clear()
+            self._sockets.clear()
+
+
+class _ResumingSSLSocket(ssl.SSLSocket):
+    @classmethod
+    def _create(
+        cls,
+        sock,
+        server_side=False,
+        do_handshake_on_connect=True,
+        suppress_ragged_eofs=True,
+        server_hostname=None,
+        context=None,
+        session=None,
+    ):
+        tls_sessions = context.tls_sessions
+        if session is None:
+            session = tls_sessions.get(context, server_hostname)
+        ssl_sock = super()._create(
+            sock, server_side, do_handshake_on_connect, suppress_ragged_eofs, server_hostname, context, session
+        )
+        tls_sessions.track(context, server_hostname, ssl_sock)
+        return ssl_sock
+
+    def _real_close(self):
+        # The session is gone with the connection, keep it for the next connection to the host.
+        session = self.session
+        if session is not None and session.has_ticket:
+            self.context.tls_sessions.store(self.context, self.server_hostname, session)
+        super()._real_close()
+
+
+class _TLSResumptionConnectionMixin:
+    tls_sessions: TLSSessionCache
+
+    def connect(self):
+        # Only connections verifying certificates the default way share a context, others keep urllib3 behaviour.
+        if (
+            self.ssl_context is None
+            and resolve_cert_reqs(self.cert_reqs) == ssl.CERT_REQUIRED
+            and not self.ca_cert_data
+            and not self.assert_fingerprint
+            and self.assert_hostname is None
+        ):
+            self.ssl_context = self.tls_sessions.context(self.ca_certs, self.ca_cert_dir, self.cert_file, self.key_file)
+        super().connect()
+
+
+def _pool_classes(dns_cache: DNSCache | None, tls_sessions: TLSSessionCache | None) -> dict:
+    http_mixins = (_CachedDNSConnectionMixin,) if dns_cache is not None else ()
+    https_mixins = http_mixins + ((_TLSResumptionConnectionMixin,) if tls_sessions is not None else ())
+    http_connection = type("PooledHTTPConnection", http_mixins + (HTTPConnection,), {"dns_cache": dns_cache})
+    https_connection = type(
+        "PooledHTTPSConnection",
+        https_mixins + (HTTPSConnection,),
+        {"dns_cache": dns_cache, "tls_sessions": tls_sessions},
+    )
+    return {
+        "http": type("PooledHTTPConnectionPool", (HTTPConnectionPool,), {"ConnectionCls": http_connection}),
+        "https": type("PooledHTTPSConnectionPool", (HTTPSConnectionPool,), {"ConnectionCls": https_connection}),
+    }
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter keeping connections alive in pools that resolve hosts through a DNSCache and resume TLS sessions
+    of new connections through a TLSSessionCache.
+    """
+
+    def __init__(
+        self,
+        dns_cache: DNSCache | None = None,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        tls_sessions: TLSSessionCache | None = None,
+        **kwargs,
+    ):
+        self.dns_cache = dns_cache
+        self.tls_sessions = tls_sessions
+        self.pool_maxsize = pool_maxsize
+        super().__init__(pool_maxsize=pool_maxsize, **kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        if self.dns_cache is not None or self.tls_sessions is not None:
+            self.poolmanager.pool_classes_by_scheme = _pool_classes(self.dns_cache, self.tls_sessions)
+
+
+def create_session(
+    pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+    dns_ttl: float | None = DEFAULT_DNS_TTL,
+    tls_session_resumption: bool = True,
+) -> requests.Session:
+    """Creates a requests session with keep-alive connection pools shared by OSDU clients.
+        Args:
+            pool_maxsize (int): Maximal number of kept-alive connections per host.
+            dns_ttl (float): Seconds for which resolved host addresses are reused. None disables the DNS cache.
+            tls_session_resumption (bool): New connections resume the TLS session of earlier connections to the host,
+                which skips the certificate exchange of a full handshake.
+        Returns:
+            requests.Session
+    """
+    session = requests.Session()
+    # OSDU APIs are stateless, cookies must not leak between calls made with different auth backends.
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    adapter = PooledHTTPAdapter(
+        dns_cache=DNSCache(dns_ttl) if dns_ttl is not None else None,
+        tls_sessions=TLSSessionCache() if tls_session_resumption else None,
+        pool_connections=pool_maxsize,
+        pool_maxsize=pool_maxsize,
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def warm_up(session: requests.Session, urls: list[str], connections: int = 1):
+    """Opens connections to the hosts of given urls and leaves them in the session pools.
+        Connections are opened with concurrent HEAD requests whose responses are kept open until all of them arrived,
+        so every request gets its own connection.
+        Args:
+            session (requests.Session): Session created with create_session.
+            urls (list[str]): Urls of the hosts to connect to. Duplicated hosts are connected once.
+            connections (int): Number of connections opened per host, capped by the adapter pool size.
+    """
+    origins = {}
+    for url in urls:
+        parts = urlsplit(url)
+        origins.setdefault((parts.scheme, parts.netloc), f"{parts.scheme}://{parts.netloc}/")
+
+    requested = []
+    for origin in origins.values():
+        pool_maxsize = getattr(session.get_adapter(origin), "pool_maxsize", connections)
+        requested += [origin] * min(connections, pool_maxsize)
+    if not requested:
+        return
+
+    responses = []
+    try:
+        with ThreadPoolExecutor(max_workers=len(requested)) as executor:
+            for response in executor.map(
+                lambda origin: session.head(origin, stream=True, timeout=DEFAULT_TIMEOUT), requested
+            ):
+                responses.append(response)
+    finally:
+        # Reading the empty body releases the connection back to the pool, close alone would drop it.
+        for response in responses:
+            response.content
+            response.close()
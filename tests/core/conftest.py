@@ -0,0 +1,133 @@
+import datetime
+import ipaddress
+import itertools
+import json
+import ssl
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests_mock
+
+from osdu_client.auth import AuthBackendInterface
+
+
+@pytest.fixture(scope="session")
+def auth_backend() -> AuthBackendInterface:
+    class AuthSession(AuthBackendInterface):
+        base_url = "https://base.url"
+        default_data_partition_id = "osdu"
+
+        authorization_header = {"Authorization": "Bearer access_token"}
+
+        def get_sd_connection_params(self):
+            return {}
+
+    return AuthSession()
+
+
+@pytest.fixture
+def api_server():
+    with requests_mock.Mocker() as mocker:
+        yield mocker
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections.append(self.client_address)
+        if isinstance(self.request, ssl.SSLSocket):
+            self.server.resumed.append(self.request.session_reused)
+
+    def do_HEAD(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        body = json.dumps(self.server.respond(self.path, next(self.server.calls))).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    """Real HTTP server for tests needing concurrent requests or real connections, requests_mock serializes calls.
+    Set respond(path, call_number) on it to build JSON responses."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.url = f"http://localhost:{server.server_address[1]}"
+    server.calls = itertools.count()
+    server.connections = []
+    server.respond = lambda path, call_number: {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _self_signed_certificate(directory) -> tuple[str, str]:
+    x509 = pytest.importorskip("cryptography.x509")
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(x509.oid.NameOID.COMMON_NAME, "127.0.0.1")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), False)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()
+        )
+    )
+    return str(cert_path), str(key_path)
+
+
+@pytest.fixture
+def local_tls_server(tmp_path):
+    """HTTPS variant of local_server with a self-signed certificate in cert_path. resumed tells for every accepted
+    connection if it resumed a TLS session."""
+    cert_path, key_path = _self_signed_certificate(tmp_path)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert_path, key_path)
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    server.url = f"https://127.0.0.1:{server.server_address[1]}"
+    server.cert_path = cert_path
+    server.calls = itertools.count()
+    server.connections = []
+    server.resumed = []
+    server.respond = lambda path, call_number: {}
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def local_auth_backend(auth_backend, local_server):
+    class LocalAuthSession(type(auth_backend)):
+        base_url = local_server.url
+
+    return LocalAuthSession()
@@ -0,0 +1,103 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from osdu_client.cache import TTLCache
+
+
+def test_entries_expire():
+    cache = TTLCache(ttl=0.05)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    time.sleep(0.06)
+    assert cache.get("key", "default") == "default"
+    assert len(cache) == 0
+
+
+def test_least_recently_used_entry_is_evicted():
+    cache = TTLCache(ttl=60, max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_concurrent_loads_are_shared():
+    cache = TTLCache(ttl=60)
+    calls = []
+    release = threading.Event()
+
+    def loader():
+        calls.append(1)
+        release.wait(1)
+        return "value"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(cache.get_or_load, "key", loader) for _ in range(4)]
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == ["value"] * 4
+    assert len(calls) == 1
+
+
+def test_load_errors_are_not_cached():
+    cache = TTLCache(ttl=60)
+
+    with pytest.raises(ValueError):
+        cache.get_or_load("key", lambda: (_ for _ in ()).throw(ValueError()))
+
+    assert cache.get_or_load("key", lambda: "value") == "value"
+
+
+def test_concurrent_batch_loads_share_keys():
+    cache = TTLCache(ttl=60)
+    cache.set("a", "cached")
+    calls = []
+    release = threading.Event()
+
+    def loader(keys):
+        calls.append(keys)
+        release.wait(1)
+        return {key: key.upper() for key in keys}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get_or_load_many, ["a", "b", "c"], loader)
+        time.sleep(0.05)
+        second = executor.submit(cache.get_or_load_many, ["c", "d"], loader)
+        time.sleep(0.05)
+        release.set()
+
+        assert first.result() == {"a": "cached", "b": "B", "c": "C"}
+        assert second.result() == {"c": "C", "d": "D"}
+    assert calls == [["b", "c"], ["d"]]
+
+
+def test_batch_load_missing_keys_fail_waiters():
+    cache = TTLCache(ttl=60)
+    release = threading.Event()
+
+    def loader(keys):
+        release.wait(1)
+        return {"a": "A"}
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(cache.get_or_load_many, ["a", "b"], loader)
+        time.sleep(0.05)
+        second = executor.submit(cache.get_or_load_many, ["b"], loader)
+        time.sleep(0.05)
+        release.set()
+
+        with pytest.raises(KeyError):
+            first.result(timeout=1)
+        with pytest.raises(KeyError):
+            second.result(timeout=1)
+    assert cache.get_or_load_many(["b"], lambda keys: {"b": "B"}) == {"b": "B"}
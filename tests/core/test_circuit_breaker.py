@@ -0,0 +1,80 @@
+import pytest
+
+from osdu_client.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitBreakers
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUAPIError, OSDUCircuitOpenError
+
+STORAGE_INFO_URL = "https://base.url/api/storage/v2/info"
+SEARCH_INFO_URL = "https://base.url/api/search/v2/info"
+
+
+def test_breaker_opens_on_failure_rate():
+    breaker = CircuitBreaker(window_size=4, minimum_calls=4, failure_rate_threshold=0.5)
+    for success in (True, False, True, False):
+        breaker.before_call()
+        breaker.record(success)
+
+    assert breaker.state == OPEN
+    with pytest.raises(OSDUCircuitOpenError):
+        breaker.before_call()
+
+
+def test_breaker_opens_on_slow_calls():
+    breaker = CircuitBreaker(minimum_calls=2, slow_call_duration=1.0, slow_call_rate_threshold=1.0)
+    breaker.record(True, 2.0)
+    breaker.record(True, 3.0)
+
+    assert breaker.state == OPEN
+
+
+def test_breaker_half_open_probe():
+    breaker = CircuitBreaker(minimum_calls=1, open_duration=0)
+    breaker.record(False)
+
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(OSDUCircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(True)
+    assert breaker.state == CLOSED
+
+
+def test_client_breaker_is_scoped_per_service(api_server, auth_backend):
+    api_server.get(STORAGE_INFO_URL, status_code=503)
+    api_server.get(SEARCH_INFO_URL, json={})
+    breakers = CircuitBreakers(minimum_calls=2, open_duration=60)
+    storage_client = OSDUAPI.client("storage", auth_backend=auth_backend, circuit_breakers=breakers)
+    search_client = OSDUAPI.client("search", auth_backend=auth_backend, circuit_breakers=breakers)
+
+    for _ in range(2):
+        with pytest.raises(OSDUAPIError):
+            storage_client.get_info()
+
+    with pytest.raises(OSDUCircuitOpenError):
+        storage_client.get_info()
+    assert api_server.call_count == 2
+    assert search_client.get_info() == {}
+    assert breakers.states() == {"https://base.url/api/storage/v2": OPEN, "https://base.url/api/search/v2": CLOSED}
+
+
+def test_client_breaker_releases_probe_on_unexpected_error(api_server, auth_backend):
+    api_server.get(STORAGE_INFO_URL, [{"status_code": 503}, {"exc": ValueError}, {"json": {}}])
+    breakers = CircuitBreakers(minimum_calls=1, open_duration=0)
+    storage_client = OSDUAPI.client("storage", auth_backend=auth_backend, circuit_breakers=breakers)
+
+    with pytest.raises(OSDUAPIError):
+        storage_client.get_info()
+    with pytest.raises(ValueError):
+        storage_client.get_info()
+
+    assert storage_client.get_info() == {}
+    assert breakers.states() == {"https://base.url/api/storage/v2": CLOSED}
+
+
+def test_ddms_breaker_key_uses_first_path_segments(auth_backend):
+    rafs_client = OSDUAPI.client("rafs", auth_backend=auth_backend, version="v2")
+
+    key = rafs_client._service_key("https://base.url/api/rafs-ddms/v2/samplesanalysesreport/123")
+
+    assert key == "https://base.url/api/rafs-ddms"
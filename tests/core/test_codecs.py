@@ -0,0 +1,41 @@
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.codecs import OrjsonCodec, StdlibJSONCodec, get_json_codec
+from osdu_client.exceptions import OSDUClientError
+
+SEARCH_URL = "https://base.url/api/search/v2/query"
+
+
+def test_get_json_codec_default_is_stdlib():
+    assert isinstance(get_json_codec(), StdlibJSONCodec)
+
+
+def test_get_json_codec_unknown_name():
+    with pytest.raises(OSDUClientError):
+        get_json_codec("ujson")
+
+
+def test_get_json_codec_by_name():
+    pytest.importorskip("orjson")
+    assert isinstance(get_json_codec("orjson"), OrjsonCodec)
+
+
+@pytest.mark.parametrize("codec", ["json", "auto"])
+def test_codec_encodes_request_and_decodes_response(api_server, auth_backend, codec):
+    api_server.post(SEARCH_URL, json={"results": [{"id": "a"}], "totalCount": 1})
+    client = OSDUAPI.client("search", auth_backend=auth_backend, json_codec=codec, validation=False)
+
+    response = client.query(kind="osdu:wks:master-data--Well:1.0.0", limit=1)
+
+    assert response == {"results": [{"id": "a"}], "totalCount": 1}
+    request = api_server.last_request
+    assert request.headers["Content-Type"] == "application/json"
+    assert request.json() == {"kind": "osdu:wks:master-data--Well:1.0.0", "limit": 1}
+
+
+def test_raw_response_returns_bytes(api_server, auth_backend):
+    api_server.post(SEARCH_URL, content=b'{"results":[]}')
+    client = OSDUAPI.client("search", auth_backend=auth_backend, raw_response=True, validation=False)
+
+    assert client.query(kind="osdu:wks:master-data--Well:1.0.0") == b'{"results":[]}'
@@ -0,0 +1,39 @@
+import gzip
+import zlib
+
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUClientError
+
+SEARCH_URL = "https://base.url/api/search/v2/query"
+
+
+@pytest.mark.parametrize("compression, decompress", [("gzip", gzip.decompress), ("deflate", zlib.decompress)])
+def test_body_above_threshold_is_compressed(api_server, auth_backend, compression, decompress):
+    api_server.post(SEARCH_URL, json={})
+    client = OSDUAPI.client(
+        "search", auth_backend=auth_backend, validation=False, compression=compression, compression_threshold=10
+    )
+
+    client.query(kind="osdu:wks:master-data--Well:1.0.0")
+
+    request = api_server.last_request
+    assert request.headers["Content-Encoding"] == compression
+    assert decompress(request.body) == b'{"kind":"osdu:wks:master-data--Well:1.0.0"}'
+
+
+def test_body_below_threshold_is_not_compressed(api_server, auth_backend):
+    api_server.post(SEARCH_URL, json={})
+    client = OSDUAPI.client("search", auth_backend=auth_backend, validation=False, compression="gzip")
+
+    client.query(kind="osdu:wks:master-data--Well:1.0.0")
+
+    request = api_server.last_request
+    assert "Content-Encoding" not in request.headers
+    assert request.headers["Accept-Encoding"] == "gzip, deflate"
+
+
+def test_unknown_compression(auth_backend):
+    with pytest.raises(OSDUClientError):
+        OSDUAPI.client("search", auth_backend=auth_backend, compression="br")
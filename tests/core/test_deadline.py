@@ -0,0 +1,67 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests
+
+from osdu_client.client import OSDUAPI
+from osdu_client.deadline import current_deadline, deadline, run_in_context
+from osdu_client.exceptions import OSDUCancelledError, OSDUTimeoutError
+
+INFO_URL = "https://base.url/api/storage/v2/info"
+
+
+@pytest.fixture
+def storage_client(auth_backend):
+    return OSDUAPI.client("storage", auth_backend=auth_backend, timeout=(5, 30))
+
+
+def test_client_timeout_is_passed_to_requests(api_server, storage_client):
+    api_server.get(INFO_URL, json={})
+
+    storage_client.get_info()
+
+    assert api_server.last_request.timeout == (5, 30)
+
+
+def test_deadline_clips_timeout(api_server, storage_client):
+    api_server.get(INFO_URL, json={})
+
+    with deadline(2):
+        storage_client.get_info()
+
+    connect, read = api_server.last_request.timeout
+    assert 0 < connect <= 2 and 0 < read <= 2
+
+
+def test_expired_deadline_fails_before_request(api_server, storage_client):
+    api_server.get(INFO_URL, json={})
+
+    with pytest.raises(OSDUTimeoutError):
+        with deadline(0):
+            storage_client.get_info()
+    assert api_server.call_count == 0
+
+
+def test_cancelled_deadline(api_server, storage_client):
+    api_server.get(INFO_URL, json={})
+
+    with pytest.raises(OSDUCancelledError):
+        with deadline() as d:
+            threading.Thread(target=d.cancel).start()
+            d.sleep(5)
+            storage_client.get_info()
+
+
+def test_requests_timeout_is_wrapped(api_server, storage_client):
+    api_server.get(INFO_URL, exc=requests.ConnectTimeout)
+
+    with pytest.raises(OSDUTimeoutError):
+        storage_client.get_info()
+
+
+def test_run_in_context_propagates_deadline_to_threads():
+    with deadline(10) as d:
+        with ThreadPoolExecutor(1) as executor:
+            assert executor.submit(run_in_context(current_deadline)).result() is d
+            assert executor.submit(current_deadline).result() is None
@@ -0,0 +1,53 @@
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUFanOutError
+from osdu_client.fanout import PartitionFanOut, fan_out
+from osdu_client.services.search.client import SearchAPIError
+
+PARTITIONS_URL = "https://base.url/api/partition/v1/partitions"
+QUERY_URL = "https://base.url/api/search/v2/query"
+
+
+def search_response(request, context):
+    partition = request.headers["data-partition-id"]
+    if partition == "broken":
+        context.status_code = 500
+        return {"error": "boom"}
+    return {"results": [{"id": f"{partition}:well:1"}], "totalCount": 1}
+
+
+@pytest.fixture
+def fanout(auth_backend, api_server):
+    api_server.get(PARTITIONS_URL, json=["osdu", "broken", "other"])
+    api_server.post(QUERY_URL, json=search_response)
+    return PartitionFanOut(OSDUAPI.client("partition", auth_backend=auth_backend), max_workers=3)
+
+
+def test_run_isolates_partition_errors(fanout, auth_backend):
+    search_client = OSDUAPI.client("search", auth_backend=auth_backend, validation=False)
+
+    outcome = fanout.run(search_client.query, kind="osdu:wks:master-data--Well:1.0.0")
+
+    assert list(outcome) == ["osdu", "broken", "other"]
+    assert list(outcome.results) == ["osdu", "other"]
+    assert isinstance(outcome.errors["broken"], SearchAPIError)
+    assert outcome.merged("results") == [{"id": "osdu:well:1"}, {"id": "other:well:1"}]
+    with pytest.raises(OSDUFanOutError) as error:
+        outcome.raise_for_errors()
+    assert list(error.value.errors) == ["broken"]
+
+
+def test_partitions_are_listed_once(fanout, api_server):
+    assert fanout.partitions == ["osdu", "broken", "other"]
+    fanout.run(lambda data_partition_id: data_partition_id, partitions=["osdu"])
+    assert fanout.partitions == ["osdu", "broken", "other"]
+
+    assert [request.url for request in api_server.request_history] == [PARTITIONS_URL]
+
+
+def test_fan_out_with_plain_function():
+    outcome = fan_out(lambda partition: [partition.upper()], ["a", "b", "a"])
+
+    assert outcome.merged() == ["A", "B"]
+    assert all(result.ok for result in outcome.values())
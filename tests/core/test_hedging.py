@@ -0,0 +1,78 @@
+import itertools
+import time
+
+import pytest
+import requests
+
+from osdu_client.client import OSDUAPI
+from osdu_client.hedging import HedgingPolicy
+
+RECORD_URL = "https://base.url/api/storage/v2/records/123"
+
+
+def slow_first_call(delay):
+    def respond(path, call_number):
+        if call_number == 0:
+            time.sleep(delay)
+        return {"attempt": call_number}
+
+    return respond
+
+
+@pytest.fixture
+def storage_client(local_auth_backend):
+    def _create(hedging):
+        return OSDUAPI.client("storage", auth_backend=local_auth_backend, hedging=hedging)
+    return _create
+
+
+def test_slow_read_is_hedged(local_server, storage_client):
+    local_server.respond = slow_first_call(0.5)
+    hedging = HedgingPolicy(delay=0.05, budget_ratio=1)
+
+    assert storage_client(hedging).get_record(id="123") == {"attempt": 1}
+    assert hedging.hedges_sent == 1
+
+
+def test_hedging_respects_budget(local_server, storage_client):
+    local_server.respond = slow_first_call(0.2)
+    hedging = HedgingPolicy(delay=0.05, budget_ratio=0.5)
+
+    assert storage_client(hedging).get_record(id="123") == {"attempt": 0}
+    assert hedging.hedges_sent == 0
+
+
+def test_server_error_does_not_win():
+    calls = itertools.count()
+
+    def send():
+        response = requests.Response()
+        if next(calls) == 0:
+            time.sleep(0.2)
+            response.status_code = 200
+        else:
+            response.status_code = 503
+        return response
+
+    with HedgingPolicy(delay=0.05, budget_ratio=1) as hedging:
+        assert hedging.run(send).status_code == 200
+        assert hedging.hedges_sent == 1
+
+
+def test_writes_are_not_hedged():
+    hedging = HedgingPolicy()
+
+    assert hedging.applies("get", RECORD_URL)
+    assert hedging.applies("post", "https://base.url/api/search/v2/query")
+    assert not hedging.applies("post", "https://base.url/api/search/v2/query_with_cursor")
+    assert not hedging.applies("put", "https://base.url/api/storage/v2/records")
+
+
+def test_delay_follows_observed_percentile():
+    hedging = HedgingPolicy(percentile=90, min_samples=10, min_delay=0)
+    assert hedging.hedge_delay() is None
+
+    for latency in range(1, 11):
+        hedging.record_latency(latency / 10)
+
+    assert hedging.hedge_delay() == 0.9
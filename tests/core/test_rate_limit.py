@@ -0,0 +1,25 @@
+import time
+
+import pytest
+
+from osdu_client.deadline import deadline
+from osdu_client.exceptions import OSDUTimeoutError
+from osdu_client.rate_limit import RateLimiter
+
+
+def test_calls_are_spread_after_burst():
+    limiter = RateLimiter(rate=50, burst=2)
+    started = time.monotonic()
+
+    for _ in range(5):
+        limiter.acquire()
+
+    assert time.monotonic() - started >= 0.05
+
+
+def test_acquire_respects_deadline():
+    limiter = RateLimiter(rate=0.1, burst=1)
+    limiter.acquire()
+
+    with deadline(0.05), pytest.raises(OSDUTimeoutError):
+        limiter.acquire()
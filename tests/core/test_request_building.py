@@ -0,0 +1,57 @@
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.utils import urljoin
+
+
+@pytest.mark.parametrize("service, path", [
+    ("storage", "records/%s:delete" % "opendes:wks:1"),
+    ("search", "query"),
+    ("policy", ""),
+    ("wellbore", "/api/os-wellbore-ddms/v3/welllogs/1/"),
+])
+def test_url_matches_urljoin(auth_backend, service, path):
+    client = OSDUAPI.client(service, auth_backend=auth_backend, version="v3" if service == "wellbore" else None)
+
+    assert client._url(path) == urljoin(client.base_url, client.service_path, path)
+
+
+def test_service_url_follows_base_url(auth_backend):
+    client = OSDUAPI.client("storage", auth_backend=auth_backend)
+
+    client.base_url = "https://other.url/"
+
+    assert client._url("records") == "https://other.url/api/storage/v2/records"
+
+
+def test_headers_are_built_per_call(auth_backend):
+    client = OSDUAPI.client("storage", auth_backend=auth_backend)
+
+    headers = client._headers("other")
+    headers["x-collaboration"] = "id"
+
+    assert headers["data-partition-id"] == "other"
+    assert client._headers() == {
+        "Accept-Encoding": "gzip, deflate",
+        "Authorization": "Bearer access_token",
+        "data-partition-id": "osdu",
+    }
+
+
+def test_custom_get_headers_is_used(auth_backend):
+    class CorrelatedAuthSession(type(auth_backend)):
+        def get_headers(self):
+            headers = super().get_headers()
+            headers["correlation-id"] = "abc"
+            return headers
+
+    client = OSDUAPI.client("storage", auth_backend=CorrelatedAuthSession())
+
+    assert client._headers()["correlation-id"] == "abc"
+
+
+def test_empty_response_body_is_none(auth_backend, api_server):
+    api_server.delete("https://base.url/api/storage/v2/records/opendes:wks:1", status_code=204)
+    client = OSDUAPI.client("storage", auth_backend=auth_backend)
+
+    assert client.purge_record(id="opendes:wks:1") is None
@@ -0,0 +1,66 @@
+import socket
+
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.transport import DNSCache, create_session
+
+
+def test_dns_cache_resolves_once_within_ttl(monkeypatch):
+    calls = []
+    getaddrinfo = socket.getaddrinfo
+
+    def counting_getaddrinfo(*args, **kwargs):
+        calls.append(args[0])
+        return getaddrinfo(*args, **kwargs)
+
+    monkeypatch.setattr(socket, "getaddrinfo", counting_getaddrinfo)
+    cache = DNSCache(ttl=60)
+
+    assert cache.resolve("localhost", 80) == cache.resolve("localhost", 80)
+    assert calls == ["localhost"]
+
+
+def test_dns_cache_falls_back_to_next_address(monkeypatch, local_server):
+    local_server.respond = lambda path, call_number: {"version": "1"}
+    port = local_server.server_address[1]
+
+    def getaddrinfo(host, port, *args, **kwargs):
+        return [
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.2", port)),
+            (socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port)),
+        ]
+
+    monkeypatch.setattr(socket, "getaddrinfo", getaddrinfo)
+    session = create_session()
+
+    assert session.get_adapter(local_server.url).dns_cache.resolve("localhost", port) == ["127.0.0.2", "127.0.0.1"]
+    assert session.get(f"{local_server.url}/api/info").json() == {"version": "1"}
+
+
+def test_warm_up_opens_pooled_connections(local_server, local_auth_backend):
+    local_server.respond = lambda path, call_number: {"version": "1"}
+    session = create_session(pool_maxsize=4)
+    storage_client = OSDUAPI.client("storage", auth_backend=local_auth_backend, session=session)
+    search_client = OSDUAPI.client("search", auth_backend=local_auth_backend, session=session)
+
+    OSDUAPI.warm_up(storage_client, search_client, connections=3)
+
+    assert len(local_server.connections) == 3
+    assert storage_client.get_info() == {"version": "1"}
+    assert len(local_server.connections) == 3
+
+
+@pytest.mark.parametrize("tls_session_resumption", [True, False])
+def test_new_connections_resume_tls_session(local_tls_server, tls_session_resumption):
+    local_tls_server.respond = lambda path, call_number: {"version": "1"}
+    session = create_session(tls_session_resumption=tls_session_resumption)
+
+    for _ in range(3):
+        assert session.get(f"{local_tls_server.url}/api/info", verify=local_tls_server.cert_path).json() == {
+            "version": "1"
+        }
+        # Dropping pooled connections makes the next request open a new one.
+        session.get_adapter(local_tls_server.url).poolmanager.clear()
+
+    assert local_tls_server.resumed == [False, tls_session_resumption, tls_session_resumption]
@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+import pytest
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.search.models import CursorQueryResponse
+
+CURSOR_URL = "https://base.url/api/search/v2/query_with_cursor"
+RESPONSE = {"cursor": "abc", "results": [{"data": {"Name": "well-1"}}], "totalCount": 1}
+
+
+@pytest.fixture
+def search_client(auth_backend):
+    return OSDUAPI.client("search", auth_backend=auth_backend, validation=False)
+
+
+def test_response_type_pydantic_model(api_server, search_client):
+    api_server.post(CURSOR_URL, json=RESPONSE)
+
+    response = search_client.with_response_type(CursorQueryResponse).query_with_cursor(kind="osdu:wks:*:*")
+
+    assert isinstance(response, CursorQueryResponse)
+    assert response.cursor == "abc"
+    assert response.totalCount == 1
+
+
+def test_response_type_msgspec_struct(api_server, search_client):
+    msgspec = pytest.importorskip("msgspec")
+
+    class Hit(msgspec.Struct):
+        data: dict
+
+    class Page(msgspec.Struct):
+        results: List[Hit]
+        cursor: Optional[str] = None
+
+    api_server.post(CURSOR_URL, json=RESPONSE)
+
+    response = search_client.with_response_type(Page).query_with_cursor(kind="osdu:wks:*:*")
+
+    assert response == Page(results=[Hit(data={"Name": "well-1"})], cursor="abc")
+
+
+def test_with_response_type_leaves_original_client_untouched(api_server, search_client):
+    api_server.post(CURSOR_URL, json=RESPONSE)
+
+    search_client.with_response_type(CursorQueryResponse)
+
+    assert search_client.query_with_cursor(kind="osdu:wks:*:*") == RESPONSE
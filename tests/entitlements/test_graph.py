@@ -0,0 +1,103 @@
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.entitlements.graph import EntitlementsGraph
+
+BASE_URL = "https://base.url/api/entitlements/v2/groups"
+VIEWERS = "data.wells.viewers@osdu.example.com"
+OWNERS = "data.wells.owners@osdu.example.com"
+USERS = "users.wells@osdu.example.com"
+MEMBERS = {
+    VIEWERS: [USERS],
+    OWNERS: ["admin@osdu.example.com"],
+    USERS: ["Alice@osdu.example.com", "bob@osdu.example.com"],
+}
+
+
+def members(request, context):
+    group = request.path.split("/")[-2]
+    return {"members": [{"email": email, "role": "MEMBER"} for email in MEMBERS[group]]}
+
+
+@pytest.fixture
+def graph(auth_backend):
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            BASE_URL + "/all",
+            json=lambda request, context: {
+                "groups": [{"email": email} for email in MEMBERS] if request.qs["type"] == ["data"] else []
+            },
+        )
+        mocker.get(re.compile(BASE_URL + "/.*/members"), json=members)
+        yield mocker, EntitlementsGraph(OSDUAPI.client("entitlements", auth_backend=auth_backend), ttl=60)
+
+
+def test_transitive_membership(graph):
+    _, graph = graph
+
+    assert graph.groups_of("alice@osdu.example.com") == {USERS, VIEWERS}
+    assert graph.is_member("bob@osdu.example.com", VIEWERS)
+    assert graph.has_access("ALICE@osdu.example.com", {"viewers": [VIEWERS], "owners": [OWNERS]})
+    assert not graph.has_access("alice@osdu.example.com", {"viewers": [VIEWERS], "owners": [OWNERS]}, owner=True)
+    assert graph.members(USERS) == {"alice@osdu.example.com", "bob@osdu.example.com"}
+
+
+def test_graph_is_loaded_once_per_ttl(graph):
+    api, graph = graph
+
+    for _ in range(3):
+        graph.groups_of("alice@osdu.example.com")
+
+    assert api.call_count == 3 + len(MEMBERS)
+
+
+def test_incremental_refresh(graph):
+    api, graph = graph
+    graph.load()
+    calls = api.call_count
+    MEMBERS[USERS] = ["bob@osdu.example.com"]
+    try:
+        graph.refresh([USERS])
+    finally:
+        MEMBERS[USERS] = ["Alice@osdu.example.com", "bob@osdu.example.com"]
+
+    assert api.call_count == calls + 1
+    assert not graph.is_member("alice@osdu.example.com", VIEWERS)
+
+
+def test_expired_members_are_refreshed(graph):
+    api, graph = graph
+    graph.ttl = 0.01
+    graph.load()
+    calls = api.call_count
+    time.sleep(0.02)
+
+    graph.groups_of("bob@osdu.example.com")
+
+    assert api.call_count == calls + len(MEMBERS)
+
+
+def test_expired_group_list_is_reloaded(graph):
+    api, graph = graph
+    graph.group_list_ttl = 0.01
+    graph.load()
+    calls = api.call_count
+    time.sleep(0.02)
+
+    graph.groups_of("bob@osdu.example.com")
+
+    assert api.call_count == 2 * calls
+
+
+def test_concurrent_queries_share_one_load(graph):
+    api, graph = graph
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(graph.groups_of, ["alice@osdu.example.com"] * 8))
+
+    assert api.call_count == 3 + len(MEMBERS)
@@ -0,0 +1,105 @@
+import re
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.entitlements.client import EntitlementsAPIError
+from osdu_client.services.entitlements.sync import ADD, CHANGE_ROLE, REMOVE, MembershipSync, SyncAction
+
+GROUPS_URL = "https://base.url/api/entitlements/v2/groups/"
+VIEWERS = "data.project.viewers@osdu.example.com"
+EDITORS = "data.project.editors@osdu.example.com"
+CURRENT = {
+    VIEWERS: [
+        {"email": "alice@osdu.example.com", "role": "MEMBER"},
+        {"email": "old@osdu.example.com", "role": "MEMBER"},
+        {"email": "service@osdu.example.com", "role": "OWNER"},
+    ],
+    EDITORS: [{"email": "bob@osdu.example.com", "role": "MEMBER"}],
+}
+DESIRED = {
+    VIEWERS: ["Alice@osdu.example.com", "bob@osdu.example.com"],
+    EDITORS: {"bob@osdu.example.com": "OWNER"},
+}
+
+
+@pytest.fixture
+def entitlements_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(
+            re.compile(GROUPS_URL + ".*/members"),
+            json=lambda request, context: {"members": CURRENT[request.path.split("/")[-2]]},
+        )
+        mocker.post(re.compile(GROUPS_URL + ".*/members"), json={})
+        mocker.delete(re.compile(GROUPS_URL + ".*/members/.*"), text="")
+        yield mocker
+
+
+@pytest.fixture
+def membership_sync(auth_backend, entitlements_api):
+    entitlements_client = OSDUAPI.client("entitlements", auth_backend=auth_backend)
+    return MembershipSync(entitlements_client, rate_limit=100, prune=True, keep=["service@osdu.example.com"])
+
+
+def test_dry_run_plan(membership_sync, entitlements_api):
+    plan = membership_sync.sync(DESIRED, dry_run=True)
+
+    assert plan == [
+        SyncAction(CHANGE_ROLE, EDITORS, "bob@osdu.example.com", "OWNER", "MEMBER"),
+        SyncAction(ADD, VIEWERS, "bob@osdu.example.com", "MEMBER"),
+        SyncAction(REMOVE, VIEWERS, "old@osdu.example.com"),
+    ]
+    assert {request.method for request in entitlements_api.request_history} == {"GET"}
+
+
+def test_members_are_kept_without_prune(membership_sync, entitlements_api):
+    membership_sync.prune = False
+
+    assert membership_sync.plan(DESIRED) == [
+        SyncAction(CHANGE_ROLE, EDITORS, "bob@osdu.example.com", "OWNER", "MEMBER"),
+        SyncAction(ADD, VIEWERS, "bob@osdu.example.com", "MEMBER"),
+    ]
+    assert MembershipSync(membership_sync.entitlements_client).prune is False
+
+
+def test_apply(membership_sync, entitlements_api):
+    result = membership_sync.sync(DESIRED)
+
+    assert len(result.applied) == 3 and not result.failed
+    changes = sorted(
+        (request.method, request.path, request.json() if request.method == "POST" else None)
+        for request in entitlements_api.request_history
+        if request.method != "GET"
+    )
+    assert changes == [
+        ("DELETE", f"/api/entitlements/v2/groups/{EDITORS}/members/bob@osdu.example.com", None),
+        ("DELETE", f"/api/entitlements/v2/groups/{VIEWERS}/members/old@osdu.example.com", None),
+        ("POST", f"/api/entitlements/v2/groups/{EDITORS}/members", {"email": "bob@osdu.example.com", "role": "OWNER"}),
+        ("POST", f"/api/entitlements/v2/groups/{VIEWERS}/members", {"email": "bob@osdu.example.com", "role": "MEMBER"}),
+    ]
+
+
+def test_failed_actions_are_isolated(membership_sync, entitlements_api):
+    entitlements_api.delete(re.compile(GROUPS_URL + ".*/members/.*"), status_code=403, text="forbidden")
+
+    result = membership_sync.sync({VIEWERS: ["alice@osdu.example.com", "new@osdu.example.com"]})
+
+    assert result.applied == [SyncAction(ADD, VIEWERS, "new@osdu.example.com", "MEMBER")]
+    assert isinstance(result.failed[SyncAction(REMOVE, VIEWERS, "old@osdu.example.com")], EntitlementsAPIError)
+
+
+def test_failed_role_change_restores_previous_role(membership_sync, entitlements_api):
+    entitlements_api.post(
+        re.compile(GROUPS_URL + ".*/members"), [{"status_code": 400, "text": "bad role"}, {"json": {}}]
+    )
+    action = SyncAction(CHANGE_ROLE, EDITORS, "bob@osdu.example.com", "OWNER", "MEMBER")
+
+    result = membership_sync.apply([action])
+
+    assert isinstance(result.failed[action], EntitlementsAPIError)
+    assert result.restored == [action]
+    assert [request.json()["role"] for request in entitlements_api.request_history if request.method == "POST"] == [
+        "OWNER",
+        "MEMBER",
+    ]
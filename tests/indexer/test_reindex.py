@@ -0,0 +1,73 @@
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.indexer.reindex import ReindexOrchestrator
+from osdu_client.services.storage.client import StorageAPIError
+
+STORAGE_URL = "https://base.url/api/storage/v2/query/records"
+INDEXER_URL = "https://base.url/api/indexer/v2/reindex"
+SEARCH_URL = "https://base.url/api/search/v2/query"
+SMALL = "osdu:wks:master-data--Rig:1.0.0"
+BIG = "osdu:wks:master-data--Well:1.0.0"
+BROKEN = "osdu:wks:master-data--Field:1.0.0"
+PAGES = {
+    (SMALL, None): {"results": ["rig:1", "rig:2"]},
+    (BIG, None): {"results": ["well:1", "well:2", "well:3"], "cursor": "next"},
+    (BIG, "next"): {"results": ["well:4", "well:5"]},
+}
+
+
+def storage_page(request, context):
+    # requests_mock lower-cases query string values
+    kind, cursor = request.qs["kind"][0], request.qs.get("cursor", [None])[0]
+    if kind == BROKEN.lower():
+        context.status_code = 403
+        return {}
+    return {(kind.lower(), cursor): page for (kind, cursor), page in PAGES.items()}[(kind, cursor)]
+
+
+@pytest.fixture
+def orchestrator(auth_backend):
+    search_counts = {SMALL: iter([2]), BIG: iter([3, 5])}
+    with requests_mock.Mocker() as mocker:
+        mocker.get(STORAGE_URL, json=storage_page)
+        mocker.post(INDEXER_URL, json={})
+        mocker.post(INDEXER_URL + "/records", json={})
+        mocker.post(
+            SEARCH_URL, json=lambda request, context: {"totalCount": next(search_counts[request.json()["kind"]])}
+        )
+        yield mocker, ReindexOrchestrator(
+            OSDUAPI.client("indexer", auth_backend=auth_backend),
+            OSDUAPI.client("storage", auth_backend=auth_backend),
+            OSDUAPI.client("search", auth_backend=auth_backend, validation=False),
+            chunk_threshold=2,
+            chunk_size=2,
+        )
+
+
+def test_reindex_and_verify(orchestrator):
+    api, orchestrator = orchestrator
+
+    results = orchestrator.reindex([SMALL, BIG, BROKEN], verify_timeout=1, verify_interval=0.01)
+
+    assert list(results) == [SMALL, BIG, BROKEN]
+    assert (results[SMALL].chunks, results[SMALL].storage_count, results[SMALL].complete) == (0, 2, True)
+    assert (results[BIG].chunks, results[BIG].search_count, results[BIG].complete) == (3, 5, True)
+    assert isinstance(results[BROKEN].error, StorageAPIError)
+    assert not results[BROKEN].complete
+
+    reindexed = [request.json() for request in api.request_history if request.url.startswith(INDEXER_URL)]
+    assert {"kind": SMALL} in reindexed
+    assert sorted(request["recordIds"] for request in reindexed if "recordIds" in request) == [
+        ["well:1", "well:2"],
+        ["well:3", "well:4"],
+        ["well:5"],
+    ]
+
+
+def test_chunk_size_is_limited(orchestrator):
+    _, orchestrator = orchestrator
+
+    with pytest.raises(ValueError):
+        ReindexOrchestrator(orchestrator.indexer_client, orchestrator.storage_client, None, chunk_size=1001)
@@ -0,0 +1,154 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.legal.tag_cache import EXPIRED_REASON, NOT_FOUND_REASON, LegalTagCache, expiration_of
+
+LEGAL_URL = "https://base.url/api/legal/v1/"
+TAGS = {f"osdu-tag-{i}": {"name": f"osdu-tag-{i}", "properties": {"expirationDate": "2099-12-31"}} for i in range(30)}
+TAGS["osdu-expired"] = {"name": "osdu-expired", "properties": {"expirationDate": "2020-01-01T00:00:00.000+00:00"}}
+
+
+def batch_retrieve(request, context):
+    names = request.json()["names"]
+    if any(name not in TAGS for name in names):
+        context.status_code = 404
+        return {"code": 404, "reason": "Not found", "message": "One or more requested LegalTags were not found."}
+    return {"legalTags": [TAGS[name] for name in names]}
+
+
+@pytest.fixture
+def legal_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.post(LEGAL_URL + "legaltags:batchRetrieve", json=batch_retrieve)
+        mocker.get(LEGAL_URL + "legaltags", json={"legalTags": list(TAGS.values())[:30]})
+        yield mocker
+
+
+@pytest.fixture
+def legal_client(auth_backend, legal_api):
+    return OSDUAPI.client("legal", auth_backend=auth_backend)
+
+
+def batch_calls(legal_api):
+    return [request.json()["names"] for request in legal_api.request_history if request.method == "POST"]
+
+
+def test_expiration_of():
+    assert expiration_of({"properties": {"expirationDate": "2024-05-01"}}) == datetime(2024, 5, 2, tzinfo=timezone.utc)
+    assert expiration_of({"properties": {"expirationDate": "2024-05-01T10:00:00Z"}}) == datetime(
+        2024, 5, 1, 10, tzinfo=timezone.utc
+    )
+    assert expiration_of({"properties": {}}) is None
+
+
+def test_tags_are_fetched_in_batches_once(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+    names = list(TAGS) + ["osdu-missing"]
+
+    tags = cache.get_many(names)
+    cache.get_many(names)
+
+    assert tags["osdu-tag-0"] == TAGS["osdu-tag-0"]
+    assert tags["osdu-missing"] is None
+    assert sorted(len(names) for names in batch_calls(legal_api))[-2:] == [7, 25]
+    assert len(batch_calls(legal_api)) == 8
+
+
+def test_batch_with_unknown_name_is_split(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+    names = ["osdu-tag-1", "osdu-tag-2", "osdu-missing", "osdu-tag-3"]
+
+    tags = cache.get_many(names)
+
+    assert tags == {
+        "osdu-tag-1": TAGS["osdu-tag-1"],
+        "osdu-tag-2": TAGS["osdu-tag-2"],
+        "osdu-missing": None,
+        "osdu-tag-3": TAGS["osdu-tag-3"],
+    }
+    assert batch_calls(legal_api) == [
+        names,
+        ["osdu-tag-1", "osdu-tag-2"],
+        ["osdu-missing", "osdu-tag-3"],
+        ["osdu-missing"],
+        ["osdu-tag-3"],
+    ]
+
+
+def test_concurrent_misses_share_one_fetch(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(cache.get, ["osdu-tag-1"] * 8))
+
+    assert results == [TAGS["osdu-tag-1"]] * 8
+    assert batch_calls(legal_api) == [["osdu-tag-1"]]
+
+
+def test_invalid(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+
+    assert cache.invalid(["osdu-tag-1", "osdu-expired", "osdu-missing"]) == {
+        "osdu-expired": EXPIRED_REASON,
+        "osdu-missing": NOT_FOUND_REASON,
+    }
+    assert cache.is_valid("osdu-tag-1")
+    assert not cache.is_valid("osdu-tag-1", at=datetime(2100, 1, 1, tzinfo=timezone.utc))
+    assert not cache.is_valid("osdu-missing")
+    assert len(batch_calls(legal_api)) == 5
+
+
+def test_prefetch_lists_valid_tags(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+
+    cache.prefetch()
+
+    assert all(cache.is_valid(f"osdu-tag-{i}") for i in range(30))
+    assert legal_api.request_history[0].qs == {"valid": ["true"]}
+    assert batch_calls(legal_api) == []
+
+
+def test_stale_tags_are_refreshed_in_background(legal_client, legal_api):
+    cache = LegalTagCache(legal_client, ttl=0.2, refresh_ahead=0.5)
+    cache.get("osdu-tag-1")
+    time.sleep(0.12)
+
+    assert cache.get("osdu-tag-1") == TAGS["osdu-tag-1"]
+    for _ in range(100):
+        if len(batch_calls(legal_api)) == 2:
+            break
+        time.sleep(0.01)
+    assert batch_calls(legal_api) == [["osdu-tag-1"], ["osdu-tag-1"]]
+
+
+def test_failed_refresh_keeps_error(legal_client, legal_api):
+    cache = LegalTagCache(legal_client, ttl=0.2, refresh_ahead=0.5)
+    cache.get("osdu-tag-1")
+    time.sleep(0.12)
+    legal_api.post(LEGAL_URL + "legaltags:batchRetrieve", status_code=503, text="down")
+
+    assert cache.get("osdu-tag-1") == TAGS["osdu-tag-1"]
+    for _ in range(100):
+        if cache.errors:
+            break
+        time.sleep(0.01)
+    assert list(cache.errors) == ["osdu-tag-1"]
+
+    legal_api.post(LEGAL_URL + "legaltags:batchRetrieve", json=batch_retrieve)
+    cache.prefetch(["osdu-tag-1"])
+    assert cache.errors == {}
+
+
+def test_invalidate(legal_client, legal_api):
+    cache = LegalTagCache(legal_client)
+    cache.get("osdu-tag-1")
+
+    cache.invalidate("osdu-tag-1")
+    cache.get("osdu-tag-1")
+
+    assert len(batch_calls(legal_api)) == 2
@@ -0,0 +1,134 @@
+import re
+import threading
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.partition.client import PartitionAPIError
+from osdu_client.services.partition.properties import PartitionPropertiesCache
+
+PARTITIONS_URL = "https://base.url/api/partition/v1/partitions"
+
+
+class Partitions:
+    def __init__(self):
+        self.properties = {
+            "opendes": {"elasticsearch.host": {"sensitive": False, "value": "es.opendes"}},
+            "tenant": {"elasticsearch.host": {"sensitive": False, "value": "es.tenant"}},
+        }
+        self.failing = set()
+
+    def list(self, request, context):
+        return list(self.properties)
+
+    def get(self, request, context):
+        partition_id = request.path.rsplit("/", 1)[-1]
+        if partition_id in self.failing:
+            context.status_code = 503
+            return {}
+        return self.properties[partition_id]
+
+
+@pytest.fixture
+def partitions():
+    return Partitions()
+
+
+@pytest.fixture
+def partition_api(partitions):
+    with requests_mock.Mocker() as mocker:
+        mocker.get(PARTITIONS_URL, json=partitions.list)
+        mocker.get(re.compile(PARTITIONS_URL + "/.+"), json=partitions.get)
+        yield mocker
+
+
+@pytest.fixture
+def properties_cache(auth_backend, partition_api):
+    return PartitionPropertiesCache(OSDUAPI.client("partition", auth_backend=auth_backend))
+
+
+def test_loads_all_partitions_once(properties_cache, partition_api):
+    assert properties_cache.partitions == ["opendes", "tenant"]
+    assert properties_cache.value("opendes", "elasticsearch.host") == "es.opendes"
+    assert properties_cache.value("opendes", "missing", "default") == "default"
+    assert properties_cache.get("unknown") is None
+    assert partition_api.call_count == 3
+
+
+def test_subscribers_are_notified_about_changes(properties_cache, partitions):
+    properties_cache.partitions
+    changes = []
+    unsubscribe = properties_cache.subscribe(lambda *change: changes.append(change))
+    properties_cache.subscribe(lambda *change: 1 / 0)
+    old_tenant = partitions.properties.pop("tenant")
+    partitions.properties["opendes"] = {"elasticsearch.host": {"sensitive": False, "value": "es2.opendes"}}
+
+    assert properties_cache.load() == ["opendes", "tenant"]
+    assert changes == [
+        (
+            "opendes",
+            {"elasticsearch.host": {"sensitive": False, "value": "es.opendes"}},
+            partitions.properties["opendes"],
+        ),
+        ("tenant", old_tenant, None),
+    ]
+
+    unsubscribe()
+    partitions.properties["tenant"] = old_tenant
+    assert properties_cache.load() == ["tenant"]
+    assert len(changes) == 2
+
+
+def test_failed_partition_keeps_previous_properties(properties_cache, partitions):
+    properties_cache.partitions
+    partitions.failing.add("tenant")
+    partitions.properties["tenant"] = {}
+
+    assert properties_cache.load() == []
+    assert properties_cache.value("tenant", "elasticsearch.host") == "es.tenant"
+    assert isinstance(properties_cache.errors["tenant"], PartitionAPIError)
+
+
+def test_background_refresh(auth_backend, partition_api, partitions):
+    properties_cache = PartitionPropertiesCache(OSDUAPI.client("partition", auth_backend=auth_backend), 0.01)
+    refreshed = threading.Event()
+
+    with properties_cache:
+        properties_cache.subscribe(lambda partition_id, previous, current: refreshed.set())
+        partitions.properties["new"] = {}
+        assert refreshed.wait(1)
+
+    assert "new" in properties_cache.partitions
+
+
+def test_failed_background_refresh_keeps_error(auth_backend, partition_api, partitions):
+    properties_cache = PartitionPropertiesCache(OSDUAPI.client("partition", auth_backend=auth_backend), 0.01)
+    properties_cache.partitions
+    partition_api.get(PARTITIONS_URL, status_code=503, text="down")
+
+    with properties_cache:
+        for _ in range(100):
+            if properties_cache.last_error is not None:
+                break
+            threading.Event().wait(0.01)
+    assert isinstance(properties_cache.last_error, PartitionAPIError)
+
+    partition_api.get(PARTITIONS_URL, json=partitions.list)
+    properties_cache.load()
+    assert properties_cache.last_error is None
+
+
+def test_subscriber_can_stop_the_refresh(auth_backend, partition_api, partitions):
+    properties_cache = PartitionPropertiesCache(OSDUAPI.client("partition", auth_backend=auth_backend), 0.01)
+    stopped = threading.Event()
+
+    def stop(partition_id, previous, current):
+        properties_cache.stop()
+        stopped.set()
+
+    properties_cache.start()
+    properties_cache.subscribe(stop)
+    partitions.properties["new"] = {}
+
+    assert stopped.wait(1)
@@ -0,0 +1,124 @@
+import json
+import threading
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.policy.client import PolicyAPIError
+from osdu_client.services.policy.decisions import PolicyDecisionCache, input_hash
+
+EVALUATE_URL = "https://base.url/api/policy/v1/evaluations/query"
+POLICY_ID = "osdu/partition/osdu/dataauthz.rego"
+
+
+def uploaded_input(request):
+    part = request.body.split(b"\r\n\r\n", 1)[1]
+    return json.loads(part[: part.index(b"\r\n--")])["input"]
+
+
+def evaluate(request, context):
+    policy_input = uploaded_input(request)
+    return {"result": {"allow": policy_input["operation"] == "view"}}
+
+
+@pytest.fixture
+def policy_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.post(EVALUATE_URL, json=evaluate)
+        yield mocker
+
+
+@pytest.fixture
+def decisions(auth_backend, policy_api):
+    return PolicyDecisionCache(OSDUAPI.client("policy", auth_backend=auth_backend))
+
+
+def test_input_hash_ignores_key_order():
+    assert input_hash({"a": 1, "b": {"c": [1, 2]}}) == input_hash({"b": {"c": [1, 2]}, "a": 1})
+    assert input_hash({"a": [1, 2]}) != input_hash({"a": [2, 1]})
+
+
+def test_evaluate(decisions, policy_api):
+    decision = decisions.evaluate(POLICY_ID, {"operation": "view", "records": []}, x_user_id="alice")
+
+    assert decision == {"result": {"allow": True}}
+    request = policy_api.last_request
+    assert request.qs == {"policy_id": [POLICY_ID]}
+    assert request.headers["x-user-id"] == "alice"
+    assert uploaded_input(request) == {"operation": "view", "records": []}
+
+
+def test_decisions_are_cached(decisions, policy_api):
+    decisions.evaluate(POLICY_ID, {"operation": "view", "records": [{"id": "1"}]})
+    decisions.evaluate(POLICY_ID, {"records": [{"id": "1"}], "operation": "view"})
+    decisions.evaluate(POLICY_ID, {"operation": "view", "records": [{"id": "1"}]}, x_user_id="bob")
+
+    assert policy_api.call_count == 2
+
+    decisions.clear()
+    decisions.evaluate(POLICY_ID, {"operation": "view", "records": [{"id": "1"}]})
+
+    assert policy_api.call_count == 3
+
+
+def test_evaluate_many(decisions, policy_api):
+    inputs = [{"operation": operation} for operation in ["view", "update", "view", "update", "view"]]
+
+    assert decisions.evaluate_many(POLICY_ID, inputs) == [
+        {"result": {"allow": operation == "view"}}
+        for operation in [
+            "view",
+            "update",
+            "view",
+            "update",
+            "view",
+        ]
+    ]
+    assert policy_api.call_count == 2
+
+
+def test_concurrent_evaluations_share_request(decisions, policy_api):
+    release = threading.Event()
+
+    def slow_evaluate(request, context):
+        release.wait(1)
+        return evaluate(request, context)
+
+    policy_api.post(EVALUATE_URL, json=slow_evaluate)
+    threads = [threading.Thread(target=decisions.evaluate, args=(POLICY_ID, {"operation": "view"})) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert policy_api.call_count == 1
+
+
+def test_errors_are_not_cached(decisions, policy_api):
+    policy_api.post(EVALUATE_URL, status_code=503, text="unavailable")
+
+    with pytest.raises(PolicyAPIError):
+        decisions.evaluate(POLICY_ID, {"operation": "view"})
+
+    policy_api.post(EVALUATE_URL, json=evaluate)
+    assert decisions.evaluate(POLICY_ID, {"operation": "view"}) == {"result": {"allow": True}}
+
+
+def test_evaluate_sends_request_headers(decisions, policy_api):
+    decisions.evaluate(POLICY_ID, {"operation": "view"}, correlation_id="job-1", user_agent="ingestion")
+
+    request = policy_api.last_request
+    assert request.headers["correlation-id"] == "job-1"
+    assert request.headers["user-agent"] == "ingestion"
+
+
+def test_returned_decisions_are_copies(decisions, policy_api):
+    decisions.evaluate(POLICY_ID, {"operation": "view"})["result"]["allow"] = False
+    first, second = decisions.evaluate_many(POLICY_ID, [{"operation": "view"}, {"operation": "view"}])
+    first["result"]["allow"] = False
+
+    assert second == {"result": {"allow": True}}
+    assert decisions.evaluate(POLICY_ID, {"operation": "view"}) == {"result": {"allow": True}}
+    assert policy_api.call_count == 1
@@ -17,6 +17,7 @@ def test_policy_create_api_policy_v1_compile(policy_api_server, policy_client: P
         correlation_id="text",
         user_agent="text",
         x_user_id="text",
+        file=b"text",
         data_partition_id="text",
     )
 
@@ -27,6 +28,7 @@ def test_policy_create_or_update_partition_policy(policy_api_server, policy_clie
         correlation_id="text",
         user_agent="text",
         x_user_id="text",
+        file=b"text",
         data_partition_id="text",
     )
 
@@ -55,6 +57,7 @@ def test_policy_evaluate_policy(policy_api_server, policy_client: PolicyClient):
         correlation_id="text",
         user_agent="text",
         x_user_id="text",
+        file=b"text",
         data_partition_id="text",
     )
 
@@ -178,6 +181,7 @@ def test_policy_validate_policy(policy_api_server, policy_client: PolicyClient):
         correlation_id="text",
         user_agent="text",
         x_user_id="text",
+        file=b"text",
         data_partition_id="text",
     )
 
@@ -3,131 +3,157 @@ from osdu_client.services.rafs.v1 import RAFSClient
 
 def test_rafs_create_or_update_cce_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_cce_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_compositionalanalysis_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_compositionalanalysis_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_coring_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_coring_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_cp_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_cp_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_cvdt_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_cvdt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_difflib_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_difflib_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_ep_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_ep_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_er_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_er_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_fri_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_fri_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_ft_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_ft_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_itt_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_itt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_mcmt_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_mcmt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_physchem_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_physchem_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_pvt_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_pvt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_rc_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_rc_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_rock_sample_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_rock_sample_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_rp_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_rp_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_sar_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_sar_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_stoat_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_stoat_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_stt_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_stt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_swellingtests_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_swellingtests_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_transporttest_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_transporttest_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_vlet_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_vlet_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_wat_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_wat_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_wgrp_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_or_update_wgrp_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_rock_sample_analysis_record(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.create_rock_sample_analysis_record(
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -1061,6 +1087,7 @@ def test_rafs_get_wgrp_source_data(rafs_api_server, rafs_client_v1: RAFSClient):
 
 def test_rafs_post_multistageseparatortests_records(rafs_api_server, rafs_client_v1: RAFSClient):
     rafs_client_v1.post_multistageseparatortests_records(
+        body=[{}],
         data_partition_id="text",
     )
 
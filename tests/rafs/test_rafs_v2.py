@@ -3,21 +3,25 @@ from osdu_client.services.rafs.v2 import RAFSClient
 
 def test_rafs_create_or_update_masterdata_records(rafs_api_server, rafs_client_v2: RAFSClient):
     rafs_client_v2.create_or_update_masterdata_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_pvt_records(rafs_api_server, rafs_client_v2: RAFSClient):
     rafs_client_v2.create_or_update_pvt_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_sa_records(rafs_api_server, rafs_client_v2: RAFSClient):
     rafs_client_v2.create_or_update_sa_records(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_rafs_create_or_update_sar_records(rafs_api_server, rafs_client_v2: RAFSClient):
     rafs_client_v2.create_or_update_sar_records(
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -0,0 +1,133 @@
+import json
+import re
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.schema.mirror import SchemaMirror, SchemaSyncResult
+from osdu_client.services.schema.record_validation import RecordValidator
+
+SCHEMA_URL = "https://base.url/api/schema-service/v1/schema"
+
+
+def schema_info(entity_type, version, status="PUBLISHED"):
+    major, minor, patch = version
+    schema_id = f"osdu:wks:{entity_type}:{major}.{minor}.{patch}"
+    identity = {
+        "authority": "osdu",
+        "source": "wks",
+        "entityType": entity_type,
+        "schemaVersionMajor": major,
+        "schemaVersionMinor": minor,
+        "schemaVersionPatch": patch,
+        "id": schema_id,
+    }
+    return {"schemaIdentity": identity, "status": status}
+
+
+class Registry:
+    def __init__(self, infos):
+        self.infos = infos
+
+    def search(self, request, context):
+        offset, limit = int(request.qs["offset"][0]), int(request.qs["limit"][0])
+        return {"schemaInfos": self.infos[offset:][:limit], "offset": offset, "totalCount": len(self.infos)}
+
+    def get(self, request, context):
+        return {"type": "object", "title": request.path.rsplit("/", 1)[-1]}
+
+
+@pytest.fixture
+def registry():
+    return Registry(
+        [schema_info("well", (1, 0, 0)), schema_info("well", (1, 2, 0)), schema_info("well", (1, 10, 0))]
+        + [schema_info("wellbore", (1, 0, 0)), schema_info("draft", (0, 1, 0), status="DEVELOPMENT")]
+    )
+
+
+@pytest.fixture
+def schema_api(registry):
+    with requests_mock.Mocker() as mocker:
+        mocker.get(SCHEMA_URL, json=registry.search)
+        mocker.get(re.compile(SCHEMA_URL + "/.+"), json=registry.get)
+        yield mocker
+
+
+@pytest.fixture
+def schema_mirror(auth_backend, schema_api, tmp_path):
+    return SchemaMirror(OSDUAPI.client("schema", auth_backend=auth_backend), str(tmp_path), page_size=2)
+
+
+def downloads(schema_api):
+    return sorted(
+        request.path.rsplit("/", 1)[-1] for request in schema_api.request_history if "/schema/" in request.path
+    )
+
+
+def test_initial_sync(schema_mirror, schema_api, tmp_path):
+    result = schema_mirror.sync()
+
+    assert len(result.added) == 5 and not result.updated and not result.removed
+    assert sorted(
+        request.qs["offset"][0] for request in schema_api.request_history if request.path.endswith("/schema")
+    ) == [
+        "0",
+        "2",
+        "4",
+    ]
+    assert len(downloads(schema_api)) == 5
+    assert schema_mirror.get("osdu:wks:wellbore:1.0.0") == {"type": "object", "title": "osdu:wks:wellbore:1.0.0"}
+    with open(tmp_path / "index.json") as file:
+        assert len(json.load(file)) == 5
+
+
+def test_incremental_sync(schema_mirror, schema_api, registry):
+    schema_mirror.sync()
+    schema_api.reset_mock()
+    registry.infos = [info for info in registry.infos if info["schemaIdentity"]["entityType"] != "wellbore"]
+    registry.infos[0]["status"] = "OBSOLETE"
+    registry.infos.append(schema_info("well", (2, 0, 0)))
+
+    result = schema_mirror.sync()
+
+    assert result == SchemaSyncResult(
+        added=["osdu:wks:well:2.0.0"],
+        updated=["osdu:wks:draft:0.1.0", "osdu:wks:well:1.0.0"],
+        removed=["osdu:wks:wellbore:1.0.0"],
+    )
+    assert downloads(schema_api) == ["osdu:wks:draft:0.1.0", "osdu:wks:well:1.0.0", "osdu:wks:well:2.0.0"]
+    assert "osdu:wks:wellbore:1.0.0" not in schema_mirror
+    assert schema_mirror.get("osdu:wks:wellbore:1.0.0") is None
+
+
+def test_lookups_from_disk(auth_backend, schema_mirror, schema_api, tmp_path):
+    schema_mirror.sync()
+    schema_api.reset_mock()
+
+    mirror = SchemaMirror(OSDUAPI.client("schema", auth_backend=auth_backend), str(tmp_path))
+
+    assert len(mirror) == 5
+    assert [info["schemaIdentity"]["id"] for info in mirror.find(entity_type="well")] == [
+        "osdu:wks:well:1.0.0",
+        "osdu:wks:well:1.2.0",
+        "osdu:wks:well:1.10.0",
+    ]
+    assert [info["schemaIdentity"]["id"] for info in mirror.find(authority="osdu", status="DEVELOPMENT")] == [
+        "osdu:wks:draft:0.1.0"
+    ]
+    assert mirror.latest("osdu", "wks", "well") == "osdu:wks:well:1.10.0"
+    assert mirror.latest("osdu", "wks", "unknown") is None
+    assert mirror.get_schema(id="osdu:wks:well:1.2.0") == {"type": "object", "title": "osdu:wks:well:1.2.0"}
+    assert schema_api.request_history == []
+
+
+def test_record_validator_uses_mirror(schema_mirror, schema_api):
+    schema_mirror.sync()
+    schema_api.reset_mock()
+
+    validator = RecordValidator(schema_mirror)
+
+    assert validator.validate({"kind": "osdu:wks:well:1.0.0"}) == []
+    assert validator.validate({"kind": "osdu:wks:unmirrored:1.0.0"}) == []
+    assert downloads(schema_api) == ["osdu:wks:unmirrored:1.0.0"]
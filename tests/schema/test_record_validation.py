@@ -0,0 +1,212 @@
+import re
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUClientError
+from osdu_client.services.schema import record_validation
+from osdu_client.services.schema.client import SchemaAPIError
+from osdu_client.services.schema.record_validation import RecordValidator, SchemaCompiler, ValidationIssue
+
+SCHEMA_URL = "https://base.url/api/schema-service/v1/schema"
+WELL_KIND = "osdu:wks:master-data--Well:1.0.0"
+ACL_ID = "osdu:wks:AbstractAccessControlList:1.0.0"
+SCHEMAS = {
+    WELL_KIND: {
+        "type": "object",
+        "required": ["kind", "acl", "data"],
+        "properties": {
+            "kind": {"type": "string", "pattern": "^[a-z]+:[a-z]+:.+:[0-9.]+$"},
+            "acl": {"$ref": ACL_ID},
+            "data": {
+                "type": "object",
+                "properties": {
+                    "FacilityName": {"type": "string", "maxLength": 10},
+                    "Depth": {"$ref": "#/definitions/Length"},
+                    "Status": {"enum": ["active", "closed"]},
+                },
+                "additionalProperties": False,
+            },
+        },
+        "definitions": {"Length": {"type": "number", "minimum": 0}},
+    },
+    ACL_ID: {
+        "type": "object",
+        "required": ["viewers", "owners"],
+        "properties": {
+            "viewers": {"type": "array", "minItems": 1, "items": {"type": "string"}},
+            "owners": {"type": "array", "minItems": 1, "items": {"type": "string"}},
+        },
+    },
+}
+ACL = {"viewers": ["data.viewers@osdu.example.com"], "owners": ["data.owners@osdu.example.com"]}
+
+
+def get_schema(request, context):
+    # requests_mock lower-cases the path
+    schemas = {schema_id.lower(): schema for schema_id, schema in SCHEMAS.items()}
+    schema_id = request.path.rsplit("/", 1)[-1]
+    if schema_id not in schemas:
+        context.status_code = 404
+        return {}
+    return schemas[schema_id]
+
+
+@pytest.fixture
+def schema_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(re.compile(SCHEMA_URL + "/.+"), json=get_schema)
+        mocker.get(
+            SCHEMA_URL,
+            json={"schemaInfos": [{"schemaIdentity": {"id": WELL_KIND}}], "offset": 0, "count": 1, "totalCount": 1},
+        )
+        yield mocker
+
+
+@pytest.fixture
+def record_validator(auth_backend, schema_api):
+    return RecordValidator(OSDUAPI.client("schema", auth_backend=auth_backend))
+
+
+def schema_requests(schema_api):
+    return [request.path.rsplit("/", 1)[-1] for request in schema_api.request_history]
+
+
+def test_compile_keywords():
+    validate = SchemaCompiler().compile(
+        {
+            "type": "object",
+            "properties": {
+                "count": {"type": "integer", "exclusiveMaximum": 3},
+                "tags": {"type": "array", "uniqueItems": True, "maxItems": 2},
+                "unit": {"if": {"const": "ft"}, "then": {"const": "ft"}, "else": {"enum": ["m", "km"]}},
+                "x-osdu-note": {"type": "string"},
+            },
+            "dependencies": {"unit": ["count"]},
+            "x-osdu-review-status": "Accepted",
+        }
+    )
+
+    assert validate({"count": 2.0, "tags": ["a", "b"], "unit": "ft"}) == []
+    assert validate({"tags": ["a", "a", "b"], "unit": "mi", "x-osdu-note": 1}) == [
+        ValidationIssue("/tags", "['a', 'a', 'b'] has non-unique elements"),
+        ValidationIssue("/tags", "['a', 'a', 'b'] is too long"),
+        ValidationIssue("/unit", "'mi' is not one of ['m', 'km']"),
+        ValidationIssue("/x-osdu-note", "1 is not of type 'string'"),
+        ValidationIssue("", "'count' is a dependency of 'unit'"),
+    ]
+    assert validate({"count": True}) == [ValidationIssue("/count", "True is not of type 'integer'")]
+
+
+def test_regexes_follow_ecma_262():
+    validate = SchemaCompiler().compile(
+        {
+            "type": "object",
+            "properties": {"code": {"type": "string", "pattern": "^\\d{2}$"}},
+            "patternProperties": {"^\\w+$": {"type": "string"}},
+            "additionalProperties": False,
+        }
+    )
+
+    assert validate({"code": "12", "name_1": "a"}) == []
+    # $ does not match before a trailing newline and \d, \w match ASCII characters only.
+    assert validate({"code": "12\n"}) == [ValidationIssue("/code", "'12\\n' does not match '^\\\\d{2}$'")]
+    assert validate({"code": "\u0661\u0662"}) == [
+        ValidationIssue("/code", "'\u0661\u0662' does not match '^\\\\d{2}$'")
+    ]
+    assert validate({"code": "12", "\u00e9": "a"}) == [
+        ValidationIssue("", "Additional properties are not allowed ('\u00e9' was unexpected)")
+    ]
+
+
+def test_invalid_schemas_are_rejected():
+    with pytest.raises(OSDUClientError, match="Schema is invalid"):
+        SchemaCompiler().compile({"type": "object", "properties": {"count": {"type": "int"}}})
+    with pytest.raises(OSDUClientError, match=f"Schema {ACL_ID} is invalid"):
+        SchemaCompiler({ACL_ID: {"type": ["string", 1]}}.__getitem__).compile({"$ref": ACL_ID})
+    with pytest.raises(OSDUClientError, match="without load_document"):
+        SchemaCompiler().compile({"properties": {"acl": {"$ref": ACL_ID}}})
+    with pytest.raises(OSDUClientError, match="Cannot resolve"):
+        SchemaCompiler().compile({"$ref": "#/definitions/Missing"})(1)
+
+
+def test_validation_extra_is_required(monkeypatch):
+    def import_module(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(record_validation, "import_module", import_module)
+
+    with pytest.raises(ImportError, match="validation extra"):
+        SchemaCompiler().compile({"type": "object"})
+
+
+def test_compile_recursive_ref():
+    validate = SchemaCompiler().compile(
+        {
+            "$ref": "#/definitions/Node",
+            "definitions": {
+                "Node": {"type": "object", "properties": {"children": {"items": {"$ref": "#/definitions/Node"}}}}
+            },
+        }
+    )
+
+    assert validate({"children": [{"children": []}]}) == []
+    assert validate({"children": [{"children": [1]}]}) == [
+        ValidationIssue("/children/0/children/0", "1 is not of type 'object'")
+    ]
+
+
+def test_validate(record_validator, schema_api):
+    record = {"kind": WELL_KIND, "acl": ACL, "data": {"FacilityName": "Well 1", "Depth": 10.5, "Status": "active"}}
+
+    assert record_validator.validate(record) == []
+    assert record_validator.validate(
+        {"kind": WELL_KIND, "acl": {"viewers": []}, "data": {"Depth": -1, "Other": 1}}
+    ) == [
+        ValidationIssue("/acl", "'owners' is a required property"),
+        ValidationIssue("/acl/viewers", "[] should be non-empty"),
+        ValidationIssue("/data/Depth", "-1 is less than the minimum of 0"),
+        ValidationIssue("/data", "Additional properties are not allowed ('Other' was unexpected)"),
+    ]
+    assert record_validator.validate({"data": {}}) == [ValidationIssue("/kind", "Record has no kind.")]
+    assert schema_requests(schema_api) == [WELL_KIND.lower(), ACL_ID.lower()]
+
+
+def test_validate_records(record_validator, schema_api):
+    records = [
+        {"kind": WELL_KIND, "acl": ACL, "data": {}},
+        {"kind": WELL_KIND, "acl": ACL, "data": {"FacilityName": "Very long facility name"}},
+        {"kind": WELL_KIND, "acl": ACL, "data": {"Status": "unknown"}},
+    ]
+
+    assert record_validator.validate_records(records) == {
+        1: [ValidationIssue("/data/FacilityName", "'Very long facility name' is too long")],
+        2: [ValidationIssue("/data/Status", "'unknown' is not one of ['active', 'closed']")],
+    }
+    assert schema_requests(schema_api) == [WELL_KIND.lower(), ACL_ID.lower()]
+
+
+def test_prefetch_searches_schemas(record_validator, schema_api):
+    assert record_validator.prefetch(authority="osdu", latest_version="true") == [WELL_KIND]
+    assert schema_api.request_history[0].qs == {
+        "authority": ["osdu"],
+        "latestversion": ["true"],
+        "limit": ["100"],
+        "offset": ["0"],
+    }
+
+
+def test_unknown_kind(record_validator, schema_api):
+    unknown = {"kind": "osdu:wks:unknown:1.0.0", "acl": ACL, "data": {}}
+    issue = ValidationIssue("/kind", "Kind osdu:wks:unknown:1.0.0 has no schema.")
+
+    assert record_validator.validate(unknown) == [issue]
+    assert record_validator.validate_records([{"kind": WELL_KIND, "acl": ACL, "data": {}}, unknown]) == {1: [issue]}
+
+
+def test_schema_errors_are_raised(record_validator, schema_api):
+    schema_api.get(re.compile(SCHEMA_URL + "/.+"), status_code=503, text="down")
+
+    with pytest.raises(SchemaAPIError):
+        record_validator.validate_records([{"kind": WELL_KIND}])
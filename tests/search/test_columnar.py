@@ -0,0 +1,60 @@
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.search.columnar import iter_column_batches, iter_structured_arrays, to_arrow_table
+
+CURSOR_URL = "https://base.url/api/search/v2/query_with_cursor"
+KIND = "osdu:wks:master-data--Wellbore:1.0.0"
+FIELDS = ["id", "data.FacilityName", "data.VerticalMeasurement.Value"]
+PAGES = [
+    {"cursor": "c1", "results": [
+        {"id": "w1", "data": {"FacilityName": "A", "VerticalMeasurement": {"Value": 10.5}}},
+        {"id": "w2", "data": {"FacilityName": "B"}},
+    ]},
+    {"cursor": None, "results": [{"id": "w3", "data": {"FacilityName": "C", "VerticalMeasurement": {"Value": 3}}}]},
+]
+
+
+@pytest.fixture
+def paged_search_client(auth_backend):
+    with requests_mock.Mocker() as mocker:
+        mocker.post(CURSOR_URL, [{"json": page} for page in PAGES])
+        yield OSDUAPI.client("search", auth_backend=auth_backend, validation=False), mocker
+
+
+def test_iter_column_batches(paged_search_client):
+    search_client, mocker = paged_search_client
+
+    batches = list(iter_column_batches(search_client, kind=KIND, returned_fields=FIELDS, batch_size=2))
+
+    assert batches == [
+        {"id": ["w1", "w2"], "data.FacilityName": ["A", "B"], "data.VerticalMeasurement.Value": [10.5, None]},
+        {"id": ["w3"], "data.FacilityName": ["C"], "data.VerticalMeasurement.Value": [3]},
+    ]
+    assert [r.json().get("cursor") for r in mocker.request_history] == [None, "c1"]
+    assert mocker.request_history[0].json()["returnedFields"] == FIELDS
+
+
+def test_to_arrow_table_promotes_batch_types(paged_search_client):
+    pa = pytest.importorskip("pyarrow")
+    search_client, _ = paged_search_client
+
+    table = to_arrow_table(search_client, kind=KIND, returned_fields=FIELDS, batch_size=2)
+
+    assert table.num_rows == 3
+    assert table.column("data.FacilityName").to_pylist() == ["A", "B", "C"]
+    assert table.schema.field("data.VerticalMeasurement.Value").type == pa.float64()
+
+
+def test_iter_structured_arrays(paged_search_client):
+    np = pytest.importorskip("numpy")
+    search_client, _ = paged_search_client
+
+    arrays = list(iter_structured_arrays(
+        search_client, kind=KIND, returned_fields=FIELDS, dtypes={"id": "U8", "data.VerticalMeasurement.Value": "f8"}
+    ))
+
+    assert arrays[0]["id"].tolist() == ["w1", "w2"]
+    assert np.isnan(arrays[0]["data.VerticalMeasurement.Value"][1])
+    assert arrays[1]["data.FacilityName"].tolist() == ["C"]
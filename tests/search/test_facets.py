@@ -0,0 +1,65 @@
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.search.facets import FacetCache, merge_aggregations, normalize_query
+
+QUERY_URL = "https://base.url/api/search/v2/query"
+BUCKETS = {
+    "osdu:wks:master-data--Well:1.0.0": [{"key": "NO", "count": 3}, {"key": "UK", "count": 1}],
+    "osdu:wks:master-data--Wellbore:1.0.0": [{"key": "UK", "count": 5}],
+}
+
+
+@pytest.fixture
+def api_server():
+    with requests_mock.Mocker() as mocker:
+        mocker.post(
+            QUERY_URL,
+            json=lambda request, context: {"results": [], "aggregations": BUCKETS[request.json()["kind"]]},
+        )
+        yield mocker
+
+
+@pytest.fixture
+def facet_cache(auth_backend, api_server):
+    return FacetCache(OSDUAPI.client("search", auth_backend=auth_backend, validation=False))
+
+
+def test_normalize_query():
+    assert normalize_query(kind=["b", "a"], query="  x   AND y ", offset=None) == normalize_query(
+        query="x AND y", kind=["a", "b"]
+    )
+
+
+def test_merge_aggregations():
+    assert merge_aggregations(*BUCKETS.values()) == [{"key": "UK", "count": 6}, {"key": "NO", "count": 3}]
+
+
+def test_aggregations_are_cached(facet_cache, api_server):
+    kind = "osdu:wks:master-data--Well:1.0.0"
+
+    first = facet_cache.facets(kind=kind, fields=["data.Country"], query="a  b")
+    second = facet_cache.aggregate(kind=kind, field="data.Country", query="a b")
+
+    assert first == {"data.Country": BUCKETS[kind]}
+    assert second == BUCKETS[kind]
+    assert api_server.call_count == 1
+    assert api_server.last_request.json() == {"kind": kind, "limit": 0, "query": "a  b", "aggregateBy": "data.Country"}
+
+
+def test_combined_merges_kinds(facet_cache, api_server):
+    combined = facet_cache.combined(kinds=list(BUCKETS), field="data.Country")
+
+    assert combined == [{"key": "UK", "count": 6}, {"key": "NO", "count": 3}]
+    facet_cache.combined(kinds=list(BUCKETS)[:1], field="data.Country")
+    assert api_server.call_count == 2
+
+
+def test_cached_aggregations_are_not_shared(facet_cache):
+    kind = "osdu:wks:master-data--Well:1.0.0"
+
+    facet_cache.aggregate(kind=kind, field="data.Country")[0]["count"] = 100
+    facet_cache.aggregate(kind=kind, field="data.Country").clear()
+
+    assert facet_cache.aggregate(kind=kind, field="data.Country") == BUCKETS[kind]
@@ -0,0 +1,141 @@
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUClientError
+from osdu_client.services.search.spatial import BoundingBox, SpatialTiler, clip_polygon
+
+QUERY_URL = "https://base.url/api/search/v2/query"
+CURSOR_URL = "https://base.url/api/search/v2/query_with_cursor"
+KIND = "osdu:wks:master-data--Wellbore:1.0.0"
+WELLS = [
+    {"id": "w1", "lat": 1.0, "lon": 1.0},
+    {"id": "w2", "lat": 1.5, "lon": 1.5},
+    {"id": "w3", "lat": 8.0, "lon": 8.0},
+    {"id": "border", "lat": 5.0, "lon": 5.0},
+    {"id": "east-of-antimeridian", "lat": 1.0, "lon": 179.0},
+    {"id": "west-of-antimeridian", "lat": 1.0, "lon": -179.0},
+]
+AREA = {"field": "data.SpatialLocation.Wgs84Coordinates", "byBoundingBox": BoundingBox(0, 0, 10, 10).to_filter()}
+PIPELINES = [
+    {"id": "inside", "box": BoundingBox(1, 1, 2, 2)},
+    {"id": "crossing", "box": BoundingBox(2, 4, 3, 6)},
+    {"id": "partly-outside", "box": BoundingBox(1, 9, 2, 11)},
+]
+SQUARE = [
+    {"latitude": 0, "longitude": 0},
+    {"latitude": 0, "longitude": 10},
+    {"latitude": 10, "longitude": 10},
+    {"latitude": 10, "longitude": 0},
+    {"latitude": 0, "longitude": 0},
+]
+
+
+def wells_in(request):
+    spatial_filter = request.json()["spatialFilter"]
+    if "byBoundingBox" not in spatial_filter:
+        return pipelines_in(spatial_filter)
+    box = BoundingBox.from_filter(spatial_filter["byBoundingBox"])
+
+    def in_longitudes(lon):
+        if box.west > box.east:
+            return lon >= box.west or lon <= box.east
+        return box.west <= lon <= box.east
+
+    return [{"id": w["id"]} for w in WELLS if box.south <= w["lat"] <= box.north and in_longitudes(w["lon"])]
+
+
+def pipelines_in(spatial_filter):
+    # Test polygons are rectangles, byGeoPolygon matches intersecting pipelines and byWithinPolygon contained ones.
+    if "byWithinPolygon" in spatial_filter:
+        area = BoundingBox.around(spatial_filter["byWithinPolygon"]["points"])
+        return [
+            {"id": p["id"]}
+            for p in PIPELINES
+            if area.south <= p["box"].south and p["box"].north <= area.north
+            and area.west <= p["box"].west and p["box"].east <= area.east
+        ]
+    area = BoundingBox.around(spatial_filter["byGeoPolygon"]["points"])
+    return [
+        {"id": p["id"]}
+        for p in PIPELINES
+        if p["box"].south <= area.north and area.south <= p["box"].north
+        and p["box"].west <= area.east and area.west <= p["box"].east
+    ]
+
+
+@pytest.fixture
+def search_client(auth_backend):
+    with requests_mock.Mocker() as mocker:
+        mocker.post(QUERY_URL, json=lambda request, context: {"totalCount": len(wells_in(request)), "results": []})
+        mocker.post(CURSOR_URL, json=lambda request, context: {"results": wells_in(request), "cursor": None})
+        yield OSDUAPI.client("search", auth_backend=auth_backend, validation=False)
+
+
+def test_plan_splits_dense_tiles(search_client):
+    tiles = SpatialTiler(search_client, max_results_per_tile=2).plan(kind=KIND, spatial_filter=AREA)
+
+    # "border" lies on the corner of all four quadrants of the first split.
+    assert sorted(tile.total_count for tile in tiles) == [1, 1, 1, 2, 2]
+    assert sorted(tile.depth for tile in tiles) == [1, 1, 1, 2, 2]
+
+
+def test_iter_results_deduplicates_border_hits(search_client):
+    tiler = SpatialTiler(search_client, max_results_per_tile=1, max_depth=1)
+
+    hits = list(tiler.iter_results(kind=KIND, spatial_filter=AREA))
+
+    assert sorted(hit["id"] for hit in hits) == ["border", "w1", "w2", "w3"]
+
+
+def test_within_polygon_keeps_records_crossing_tile_borders(search_client):
+    tiler = SpatialTiler(search_client, max_results_per_tile=1)
+    spatial_filter = {"field": "data.SpatialLocation.Wgs84Coordinates", "byWithinPolygon": {"points": SQUARE}}
+
+    tiles = tiler.plan(kind=KIND, spatial_filter=spatial_filter)
+    hits = list(tiler.iter_results(kind=KIND, spatial_filter=spatial_filter))
+
+    assert [(tile.depth, tile.total_count) for tile in tiles] == [(0, 2)]
+    assert sorted(hit["id"] for hit in hits) == ["crossing", "inside"]
+
+
+def test_geo_polygon_returns_records_crossing_tile_borders_once(search_client):
+    tiler = SpatialTiler(search_client, max_results_per_tile=1, max_depth=1)
+    spatial_filter = {"field": "data.SpatialLocation.Wgs84Coordinates", "byGeoPolygon": {"points": SQUARE}}
+
+    hits = list(tiler.iter_results(kind=KIND, spatial_filter=spatial_filter))
+
+    assert sorted(hit["id"] for hit in hits) == ["crossing", "inside", "partly-outside"]
+
+
+def test_antimeridian_box_is_split_at_antimeridian(search_client):
+    box = BoundingBox(0, 170, 10, -170)
+    spatial_filter = {"field": "data.SpatialLocation.Wgs84Coordinates", "byBoundingBox": box.to_filter()}
+
+    tiles = SpatialTiler(search_client, max_results_per_tile=1).plan(kind=KIND, spatial_filter=spatial_filter)
+
+    assert box.split() == [BoundingBox(0, 170, 10, 180), BoundingBox(0, -180, 10, -170)]
+    assert sorted((tile.box.west, tile.box.east, tile.total_count) for tile in tiles) == [
+        (-180, -170, 1),
+        (170, 180, 1),
+    ]
+
+
+def test_unsupported_filter(search_client):
+    with pytest.raises(OSDUClientError):
+        SpatialTiler(search_client).plan(kind=KIND, spatial_filter={"field": "f", "byDistance": {}})
+
+
+def test_clip_polygon_to_box():
+    triangle = [
+        {"latitude": 0, "longitude": 0},
+        {"latitude": 0, "longitude": 4},
+        {"latitude": 4, "longitude": 0},
+        {"latitude": 0, "longitude": 0},
+    ]
+
+    clipped = clip_polygon(triangle, BoundingBox(0, 0, 2, 2))
+
+    assert {(p["latitude"], p["longitude"]) for p in clipped} == {(0, 0), (0, 2), (2, 2), (2, 0)}
+    assert clipped[0] == clipped[-1]
+    assert clip_polygon(triangle, BoundingBox(5, 5, 6, 6)) == []
@@ -0,0 +1,167 @@
+import threading
+import time
+
+import pytest
+import requests
+import requests_mock
+from cryptography.exceptions import InvalidTag
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.secret import cache as secret_cache
+from osdu_client.services.secret.cache import SecretCache, is_unavailable
+from osdu_client.services.secret.client import SecretAPIError
+
+SECRET_URL = "https://base.url/api/secret/v1/secrets/db-password"
+SECRET = {"id": "db-password", "key": "db-password", "value": "s3cr3t", "enabled": True}
+
+
+@pytest.fixture
+def secret_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(SECRET_URL, json=SECRET)
+        yield mocker
+
+
+@pytest.fixture
+def secret_client(auth_backend, secret_api):
+    return OSDUAPI.client("secret", auth_backend=auth_backend)
+
+
+def test_is_unavailable():
+    assert is_unavailable(requests.ConnectionError())
+    assert is_unavailable(SecretAPIError("unavailable", 503))
+    assert is_unavailable(SecretAPIError("throttled", 429))
+    assert not is_unavailable(SecretAPIError("not found", 404))
+
+
+def test_secret_is_cached_encrypted(secret_client, secret_api):
+    cache = SecretCache(secret_client)
+
+    assert cache.get("db-password") == SECRET
+    assert cache.value("db-password") == "s3cr3t"
+    assert secret_api.call_count == 1
+    entry = cache._entries["db-password"]
+    assert b"s3cr3t" not in entry.ciphertext
+    assert "s3cr3t" not in repr(entry)
+
+
+def test_concurrent_fetches_share_request(secret_client, secret_api):
+    cache = SecretCache(secret_client)
+    release = threading.Event()
+
+    def slow_secret(request, context):
+        release.wait(1)
+        return SECRET
+
+    secret_api.get(SECRET_URL, json=slow_secret)
+    threads = [threading.Thread(target=cache.get, args=("db-password",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert secret_api.call_count == 1
+
+
+def test_refresh_ahead(secret_client, secret_api):
+    cache = SecretCache(secret_client, ttl=0.2, refresh_ahead=0.5)
+    cache.get("db-password")
+    time.sleep(0.12)
+    secret_api.get(SECRET_URL, json={**SECRET, "value": "rotated"})
+
+    assert cache.value("db-password") == "s3cr3t"
+    for _ in range(100):
+        if cache.value("db-password") == "rotated":
+            break
+        time.sleep(0.01)
+    assert cache.value("db-password") == "rotated"
+    assert secret_api.call_count == 2
+
+
+def test_last_known_value_when_unavailable(secret_client, secret_api):
+    cache = SecretCache(secret_client, ttl=0.01, max_stale=60)
+    cache.get("db-password")
+    time.sleep(0.02)
+    secret_api.get(SECRET_URL, status_code=503, text="unavailable")
+
+    assert cache.value("db-password") == "s3cr3t"
+
+    secret_api.get(SECRET_URL, status_code=404, text="not found")
+    with pytest.raises(SecretAPIError):
+        cache.get("db-password")
+
+
+def test_stale_value_is_not_used_past_max_stale(secret_client, secret_api):
+    cache = SecretCache(secret_client, ttl=0.01, max_stale=0.01)
+    cache.get("db-password")
+    time.sleep(0.03)
+    secret_api.get(SECRET_URL, exc=requests.ConnectionError)
+
+    with pytest.raises(requests.ConnectionError):
+        cache.get("db-password")
+
+
+def test_values_are_encrypted_with_aes_gcm(secret_client, secret_api):
+    cache = SecretCache(secret_client)
+
+    assert cache.get("db-password") == SECRET
+    entry = cache._entries["db-password"]
+    entry.ciphertext = bytes([entry.ciphertext[0] ^ 1]) + entry.ciphertext[1:]
+    with pytest.raises(InvalidTag):
+        cache.get("db-password")
+
+
+def test_cryptography_is_required(secret_client, monkeypatch):
+    def import_module(name):
+        raise ImportError(name)
+
+    monkeypatch.setattr(secret_cache, "import_module", import_module)
+
+    with pytest.raises(ImportError, match="encryption extra"):
+        SecretCache(secret_client)
+
+
+def test_invalidate_drops_fetch_in_progress(secret_client, secret_api):
+    cache = SecretCache(secret_client)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_secret(request, context):
+        started.set()
+        release.wait(1)
+        return SECRET
+
+    secret_api.get(SECRET_URL, json=slow_secret)
+    thread = threading.Thread(target=cache.get, args=("db-password",))
+    thread.start()
+    started.wait(1)
+    cache.invalidate("db-password")
+    release.set()
+    thread.join()
+    secret_api.get(SECRET_URL, json={**SECRET, "value": "rotated"})
+
+    assert cache.value("db-password") == "rotated"
+    assert secret_api.call_count == 2
+
+
+def test_invalidate_drops_background_refresh(secret_client, secret_api):
+    cache = SecretCache(secret_client, ttl=0.2, refresh_ahead=0.5)
+    cache.get("db-password")
+    time.sleep(0.12)
+    started, release = threading.Event(), threading.Event()
+
+    def slow_secret(request, context):
+        started.set()
+        release.wait(1)
+        return SECRET
+
+    secret_api.get(SECRET_URL, json=slow_secret)
+    cache.get("db-password")
+    started.wait(1)
+    cache.invalidate()
+    release.set()
+    for thread in threading.enumerate():
+        if thread.name == "osdu-secret-refresh":
+            thread.join()
+
+    assert "db-password" not in cache._entries
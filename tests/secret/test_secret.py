@@ -14,6 +14,7 @@ def test_secret_create_secrets(secret_api_server, secret_client: SecretClient):
 
 def test_secret_create_secrets_get(secret_api_server, secret_client: SecretClient):
     secret_client.create_secrets_get(
+        body=["text"],
         data_partition_id="text",
 
     )
@@ -0,0 +1,85 @@
+import json
+import re
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.storage.bulk_delete import PURGE, BulkDeleter
+from osdu_client.services.storage.client import StorageAPIError
+
+DELETE_URL = "https://base.url/api/storage/v2/records/delete"
+RECORDS_URL = "https://base.url/api/storage/v2/records/"
+RECORD_IDS = [f"osdu:well:{number}" for number in range(5)]
+
+
+@pytest.fixture
+def storage_api():
+    with requests_mock.Mocker() as mocker:
+        yield mocker
+
+
+@pytest.fixture
+def storage_client(auth_backend, storage_api):
+    return OSDUAPI.client("storage", auth_backend=auth_backend)
+
+
+def test_soft_delete_in_batches(storage_client, storage_api):
+    storage_api.post(
+        DELETE_URL,
+        [
+            {"status_code": 204},
+            {"status_code": 207, "json": [{"notDeletedRecordId": "osdu:well:3", "message": "not owner"}]},
+            {"status_code": 204},
+        ],
+    )
+
+    result = BulkDeleter(storage_client, batch_size=2, max_workers=1).run(RECORD_IDS, data_partition_id="opendes")
+
+    assert [request.json() for request in storage_api.request_history] == [
+        RECORD_IDS[:2],
+        RECORD_IDS[2:4],
+        RECORD_IDS[4:],
+    ]
+    assert storage_api.last_request.headers["data-partition-id"] == "opendes"
+    assert (result.position, result.deleted, result.failed) == (5, 4, {"osdu:well:3": "not owner"})
+
+
+def test_purge_treats_missing_records_as_deleted(storage_client, storage_api):
+    statuses = {"osdu:well:0": 204, "osdu:well:1": 404, "osdu:well:2": 403}
+
+    def purge(request, context):
+        context.status_code = statuses[request.path.rsplit("/", 1)[-1]]
+        return ""
+
+    storage_api.delete(re.compile(RECORDS_URL), text=purge)
+
+    result = BulkDeleter(storage_client, mode=PURGE, batch_size=2, rate_limit=100).run(RECORD_IDS[:3])
+
+    assert result.deleted == 2
+    assert list(result.failed) == ["osdu:well:2"]
+
+
+def test_purge_stops_on_server_errors(storage_client, storage_api):
+    storage_api.delete(re.compile(RECORDS_URL), [{"status_code": 204}, {"status_code": 503, "text": "down"}])
+
+    with pytest.raises(StorageAPIError):
+        BulkDeleter(storage_client, mode=PURGE, max_workers=1).run(RECORD_IDS[:3])
+    assert storage_api.call_count == 2
+
+
+def test_resume_from_checkpoint(storage_client, storage_api, tmp_path):
+    checkpoint_path = str(tmp_path / "checkpoint.json")
+    storage_api.post(DELETE_URL, [{"status_code": 204}, {"status_code": 204}, {"status_code": 503, "text": "down"}])
+    deleter = BulkDeleter(storage_client, batch_size=2, max_workers=1, checkpoint_path=checkpoint_path)
+
+    with pytest.raises(StorageAPIError):
+        deleter.run(RECORD_IDS)
+    with open(checkpoint_path) as file:
+        assert json.load(file) == {"mode": "delete", "position": 4, "deleted": 4, "failed": {}}
+
+    storage_api.post(DELETE_URL, status_code=204)
+    result = deleter.run(RECORD_IDS)
+
+    assert storage_api.last_request.json() == RECORD_IDS[4:]
+    assert (result.position, result.deleted) == (5, 5)
@@ -0,0 +1,132 @@
+import re
+import threading
+import time
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.services.storage.client import StorageAPIError
+from osdu_client.services.storage.history import REMOVE, REPLACE, Change, RecordHistoryLoader, diff_records
+
+RECORDS_URL = "https://base.url/api/storage/v2/records/"
+VERSIONS = {
+    "osdu:well:1": {
+        1: {"id": "osdu:well:1", "data": {"Name": "A", "Tags": ["x", "y"], "Depth": 10}},
+        2: {"id": "osdu:well:1", "data": {"Name": "B", "Tags": ["x", "z"], "Depth": 10}},
+        3: {"id": "osdu:well:1", "data": {"Name": "B", "Tags": ["x"]}},
+    },
+    "osdu:well:2": {7: {"id": "osdu:well:2", "data": {}}},
+}
+
+
+def record_versions(request, context):
+    record_id = request.path.rsplit("/", 1)[-1]
+    if record_id not in VERSIONS:
+        context.status_code = 404
+        return {}
+    return {"recordId": record_id, "versions": list(VERSIONS[record_id])}
+
+
+@pytest.fixture
+def history_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.get(re.compile(RECORDS_URL + "versions/"), json=record_versions)
+        mocker.get(
+            re.compile(RECORDS_URL + r"osdu:well:\d/\d+"),
+            json=lambda request, context: VERSIONS[request.path.split("/")[-2]][int(request.path.split("/")[-1])],
+        )
+        yield mocker
+
+
+@pytest.fixture
+def loader(auth_backend, history_api):
+    return RecordHistoryLoader(OSDUAPI.client("storage", auth_backend=auth_backend), max_workers=2)
+
+
+def test_diff_records():
+    old = {"data": {"Name": "A", "Tags": ["x", "y"], "Depth": 10}}
+    new = {"data": {"Name": "B", "Tags": ["x"]}, "acl": {}}
+
+    assert list(diff_records(old, new)) == [
+        Change(REPLACE, ("data", "Name"), "A", "B"),
+        Change(REPLACE, ("data", "Tags"), ["x", "y"], ["x"]),
+        Change(REMOVE, ("data", "Depth"), old=10),
+        Change("add", ("acl",), new={}),
+    ]
+
+
+def test_iter_diffs(loader):
+    diffs = list(loader.iter_diffs(["osdu:well:1", "osdu:well:2"]))
+
+    assert [(diff.from_version, diff.to_version) for diff in diffs] == [(1, 2), (2, 3)]
+    assert diffs[0].changes == [
+        Change(REPLACE, ("data", "Name"), "A", "B"),
+        Change(REPLACE, ("data", "Tags", 1), "y", "z"),
+    ]
+    assert diffs[1].changes == [
+        Change(REPLACE, ("data", "Tags"), ["x", "z"], ["x"]),
+        Change(REMOVE, ("data", "Depth"), old=10),
+    ]
+
+
+def test_versions_are_cached(loader, history_api):
+    list(loader.iter_histories(["osdu:well:1"]))
+    version_calls = history_api.call_count
+
+    histories = list(loader.iter_histories(["osdu:well:1"]))
+
+    assert sorted(histories[0].versions) == [1, 2, 3]
+    assert history_api.call_count == version_calls + 1
+    assert loader.versions(["osdu:well:2"]) == {"osdu:well:2": [7]}
+
+
+def test_versions_are_fetched_concurrently(loader):
+    # requests_mock sends one request at a time, so the barrier sits in front of it. The first two versions wait
+    # for each other, a sequential loader would break the barrier.
+    barrier = threading.Barrier(2, timeout=1)
+    get_record_version = loader.storage_client.get_record_version
+
+    def get_version(*, id, version, **kwargs):
+        if int(version) < 3:
+            barrier.wait()
+        return get_record_version(id=id, version=version, **kwargs)
+
+    loader.storage_client.get_record_version = get_version
+    histories = list(loader.iter_histories(["osdu:well:1"]))
+
+    assert histories[0].error is None
+    assert histories[0].versions == VERSIONS["osdu:well:1"]
+
+
+def test_failed_record_is_isolated(loader):
+    histories = {history.record_id: history for history in loader.iter_histories(["osdu:well:2", "missing"])}
+
+    assert histories["osdu:well:2"].error is None
+    assert isinstance(histories["missing"].error, StorageAPIError)
+    with pytest.raises(StorageAPIError):
+        list(loader.iter_diffs(["missing"]))
+
+
+def test_requests_share_max_workers(loader):
+    # Each record loads its versions concurrently too, still no more than max_workers requests run at once.
+    lock, running, peak = threading.Lock(), [0], [0]
+    get_record_version = loader.storage_client.get_record_version
+
+    def get_version(*, id, version, **kwargs):
+        with lock:
+            running[0] += 1
+            peak[0] = max(peak[0], running[0])
+        time.sleep(0.01)
+        try:
+            return get_record_version(id=id, version=version, **kwargs)
+        finally:
+            with lock:
+                running[0] -= 1
+
+    loader.storage_client.get_record_version = get_version
+    histories = {history.record_id: history for history in loader.iter_histories(["osdu:well:1", "osdu:well:2"])}
+
+    assert histories["osdu:well:1"].versions == VERSIONS["osdu:well:1"]
+    assert histories["osdu:well:2"].versions == VERSIONS["osdu:well:2"]
+    assert peak[0] == 2
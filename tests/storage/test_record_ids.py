@@ -0,0 +1,73 @@
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUClientError
+from osdu_client.services.storage.record_ids import (
+    RecordIdFile,
+    enumerate_kind_ids,
+    iter_record_id_pages,
+    write_record_id_file,
+)
+
+QUERY_URL = "https://base.url/api/storage/v2/query/records"
+KIND = "osdu:wks:master-data--Well:1.0.0"
+PAGES = {
+    None: {"results": ["osdu:well:3", "osdu:well:1"], "cursor": "c1"},
+    "c1": {"results": ["osdu:well:2", "osdu:well:1"], "cursor": "c2"},
+    "c2": {"results": ["osdu:well:10"], "cursor": None},
+}
+
+
+@pytest.fixture
+def paged_storage_client(auth_backend):
+    with requests_mock.Mocker() as mocker:
+        mocker.get(QUERY_URL, json=lambda request, context: PAGES[request.qs.get("cursor", [None])[0]])
+        yield OSDUAPI.client("storage", auth_backend=auth_backend)
+
+
+def test_iter_record_id_pages(paged_storage_client):
+    pages = list(iter_record_id_pages(paged_storage_client, kind=KIND, limit=2))
+
+    assert pages == [PAGES[None]["results"], PAGES["c1"]["results"], PAGES["c2"]["results"]]
+
+
+def test_enumerate_kind_ids(paged_storage_client, tmp_path):
+    with enumerate_kind_ids(paged_storage_client, str(tmp_path / "ids"), kind=KIND) as ids:
+        assert list(ids) == ["osdu:well:1", "osdu:well:10", "osdu:well:2", "osdu:well:3"]
+        assert ids[-1] == "osdu:well:3"
+        assert "osdu:well:10" in ids
+        assert "osdu:well:4" not in ids
+
+
+@pytest.mark.parametrize("run_size", [1, 3, 100])
+def test_write_record_id_file_merges_runs(tmp_path, run_size):
+    path = str(tmp_path / "ids")
+    record_ids = [f"osdu:wellbore:{number % 7}-ż" for number in range(20)]
+
+    count = write_record_id_file(path, record_ids, run_size=run_size)
+
+    with RecordIdFile(path) as ids:
+        assert count == len(ids) == 7
+        assert list(ids) == sorted(set(record_ids))
+
+
+def test_failed_write_removes_temporary_file(tmp_path):
+    with pytest.raises(UnicodeEncodeError):
+        write_record_id_file(str(tmp_path / "ids"), ["osdu:well:1", "osdu:well:\ud800"])
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_empty_and_invalid_files(tmp_path):
+    write_record_id_file(str(tmp_path / "empty"), [])
+    (tmp_path / "invalid").write_bytes(b"osdu:well:1")
+
+    with RecordIdFile(str(tmp_path / "empty")) as ids:
+        assert list(ids) == []
+        assert "osdu:well:1" not in ids
+    (tmp_path / "blank").write_bytes(b"")
+    with pytest.raises(OSDUClientError):
+        RecordIdFile(str(tmp_path / "invalid"))
+    with pytest.raises(OSDUClientError):
+        RecordIdFile(str(tmp_path / "blank"))
@@ -0,0 +1,77 @@
+import re
+from concurrent.futures import CancelledError
+
+import pytest
+import requests_mock
+
+from osdu_client.client import OSDUAPI
+from osdu_client.exceptions import OSDUReplayFailedError
+from osdu_client.services.storage.replay import ReplayJob, ReplayManager
+
+REPLAY_URL = "https://base.url/api/storage/v2/replay"
+WELL = "osdu:wks:master-data--Well:1.0.0"
+WELLBORE = "osdu:wks:master-data--Wellbore:1.0.0"
+
+
+def status(state, processed, total=4):
+    return {"json": {"overallState": state, "processedRecords": processed, "totalRecords": total}}
+
+
+@pytest.fixture
+def replay_api():
+    with requests_mock.Mocker() as mocker:
+        mocker.post(
+            REPLAY_URL,
+            json=lambda request, context: {"replayId": "1" if request.json()["filter"]["kinds"] == [WELL] else "2"},
+        )
+        mocker.get(
+            re.compile(REPLAY_URL + "/status/1"),
+            [status("IN_PROGRESS", 1), status("IN_PROGRESS", 3), status("COMPLETED", 4)],
+        )
+        mocker.get(re.compile(REPLAY_URL + "/status/2"), [status("IN_PROGRESS", 0), status("FAILED", 2)])
+        yield mocker
+
+
+def test_replays_are_polled_until_finished(auth_backend, replay_api):
+    storage_client = OSDUAPI.client("storage", auth_backend=auth_backend)
+
+    with ReplayManager(storage_client, min_interval=0.01, max_interval=0.05) as manager:
+        well, wellbore = manager.start(kinds=[WELL, WELLBORE])
+
+        assert manager.wait(timeout=5)
+        assert well.result()["overallState"] == "COMPLETED"
+        with pytest.raises(OSDUReplayFailedError) as error:
+            wellbore.result()
+        assert error.value.status["processedRecords"] == 2
+        assert manager.progress() == 6 / 8
+
+    launches = [request.json() for request in replay_api.request_history if request.method == "POST"]
+    assert sorted(launches, key=str) == [
+        {"operation": "reindex", "filter": {"kinds": [WELL]}},
+        {"operation": "reindex", "filter": {"kinds": [WELLBORE]}},
+    ]
+
+
+def test_close_cancels_unfinished_jobs(auth_backend, replay_api):
+    storage_client = OSDUAPI.client("storage", auth_backend=auth_backend)
+
+    with ReplayManager(storage_client, min_interval=60) as manager:
+        (job,) = manager.start(kinds=[WELL])
+
+    assert manager.wait(timeout=1)
+    with pytest.raises(CancelledError):
+        job.result()
+
+
+def test_interval_follows_progress():
+    manager = ReplayManager(storage_client=None, min_interval=1, max_interval=60)
+    job = ReplayJob("1", WELL, None, interval=1)
+    job._last_progress = (0.0, 0)
+
+    job.status = {"processedRecords": 100, "totalRecords": 1100}
+    assert manager._next_interval(job, 10.0) == 50
+
+    job.interval = 50
+    assert manager._next_interval(job, 20.0) == 60
+    job.interval = 4
+    assert manager._next_interval(job, 30.0) == 8
@@ -4,13 +4,14 @@ from osdu_client.services.storage.client import StorageClient
 def test_storage_create_records_delete(storage_api_server, storage_client: StorageClient):
     storage_client.create_records_delete(
         x_collaboration="text",
+        body=["text"],
         data_partition_id="text",
     )
 
 def test_storage_create_replay(storage_api_server, storage_client: StorageClient):
     storage_client.create_replay(
         operation="text",
-        filter=["text"],
+        filter={"kinds": ["text"]},
         data_partition_id="text",
     )
 
@@ -147,6 +148,7 @@ def test_storage_update_records(storage_api_server, storage_client: StorageClien
     storage_client.update_records(
         x_collaboration="text",
         skipdupes=False,
+        body=[{}],
         data_partition_id="text",
     )
 
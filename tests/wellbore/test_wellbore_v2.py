@@ -13,36 +13,43 @@ def test_wellbore_create_alpha_logs_sessions(wellbore_api_server, wellbore_clien
 
 def test_wellbore_create_or_update_dipset(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_dipset(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_logs(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_logs(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_logsets(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_logsets(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_marker(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_marker(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_trajectories(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_trajectories(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_well(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_well(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_wellbore_v2(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.create_or_update_wellbore_v2(
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -56,6 +63,7 @@ def test_wellbore_create_trajectory_data(wellbore_api_server, wellbore_client_v2
 def test_wellbore_define_dips_dipset(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.define_dips_dipset(
         dipsetid="text",
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -357,6 +365,7 @@ def test_wellbore_get_wellbores_versions(wellbore_api_server, wellbore_client_v2
 def test_wellbore_insert_dip_in_dipset(wellbore_api_server, wellbore_client_v2: WellboreClient):
     wellbore_client_v2.insert_dip_in_dipset(
         dipsetid="text",
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -452,6 +461,7 @@ def test_wellbore_upload_log_data(wellbore_api_server, wellbore_client_v2: Wellb
         logid="text",
         orient="text",
         bulk_path="text",
+        file=b"text",
         data_partition_id="text",
     )
 
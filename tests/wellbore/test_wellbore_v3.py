@@ -3,16 +3,19 @@ from osdu_client.services.wellbore.v3 import WellboreClient
 
 def test_wellbore_create_or_update_wellbore_interval_set(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_or_update_wellbore_interval_set(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_wellbore_v3(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_or_update_wellbore_v3(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_or_update_wells(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_or_update_wells(
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -36,11 +39,13 @@ def test_wellbore_create_query_wellbores_welllogs(wellbore_api_server, wellbore_
 
 def test_wellbore_create_wellbore_markerset(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_wellbore_markerset(
+        body=[{}],
         data_partition_id="text",
     )
 
 def test_wellbore_create_wellboretrajectories(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_wellboretrajectories(
+        body=[{}],
         data_partition_id="text",
     )
 
@@ -69,6 +74,7 @@ def test_wellbore_create_wellboretrajectories_sessions_data(wellbore_api_server,
 
 def test_wellbore_create_welllogs(wellbore_api_server, wellbore_client_v3: WellboreClient):
     wellbore_client_v3.create_welllogs(
+        body=[{}],
         data_partition_id="text",
     )
 